@@ -5,242 +5,448 @@ Executa análise completa com dados reais do Shopping Park Botucatu.
 
 Uso:
     python3 run_shopping_analysis.py [--formato texto|json] [--salvar] [--verbose]
+                                     [--cache-mode enabled|replay|disabled] [--no-cache] [--minimal]
+                                     [--strict-decimal]
 """
 import argparse
+import hashlib
+import io
+import json
+import pickle
 import sys
 import os
+from bisect import bisect_right
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 
-# Adicionar o diretório do projeto ao path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'shopping_analysis'))
-
-try:
-    from shopping_analysis.analyzers.kpi_analyzer import KPIAnalyzer
-    from shopping_analysis.analyzers.cashflow_analyzer import CashFlowAnalyzer
-    from shopping_analysis.analyzers.delinquency_analyzer import DelinquencyAnalyzer
-    from shopping_analysis.analyzers.trend_analyzer import TrendAnalyzer
-    from shopping_analysis.insights.insight_engine import InsightEngine
-    from shopping_analysis.reports.report_generator import ReportGenerator
-except ImportError as e:
-    print(f"❌ Erro de import: {e}")
-    print("💡 Certifique-se de que o Pydantic está instalado: pip3 install pydantic")
+from shopping_analysis.core.memo import MemoriaAnalises
+
+# Diretório do script; relatórios salvos vão para `relatorios/` ao lado dele
+_BASE = Path(__file__).resolve().parent
+_DIRETORIO_RELATORIOS = _BASE / 'relatorios'
+
+# Cache de resultados: incrementar a versão sempre que o formato de `resultados` mudar
+_CACHE_VERSAO = 1
+_CACHE_DIR = Path.home() / '.cache' / 'shopping_analysis'
+_CACHE_MODOS = ('enabled', 'replay', 'disabled')
+# Camada em memória (LRU): cada acerto devolve uma cópia profunda dos resultados
+_MAX_CACHE_MEMORIA = 8
+_cache_memoria = MemoriaAnalises(_MAX_CACHE_MEMORIA)
+
+# Textos fixos da saída do CLI
+_SEP = "=" * 80
+_SEP_SECAO = "=" * 50
+_BANNER = "\n".join((
+    _SEP,
+    "📊 SISTEMA DE ANÁLISE FINANCEIRA - SHOPPING PARK BOTUCATU",
+    _SEP,
+    "🏢 Análise Automática de Performance Financeira",
+    "🤖 Powered by Python + IA Insights",
+    "",
+))
+
+# Faixas do score final: abaixo de 30 crítico, abaixo de 60 atenção, abaixo de 80 bom
+_STATUS_LIMITES = (30, 60, 80)
+_STATUS_MENSAGENS = (
+    "🔴 STATUS: CRÍTICO - Intervenção imediata necessária",
+    "🟡 STATUS: ATENÇÃO - Monitoramento próximo requerido",
+    "🟢 STATUS: BOM - Algumas melhorias recomendadas",
+    "🌟 STATUS: EXCELENTE - Performance superior",
+)
+
+
+def _falha_importacao(erro):
+    """Informa dependência ausente e encerra"""
+    print(f"❌ Erro de import: {erro}")
+    print("💡 Certifique-se de que as dependências estão instaladas: pip3 install -r shopping_analysis/requirements.txt")
     sys.exit(1)
 
 
+def _importar_componentes():
+    """
+    Importa os analisadores e o motor de insights sob demanda.
+
+    Mantém `--help` e erros de argumento livres do custo de importar Pydantic e
+    NumPy. Só é chamada quando a análise é de fato executada (falta no cache).
+    """
+    try:
+        from shopping_analysis.analyzers.kpi_analyzer import KPIAnalyzer
+        from shopping_analysis.analyzers.cashflow_analyzer import CashFlowAnalyzer
+        from shopping_analysis.analyzers.delinquency_analyzer import DelinquencyAnalyzer
+        from shopping_analysis.analyzers.trend_analyzer import TrendAnalyzer
+        from shopping_analysis.insights.insight_engine import InsightEngine
+    except ImportError as e:
+        _falha_importacao(e)
+
+    return SimpleNamespace(
+        KPIAnalyzer=KPIAnalyzer,
+        CashFlowAnalyzer=CashFlowAnalyzer,
+        DelinquencyAnalyzer=DelinquencyAnalyzer,
+        TrendAnalyzer=TrendAnalyzer,
+        InsightEngine=InsightEngine,
+    )
+
+
+def _importar_report_generator():
+    """
+    Importa apenas o gerador de relatórios.
+
+    Em acertos de cache os analisadores e o NumPy não são importados; os modelos
+    Pydantic ainda são carregados, pois o relatório e os resultados os utilizam.
+    """
+    try:
+        from shopping_analysis.reports.report_generator import ReportGenerator
+    except ImportError as e:
+        _falha_importacao(e)
+
+    return ReportGenerator
+
+
+def _congelar_dados(valor):
+    """
+    Prepara os dados de entrada uma única vez na carga do módulo.
+
+    Valores float viram Decimal (mesma conversão `Decimal(str(v))` feita pelos
+    analisadores), dicts viram MappingProxyType e listas viram tuplas.
+    """
+    if isinstance(valor, dict):
+        return MappingProxyType({chave: _congelar_dados(v) for chave, v in valor.items()})
+    if isinstance(valor, list):
+        return tuple(_congelar_dados(v) for v in valor)
+    if isinstance(valor, float):
+        return Decimal(str(valor))
+    return valor
+
+
+# Dados reais do Shopping Park Botucatu fornecidos pelo usuário (somente leitura)
+_DADOS = _congelar_dados({
+    'shopping_center': 'Shopping Park Botucatu',
+    'periodo_referencia': 'Maio - Dezembro 2025',
+    
+    # KPIs Principais conforme fornecido
+    'kpis': {
+        'receita_total': 18860754.22,
+        'taxa_inadimplencia': 91.40,
+        'recebidos_atraso': 233.92,
+        'saldo_projetado_final': 4140012.46,
+        'despesa_total': 16004480.33,
+        'saldo_operacional': 2856273.89
+    },
+    
+    # Fluxo de Caixa Mensal (Mai-Dez 2025) conforme fornecido
+    'fluxo_caixa': [
+        {'mes': 'Maio', 'ano': 2025, 'credito': 288428.84, 'debito': 1676454.88, 'saldo_operacional': -1388026.04},
+        {'mes': 'Junho', 'ano': 2025, 'credito': 1606136.68, 'debito': 1414427.56, 'saldo_operacional': 191709.12},
+        {'mes': 'Julho', 'ano': 2025, 'credito': 1695919.31, 'debito': 1586876.16, 'saldo_operacional': 109043.15},
+        {'mes': 'Agosto', 'ano': 2025, 'credito': 1662847.77, 'debito': 1590080.64, 'saldo_operacional': 72767.13},
+        {'mes': 'Setembro', 'ano': 2025, 'credito': 1534454.15, 'debito': 1490250.60, 'saldo_operacional': 44203.55},
+        {'mes': 'Outubro', 'ano': 2025, 'credito': 1445980.01, 'debito': 1470783.04, 'saldo_operacional': -24803.03},
+        {'mes': 'Novembro', 'ano': 2025, 'credito': 1477342.79, 'debito': 1281994.13, 'saldo_operacional': 195348.66},
+        {'mes': 'Dezembro', 'ano': 2025, 'credito': 3862335.00, 'debito': 1289408.68, 'saldo_operacional': 2572926.32}
+    ],
+    
+    # Maiores Inadimplentes conforme fornecido
+    'inadimplentes': [
+        {'nome': 'Patroni Pizza', 'valor_divida': 58980.00, 'status': 'confissao_divida', 'dias_atraso': 75, 'categoria': 'Alimentação'},
+        {'nome': 'Claus Sport', 'valor_divida': 35000.00, 'status': 'confissao_divida', 'dias_atraso': 60, 'categoria': 'Vestuário Esportivo'},
+        {'nome': 'Aline Sobrino Boutique', 'valor_divida': 11666.67, 'status': 'confissao_divida', 'dias_atraso': 45, 'categoria': 'Moda Feminina'},
+        {'nome': 'Ivone Store', 'valor_divida': 2432.91, 'status': 'confissao_divida', 'dias_atraso': 30, 'categoria': 'Variedades'}
+    ]
+})
+
+
 def obter_dados_shopping_park_botucatu():
     """Retorna os dados reais do Shopping Park Botucatu fornecidos pelo usuário."""
-    return {
-        'shopping_center': 'Shopping Park Botucatu',
-        'periodo_referencia': 'Maio - Dezembro 2025',
-        
-        # KPIs Principais conforme fornecido
-        'kpis': {
-            'receita_total': 18860754.22,
-            'taxa_inadimplencia': 91.40,
-            'recebidos_atraso': 233.92,
-            'saldo_projetado_final': 4140012.46,
-            'despesa_total': 16004480.33,
-            'saldo_operacional': 2856273.89
-        },
-        
-        # Fluxo de Caixa Mensal (Mai-Dez 2025) conforme fornecido
-        'fluxo_caixa': [
-            {'mes': 'Maio', 'ano': 2025, 'credito': 288428.84, 'debito': 1676454.88, 'saldo_operacional': -1388026.04},
-            {'mes': 'Junho', 'ano': 2025, 'credito': 1606136.68, 'debito': 1414427.56, 'saldo_operacional': 191709.12},
-            {'mes': 'Julho', 'ano': 2025, 'credito': 1695919.31, 'debito': 1586876.16, 'saldo_operacional': 109043.15},
-            {'mes': 'Agosto', 'ano': 2025, 'credito': 1662847.77, 'debito': 1590080.64, 'saldo_operacional': 72767.13},
-            {'mes': 'Setembro', 'ano': 2025, 'credito': 1534454.15, 'debito': 1490250.60, 'saldo_operacional': 44203.55},
-            {'mes': 'Outubro', 'ano': 2025, 'credito': 1445980.01, 'debito': 1470783.04, 'saldo_operacional': -24803.03},
-            {'mes': 'Novembro', 'ano': 2025, 'credito': 1477342.79, 'debito': 1281994.13, 'saldo_operacional': 195348.66},
-            {'mes': 'Dezembro', 'ano': 2025, 'credito': 3862335.00, 'debito': 1289408.68, 'saldo_operacional': 2572926.32}
-        ],
-        
-        # Maiores Inadimplentes conforme fornecido
-        'inadimplentes': [
-            {'nome': 'Patroni Pizza', 'valor_divida': 58980.00, 'status': 'confissao_divida', 'dias_atraso': 75, 'categoria': 'Alimentação'},
-            {'nome': 'Claus Sport', 'valor_divida': 35000.00, 'status': 'confissao_divida', 'dias_atraso': 60, 'categoria': 'Vestuário Esportivo'},
-            {'nome': 'Aline Sobrino Boutique', 'valor_divida': 11666.67, 'status': 'confissao_divida', 'dias_atraso': 45, 'categoria': 'Moda Feminina'},
-            {'nome': 'Ivone Store', 'valor_divida': 2432.91, 'status': 'confissao_divida', 'dias_atraso': 30, 'categoria': 'Variedades'}
-        ]
-    }
-
-
-def executar_analise_completa(dados, verbose=False):
-    """Executa análise financeira completa usando todos os analisadores."""
+    return _DADOS
+
+
+def _emitir(buffer):
+    """Escreve a saída acumulada no stdout de uma só vez e esvazia o buffer."""
+    conteudo = buffer.getvalue()
+    if conteudo:
+        sys.stdout.write(conteudo)
+        buffer.seek(0)
+        buffer.truncate(0)
+
+
+def executar_analise_completa(dados, verbose=False, minimal=False, decimal_estrito=False):
+    """
+    Executa análise financeira completa usando todos os analisadores.
+
+    Com `minimal=True` a análise de tendências é omitida: ela só alimenta as
+    estatísticas finais do CLI, não os insights nem o relatório.
+    Com `decimal_estrito=True` a análise de inadimplência usa aritmética Decimal
+    em vez de float64.
+    """
     resultados = {}
+    componentes = _importar_componentes()
+    log = io.StringIO()  # saída verbose acumulada e emitida uma vez por etapa
     
     try:
         if verbose:
-            print("🚀 Iniciando análise financeira completa...")
-            print(f"📊 Shopping: {dados['shopping_center']}")
-            print(f"📅 Período: {dados['periodo_referencia']}")
-            print()
-        
-        # 1. Análise de KPIs
-        if verbose:
-            print("📈 Analisando KPIs financeiros...")
-        
-        kpi_analyzer = KPIAnalyzer()
-        analise_kpis = kpi_analyzer.analisar(dados['kpis'])
-        resultados['analise_kpis'] = analise_kpis
-        
-        if verbose:
-            score_saude = analise_kpis['score_saude_financeira']
-            kpis_criticos = len(analise_kpis['kpis_criticos'])
-            print(f"   ✅ Score de saúde: {score_saude}/100")
-            print(f"   ⚠️  KPIs críticos: {kpis_criticos}")
-            print()
-        
-        # 2. Análise de Fluxo de Caixa
-        if verbose:
-            print("💰 Analisando fluxo de caixa...")
-        
-        cashflow_analyzer = CashFlowAnalyzer()
-        analise_cashflow = cashflow_analyzer.analisar(dados['fluxo_caixa'])
-        resultados['analise_cashflow'] = analise_cashflow
-        
-        if verbose:
-            resumo = analise_cashflow['resumo_mensal']
-            meses_criticos = len(analise_cashflow['meses_criticos'])
-            print(f"   💵 Saldo consolidado: R$ {resumo['saldo_consolidado']:,.2f}")
-            print(f"   🚨 Meses críticos: {meses_criticos}")
-            print()
-        
-        # 3. Análise de Inadimplência
-        if verbose:
-            print("⚠️  Analisando inadimplência...")
+            print("🚀 Iniciando análise financeira completa...", file=log)
+            print(f"📊 Shopping: {dados['shopping_center']}", file=log)
+            print(f"📅 Período: {dados['periodo_referencia']}", file=log)
+            print(file=log)
+            _emitir(log)
         
-        delinquency_analyzer = DelinquencyAnalyzer()
-        receita_total = Decimal(str(dados['kpis']['receita_total']))
-        analise_inadimplencia = delinquency_analyzer.analisar(dados['inadimplentes'], receita_total)
-        resultados['analise_inadimplencia'] = analise_inadimplencia
-        
-        if verbose:
-            total_dividas = analise_inadimplencia['metricas_gerais']['valor_total_inadimplencia']
-            maior_devedor = analise_inadimplencia['ranking_por_valor'][0]
-            print(f"   💸 Total em dívidas: R$ {total_dividas:,.2f}")
-            print(f"   🎯 Maior devedor: {maior_devedor['nome']} (R$ {maior_devedor['valor_divida']:,.2f})")
-            print()
+        # 1-4. KPIs, fluxo de caixa, inadimplência e tendências são independentes entre si
+        receita_total = dados['kpis']['receita_total']
+        if not decimal_estrito:
+            receita_total = float(receita_total)
+        elif not isinstance(receita_total, Decimal):
+            receita_total = Decimal(str(receita_total))
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futuros = {
+                'analise_kpis': executor.submit(componentes.KPIAnalyzer().analisar, dados['kpis']),
+                'analise_cashflow': executor.submit(componentes.CashFlowAnalyzer().analisar, dados['fluxo_caixa']),
+                'analise_inadimplencia': executor.submit(
+                    componentes.DelinquencyAnalyzer(decimal_estrito=decimal_estrito).analisar,
+                    dados['inadimplentes'], receita_total
+                ),
+            }
+            if not minimal:
+                futuros['analise_tendencias'] = executor.submit(
+                    componentes.TrendAnalyzer().analisar, dados['fluxo_caixa'], 'fluxo_caixa'
+                )
+            for chave, futuro in futuros.items():
+                resultados[chave] = futuro.result()
         
-        # 4. Análise de Tendências
+        # Resumo de cada etapa, na ordem original, após todas terminarem
         if verbose:
-            print("📈 Analisando tendências temporais...")
-        
-        trend_analyzer = TrendAnalyzer()
-        analise_tendencias = trend_analyzer.analisar(dados['fluxo_caixa'], 'fluxo_caixa')
-        resultados['analise_tendencias'] = analise_tendencias
-        
-        if verbose:
-            tendencia_direcao = analise_tendencias['tendencia_geral']['direcao'].value
-            volatilidade_class = analise_tendencias['volatilidade']['classificacao']
-            print(f"   📊 Tendência geral: {tendencia_direcao}")
-            print(f"   ⚡ Volatilidade: {volatilidade_class}")
-            print()
+            sumario_kpis = resultados['analise_kpis']['sumario']
+            print("📈 Analisando KPIs financeiros...", file=log)
+            print(f"   ✅ Score de saúde: {sumario_kpis.score}/100", file=log)
+            print(f"   ⚠️  KPIs críticos: {sumario_kpis.n_criticos}", file=log)
+            print(file=log)
+            
+            sumario_cashflow = resultados['analise_cashflow']['sumario']
+            print("💰 Analisando fluxo de caixa...", file=log)
+            print(f"   💵 Saldo consolidado: R$ {sumario_cashflow.saldo_consolidado:,.2f}", file=log)
+            print(f"   🚨 Meses críticos: {sumario_cashflow.n_meses_criticos}", file=log)
+            print(file=log)
+            
+            sumario_inadimplencia = resultados['analise_inadimplencia']['sumario']
+            print("⚠️  Analisando inadimplência...", file=log)
+            print(f"   💸 Total em dívidas: R$ {sumario_inadimplencia.total_dividas:,.2f}", file=log)
+            print(f"   🎯 Maior devedor: {sumario_inadimplencia.maior_devedor} (R$ {sumario_inadimplencia.maior_divida:,.2f})", file=log)
+            print(file=log)
+            
+            if not minimal:
+                sumario_tendencias = resultados['analise_tendencias']['sumario']
+                print("📈 Analisando tendências temporais...", file=log)
+                print(f"   📊 Tendência geral: {sumario_tendencias.direcao.value}", file=log)
+                print(f"   ⚡ Volatilidade: {sumario_tendencias.volatilidade}", file=log)
+                print(file=log)
+            _emitir(log)
         
         # 5. Geração de Insights
         if verbose:
-            print("🧠 Gerando insights automáticos...")
+            print("🧠 Gerando insights automáticos...", file=log)
+            _emitir(log)
         
-        insight_engine = InsightEngine()
+        insight_engine = componentes.InsightEngine()
         insights = insight_engine.gerar_insights_completos(resultados)
         resultados['insights'] = insights
         
         if verbose:
-            insights_criticos = len([i for i in insights if i.prioridade.value == 'CRÍTICA'])
-            print(f"   💡 Total de insights: {len(insights)}")
-            print(f"   🔴 Insights críticos: {insights_criticos}")
-            print()
+            insights_criticos = insight_engine.contagem_prioridades['CRÍTICA']
+            print(f"   💡 Total de insights: {len(insights)}", file=log)
+            print(f"   🔴 Insights críticos: {insights_criticos}", file=log)
+            print(file=log)
         
         if verbose:
-            print("✅ Análise completa finalizada!")
-            print()
+            print("✅ Análise completa finalizada!", file=log)
+            print(file=log)
+            _emitir(log)
         
         return resultados
         
     except Exception as e:
+        _emitir(log)
         print(f"❌ Erro durante a análise: {str(e)}")
         raise
 
 
-def main():
-    """Função principal do script"""
-    # Configurar argumentos da linha de comando
-    parser = argparse.ArgumentParser(
-        description='Sistema de Análise Financeira - Shopping Park Botucatu',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+def _serializar_chave(obj):
+    """Converte tipos não-JSON dos dados de entrada para a chave de cache."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Tipo não suportado na chave de cache: {type(obj).__name__}")
+
+
+def _impressao_codigo():
+    """
+    Identifica a versão do código da análise (caminho, tamanho e mtime dos módulos).
+
+    Inclui este script, que também define o pipeline (dados congelados, --minimal,
+    --strict-decimal), além dos módulos do pacote.
+    """
+    script = Path(__file__).resolve()
+    arquivos = [script, *(_BASE / 'shopping_analysis').rglob('*.py')]
+    return sorted(
+        (str(arquivo.relative_to(_BASE)), estado.st_size, estado.st_mtime_ns)
+        for arquivo in arquivos
+        for estado in (arquivo.stat(),)
+    )
+
+
+def calcular_chave_cache(dados, **opcoes):
+    """Calcula a chave SHA256 que identifica uma execução da análise (dados + opções)."""
+    conteudo = json.dumps(
+        {'versao': _CACHE_VERSAO, 'codigo': _impressao_codigo(), 'opcoes': opcoes, 'dados': dados},
+        sort_keys=True, default=_serializar_chave
+    )
+    return hashlib.sha256(conteudo.encode('utf-8')).hexdigest()
+
+
+def executar_analise_com_cache(dados, verbose=False, modo_cache='enabled', **opcoes):
+    """
+    Executa a análise completa reaproveitando resultados de execuções anteriores.
+
+    Modos:
+        enabled:  lê do cache e grava novos resultados (padrão)
+        replay:   apenas lê do cache; falha se os resultados não estiverem disponíveis
+        disabled: ignora o cache e sempre recalcula
+
+    As `opcoes` (minimal, decimal_estrito) são repassadas a executar_analise_completa
+    e fazem parte da chave do cache.
+    """
+    if modo_cache == 'disabled':
+        return executar_analise_completa(dados, verbose=verbose, **opcoes)
+
+    chave = calcular_chave_cache(dados, **opcoes)
+    return _cache_memoria.obter(
+        chave, lambda: _carregar_ou_executar(chave, dados, verbose, modo_cache, opcoes)
+    )
+
+
+def _carregar_ou_executar(chave, dados, verbose, modo_cache, opcoes):
+    """Lê os resultados do cache em disco ou executa a análise e grava o arquivo"""
+    arquivo_cache = _CACHE_DIR / f"{chave}.pkl"
+    try:
+        with open(arquivo_cache, 'rb') as f:
+            resultados = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        resultados = None
+
+    if resultados is not None:
+        if verbose:
+            print(f"♻️  Resultados recuperados do cache ({chave[:12]})")
+            print()
+    elif modo_cache == 'replay':
+        raise RuntimeError(f"Resultados não encontrados no cache (modo replay): {arquivo_cache}")
+    else:
+        resultados = executar_analise_completa(dados, verbose=verbose, **opcoes)
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            arquivo_temp = arquivo_cache.with_suffix('.tmp')
+            with open(arquivo_temp, 'wb') as f:
+                pickle.dump(resultados, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(arquivo_temp, arquivo_cache)
+        except (OSError, pickle.PicklingError, TypeError) as e:
+            if verbose:
+                print(f"⚠️  Não foi possível gravar o cache: {e}")
+
+    return resultados
+
+
+_EPILOGO = """
 Exemplos de uso:
   python3 run_shopping_analysis.py                           # Análise básica
   python3 run_shopping_analysis.py --verbose                 # Com informações detalhadas
   python3 run_shopping_analysis.py --formato json --salvar  # Salvar em JSON
   python3 run_shopping_analysis.py --formato texto --salvar # Salvar em texto
-        """
+  python3 run_shopping_analysis.py --no-cache                # Recalcular sem usar cache
+  python3 run_shopping_analysis.py --formato json --salvar --minimal  # Apenas o arquivo JSON
+"""
+
+
+def _construir_parser():
+    """Constrói o parser de argumentos da linha de comando"""
+    parser = argparse.ArgumentParser(
+        description='Sistema de Análise Financeira - Shopping Park Botucatu',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOGO
     )
     
     parser.add_argument('--formato', choices=['texto', 'json'], default='texto', help='Formato do relatório final (padrão: texto)')
     parser.add_argument('--salvar', action='store_true', help='Salvar relatório em arquivo')
     parser.add_argument('--verbose', '-v', action='store_true', help='Exibir informações detalhadas durante a execução')
-    
-    args = parser.parse_args()
+    parser.add_argument('--cache-mode', choices=_CACHE_MODOS, default='enabled', help='Uso do cache de resultados (padrão: enabled)')
+    parser.add_argument('--no-cache', action='store_const', dest='cache_mode', const='disabled', help='Equivalente a --cache-mode disabled')
+    parser.add_argument('--minimal', action='store_true', help='Omitir análise de tendências, estatísticas finais e score (uso programático)')
+    parser.add_argument('--strict-decimal', action='store_true', help='Usar aritmética Decimal na análise de inadimplência (execuções regulatórias)')
+    return parser
+
+
+# Construído uma única vez; reutilizado em chamadas repetidas de main()
+_PARSER = _construir_parser()
+
+
+def main(argv=None):
+    """Função principal do script"""
+    args = _PARSER.parse_args(argv)
     
     try:
         # Banner inicial
-        print("=" * 80)
-        print("📊 SISTEMA DE ANÁLISE FINANCEIRA - SHOPPING PARK BOTUCATU")
-        print("=" * 80)
-        print("🏢 Análise Automática de Performance Financeira")
-        print("🤖 Powered by Python + IA Insights")
-        print()
+        print(_BANNER)
         
         # Obter dados do shopping
         dados = obter_dados_shopping_park_botucatu()
         
         # Executar análise completa
-        resultados = executar_analise_completa(dados, verbose=args.verbose)
+        resultados = executar_analise_com_cache(
+            dados, verbose=args.verbose, modo_cache=args.cache_mode,
+            minimal=args.minimal, decimal_estrito=args.strict_decimal
+        )
         
         # Gerar relatório final
         if args.verbose:
             print("📋 Gerando relatório executivo...")
         
-        report_generator = ReportGenerator()
+        ReportGenerator = _importar_report_generator()
+        report_generator = ReportGenerator(diretorio_saida=_DIRETORIO_RELATORIOS if args.salvar else None)
         relatorio_completo = report_generator.gerar_relatorio_completo(resultados, dados['shopping_center'])
         
-        # Exibir relatório
-        relatorio_texto = report_generator.gerar_relatorio_texto(relatorio_completo)
-        print(relatorio_texto)
+        # Exibir relatório (dispensado quando o destino é apenas o arquivo JSON)
+        if not (args.salvar and args.formato == 'json'):
+            sys.stdout.writelines(f"{linha}\n" for linha in report_generator.iter_relatorio_texto(relatorio_completo))
         
         # Salvar arquivo se solicitado
         if args.salvar:
             caminho_arquivo = report_generator.salvar_relatorio(relatorio_completo, formato=args.formato)
             print(f"\n💾 Relatório salvo em: {caminho_arquivo}")
         
-        # Estatísticas finais
-        print("\n" + "=" * 50)
-        print("📈 ESTATÍSTICAS DA ANÁLISE")
-        print("=" * 50)
-        print(f"KPIs analisados: {len(resultados['analise_kpis']['kpis_analisados'])}")
-        print(f"Meses de fluxo de caixa: {len(resultados['analise_cashflow']['movimentacoes_analisadas'])}")
-        print(f"Inadimplentes analisados: {len(resultados['analise_inadimplencia']['inadimplentes_analisados'])}")
-        print(f"Períodos de tendência: {resultados['analise_tendencias']['periodos_analisados']}")
-        print(f"Insights gerados: {len(resultados['insights'])}")
-        
-        # Score final
-        score_final = relatorio_completo.score_saude_financeira
-        if score_final:
-            print(f"\n🎯 SCORE FINAL DE SAÚDE FINANCEIRA: {score_final}/100")
+        # Estatísticas finais e score (omitidos em --minimal)
+        if not args.minimal:
+            print("\n".join((
+                "",
+                _SEP_SECAO,
+                "📈 ESTATÍSTICAS DA ANÁLISE",
+                _SEP_SECAO,
+                f"KPIs analisados: {relatorio_completo.n_kpis}",
+                f"Meses de fluxo de caixa: {relatorio_completo.n_meses}",
+                f"Inadimplentes analisados: {relatorio_completo.n_inadimplentes}",
+                f"Períodos de tendência: {relatorio_completo.n_periodos_tendencia}",
+                f"Insights gerados: {relatorio_completo.n_insights}",
+            )))
             
-            if score_final < 30:
-                print("🔴 STATUS: CRÍTICO - Intervenção imediata necessária")
-            elif score_final < 60:
-                print("🟡 STATUS: ATENÇÃO - Monitoramento próximo requerido") 
-            elif score_final < 80:
-                print("🟢 STATUS: BOM - Algumas melhorias recomendadas")
-            else:
-                print("🌟 STATUS: EXCELENTE - Performance superior")
+            # Score final
+            score_final = relatorio_completo.score_saude_financeira
+            if score_final is not None:
+                print(f"\n🎯 SCORE FINAL DE SAÚDE FINANCEIRA: {score_final}/100\n"
+                      f"{_STATUS_MENSAGENS[bisect_right(_STATUS_LIMITES, score_final)]}")
         
         print("\n✅ Análise concluída com sucesso!")
         
     except KeyboardInterrupt:
+        sys.stdout.flush()
         print("\n\n⚠️  Análise interrompida pelo usuário.")
         sys.exit(1)
     except Exception as e:
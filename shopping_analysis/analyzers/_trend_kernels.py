@@ -0,0 +1,184 @@
+"""
+Kernels numéricos vetorizados (NumPy) usados pelo TrendAnalyzer.
+Operam sobre arrays float64 e retornam floats Python (vetores nas versões em lote); a conversão para Decimal fica no analisador.
+"""
+from functools import lru_cache
+from typing import Dict, NamedTuple, Tuple
+
+import numpy as np
+
+
+class EstatisticasTendencia(NamedTuple):
+    """Estatísticas de uma série temporal com regressão linear em x = 1..n"""
+    media: float
+    desvio_padrao: float
+    inclinacao: float
+    intercepto: float
+    r_squared: float
+
+
+@lru_cache(maxsize=64)
+def desvios_periodos(n: int) -> Tuple[float, float, np.ndarray]:
+    """
+    Média, soma dos quadrados dos desvios e desvios de x = 1..n em relação à média.
+
+    A soma usa a forma fechada n(n² - 1)/12; o array devolvido é somente leitura,
+    pois é compartilhado entre as chamadas com o mesmo n.
+    """
+    x_medio = (n + 1) / 2
+    desvios_x = np.arange(1, n + 1, dtype=np.float64) - x_medio
+    desvios_x.setflags(write=False)
+    return x_medio, n * (n * n - 1) / 12, desvios_x
+
+
+def para_vetor(valores) -> np.ndarray:
+    """Converte uma sequência de valores numéricos (Decimal, float, int) em array float64"""
+    return np.fromiter((float(v) for v in valores), dtype=np.float64)
+
+
+def estatisticas_tendencia(valores: np.ndarray) -> EstatisticasTendencia:
+    """
+    Calcula média, desvio padrão populacional e a regressão linear simples da série.
+
+    Args:
+        valores: Array float64 com ao menos um elemento
+
+    Returns:
+        EstatisticasTendencia com inclinação, intercepto e R² (0 quando indefinidos)
+    """
+    n = valores.shape[0]
+    media = float(valores.mean())
+    desvios_y = valores - media
+    ss_tot = float(desvios_y @ desvios_y)
+
+    x_medio, denominador, desvios_x = desvios_periodos(n)
+    sxy = float(desvios_x @ desvios_y)
+    inclinacao = sxy / denominador if denominador != 0 else 0.0
+    intercepto = media - inclinacao * x_medio
+
+    # Soma dos quadrados dos resíduos em forma fechada (sem montar o vetor de resíduos)
+    ss_res = max(ss_tot - inclinacao * sxy, 0.0)
+    r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0.0
+
+    return EstatisticasTendencia(
+        media=media,
+        desvio_padrao=float(np.sqrt(ss_tot / n)),
+        inclinacao=inclinacao,
+        intercepto=intercepto,
+        r_squared=r_squared,
+    )
+
+
+def variacoes_relativas(valores: np.ndarray) -> np.ndarray:
+    """
+    Variações relativas período a período, (v[i] - v[i-1]) / v[i-1].
+
+    Períodos cujo valor anterior é zero são descartados.
+    """
+    anteriores = valores[:-1]
+    validos = anteriores != 0
+    return (valores[1:][validos] - anteriores[validos]) / anteriores[validos]
+
+
+def correlacao_lag1(valores: np.ndarray) -> float:
+    """
+    Correlação de Pearson entre a série e ela mesma defasada de um período.
+
+    Args:
+        valores: Array float64 com ao menos dois elementos
+
+    Returns:
+        Correlação em [-1, 1] (0 quando alguma das variâncias é nula)
+    """
+    desvios_atual = valores[1:] - valores[1:].mean()
+    desvios_anterior = valores[:-1] - valores[:-1].mean()
+
+    numerador = float(desvios_atual @ desvios_anterior)
+    denominador_atual = float(desvios_atual @ desvios_atual)
+    denominador_anterior = float(desvios_anterior @ desvios_anterior)
+    if denominador_atual == 0 or denominador_anterior == 0:
+        return 0.0
+    return numerador / float(np.sqrt(denominador_atual * denominador_anterior))
+
+
+def extremos_locais(valores: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Índices dos máximos e mínimos locais estritos (comparados aos dois vizinhos).
+
+    Returns:
+        Tupla (índices dos máximos, índices dos mínimos) na série original
+    """
+    anterior, centro, seguinte = valores[:-2], valores[1:-1], valores[2:]
+    maximos = np.flatnonzero((centro > anterior) & (centro > seguinte)) + 1
+    minimos = np.flatnonzero((centro < anterior) & (centro < seguinte)) + 1
+    return maximos, minimos
+
+
+def candidatos_mudanca_brusca(valores: np.ndarray, limite_percentual: float) -> np.ndarray:
+    """
+    Índices i (>= 1) cuja variação |v[i] - v[i-1]| / |v[i-1]| * 100 pode superar o limite.
+
+    A seleção usa uma pequena margem abaixo do limite para tolerar o arredondamento
+    do float64; o chamador confirma cada candidato com o valor exato.
+    """
+    anteriores = valores[:-1]
+    validos = anteriores != 0
+    variacoes = np.zeros(anteriores.shape[0], dtype=np.float64)
+    np.divide(valores[1:] - anteriores, anteriores, out=variacoes, where=validos)
+    return np.flatnonzero(validos & (np.abs(variacoes) * 100 > limite_percentual * (1 - 1e-9))) + 1
+
+
+def estatisticas_tendencia_lote(matriz: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Estatísticas de tendência de várias séries de mesmo tamanho, vetorizadas sobre o eixo do lote.
+
+    Usa as mesmas fórmulas de estatisticas_tendencia, variacoes_relativas e correlacao_lag1.
+
+    Args:
+        matriz: Matriz (K, n) float64 com uma série por linha, n >= 2
+
+    Returns:
+        Dict de vetores de tamanho K; volatilidade_media é NaN quando todos os
+        valores anteriores da série são zero
+    """
+    n = matriz.shape[1]
+    x_medio, denominador, desvios_x = desvios_periodos(n)
+
+    media = matriz.mean(axis=1)
+    desvios_y = matriz - media[:, None]
+    ss_tot = np.einsum('ij,ij->i', desvios_y, desvios_y)
+    sxy = desvios_y @ desvios_x
+    inclinacao = sxy / denominador
+    ss_res = np.maximum(ss_tot - inclinacao * sxy, 0.0)
+    # R² = 1 - ss_res/ss_tot, zero quando a série é constante
+    r_squared = 1 - np.divide(ss_res, ss_tot, out=np.ones_like(ss_tot), where=ss_tot != 0)
+
+    # Variações relativas, ignorando períodos com valor anterior zero
+    anteriores = matriz[:, :-1]
+    validos = anteriores != 0
+    variacoes = np.zeros_like(anteriores)
+    np.divide(matriz[:, 1:] - anteriores, anteriores, out=variacoes, where=validos)
+    n_validos = validos.sum(axis=1)
+    volatilidade_media = np.full(matriz.shape[0], np.nan)
+    np.divide(np.abs(variacoes).sum(axis=1), n_validos, out=volatilidade_media, where=n_validos > 0)
+
+    # Correlação lag-1 (zero quando alguma das variâncias é nula)
+    desvios_atual = matriz[:, 1:] - matriz[:, 1:].mean(axis=1, keepdims=True)
+    desvios_anterior = anteriores - anteriores.mean(axis=1, keepdims=True)
+    produto_variancias = (
+        np.einsum('ij,ij->i', desvios_atual, desvios_atual)
+        * np.einsum('ij,ij->i', desvios_anterior, desvios_anterior)
+    )
+    correlacao = np.zeros_like(produto_variancias)
+    np.divide(np.einsum('ij,ij->i', desvios_atual, desvios_anterior), np.sqrt(produto_variancias),
+              out=correlacao, where=produto_variancias != 0)
+
+    return {
+        'media': media,
+        'desvio_padrao': np.sqrt(ss_tot / n),
+        'inclinacao': inclinacao,
+        'intercepto': media - inclinacao * x_medio,
+        'r_squared': r_squared,
+        'volatilidade_media': volatilidade_media,
+        'correlacao_lag1': correlacao,
+    }
@@ -2,27 +2,117 @@
 Analisador de Fluxo de Caixa para Shopping Centers.
 Análise temporal dos dados de Mai-Dez 2025 do Shopping Park Botucatu.
 """
+from bisect import bisect_right
 from decimal import Decimal
 from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime
-import statistics
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from .kpi_analyzer import BaseAnalyzer
 from ..core.models import MovimentacaoFinanceira, TendenciaFinanceira, ConfiguracaoAnalise
-from ..core.enums import TrendDirection, StatusKPI, InsightType, InsightPriority
+from ..core.enums import TrendDirection
 from ..core.exceptions import CalculationError, InsufficientDataError
-from ..formatters.brazilian import BrazilianFormatter
+from ..core.money import arredondar_centavos, float_para_decimal
+from ..core.summaries import CashflowSummary
+
+
+def _media_desvio_amostral(valores: np.ndarray) -> Tuple[float, float]:
+    """
+    Média e desvio padrão amostral em duas passagens (numericamente estável).
+
+    Evita a fórmula ingênua E[x²] - E[x]², que perde precisão com saldos grandes e próximos.
+    """
+    media = float(valores.mean())
+    if valores.size < 2:
+        return media, 0.0
+    desvios = valores - media
+    return media, float(np.sqrt((desvios @ desvios) / (valores.size - 1)))
+
+
+_Q2 = Decimal('0.01')
+_Q1 = Decimal('0.1')
+_CEM = Decimal('100')
+
+# Direção da tendência por faixa de inclinação: 0 = |slope| < 0.1, 1 = positiva, 2 = negativa
+_DIRECOES_TENDENCIA = (TrendDirection.ESTAVEL, TrendDirection.CRESCIMENTO, TrendDirection.DECLINIO)
+
+# Prazo de ação por faixa de score de risco (limites inferiores de cada faixa)
+_PRAZO_LIMITES = (40, 70)
+_PRAZO_ACAO = ("Monitoramento (15-30 dias)", "Ação prioritária (7-15 dias)", "Ação imediata (0-7 dias)")
+
+# Critérios de mês crítico, na ordem das linhas de _pontuar_meses_criticos
+_PROBLEMAS_CRITICIDADE = (
+    "Saldo operacional negativo",
+    "Débitos muito superiores aos créditos",
+    "Créditos muito abaixo da média",
+)
+_PESOS_CRITICIDADE = np.array([50, 30, 20], dtype=np.int32)
+
+
+def _pontuar_meses_criticos(fluxo: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Avalia os critérios de criticidade de todos os meses em uma passagem vetorizada.
+
+    Returns:
+        Matriz booleana (3, n) com os critérios atendidos e o vetor int32 de scores por mês
+    """
+    creditos, debitos, saldos = fluxo
+    # Limite de créditos baixos calculado uma única vez para todos os meses
+    limite_creditos_baixos = float(creditos.mean()) * 0.5
+    criterios = np.stack((
+        saldos < 0,
+        debitos > creditos * 1.5,
+        creditos < limite_creditos_baixos,
+    ))
+    return criterios, _PESOS_CRITICIDADE @ criterios
+
+
+def _estatisticas_lote(saldos: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Estatísticas do saldo por cenário, vetorizadas sobre o eixo do lote.
+
+    Args:
+        saldos: Matriz (B, n) float64 com um cenário por linha, meses em ordem
+
+    Returns:
+        Dict de vetores de tamanho B
+    """
+    n = saldos.shape[1]
+    desvios_x = np.arange(n, dtype=np.float64) - (n - 1) / 2
+    return {
+        'inclinacao': (saldos @ desvios_x) / (desvios_x @ desvios_x),
+        'media': saldos.mean(axis=1),
+        'desvio_padrao': saldos.std(axis=1, ddof=1),
+        'meses_positivos': (saldos > 0).sum(axis=1),
+        'meses_negativos': (saldos < 0).sum(axis=1),
+        'indice_pior_mes': saldos.argmin(axis=1),
+        'indice_melhor_mes': saldos.argmax(axis=1),
+    }
 
 
 class CashFlowAnalyzer(BaseAnalyzer):
     """Analisador especializado em fluxo de caixa temporal"""
     
+    _EMOJI_DIRECAO = {
+        TrendDirection.CRESCIMENTO: "📈",
+        TrendDirection.DECLINIO: "📉",
+        TrendDirection.ESTAVEL: "➡️",
+    }
+    
     def __init__(self, configuracao: Optional[ConfiguracaoAnalise] = None):
         super().__init__(configuracao)
         self.meses_ordem = [
             'janeiro', 'fevereiro', 'março', 'abril', 'maio', 'junho',
             'julho', 'agosto', 'setembro', 'outubro', 'novembro', 'dezembro'
         ]
+        # Índice do mês por nome (completo ou abreviado), consultado em O(1)
+        self._indice_mes = {
+            'mai': 4, 'jun': 5, 'jul': 6, 'ago': 7,
+            'set': 8, 'out': 9, 'nov': 10, 'dez': 11
+        }
+        self._indice_mes.update((nome, indice) for indice, nome in enumerate(self.meses_ordem))
     
     def analisar(self, movimentacoes: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -40,19 +130,21 @@ class CashFlowAnalyzer(BaseAnalyzer):
             
             # Converter para objetos MovimentacaoFinanceira
             movimentacoes_obj = self._converter_movimentacoes(movimentacoes)
+            centavos = self._montar_matriz_centavos(movimentacoes_obj)
+            fluxo = centavos / 100  # reais em float64, usados nas estatísticas
             
             # Análises principais
-            resumo_mensal = self._analisar_resumo_mensal(movimentacoes_obj)
-            tendencias = self._analisar_tendencias(movimentacoes_obj)
-            meses_criticos = self._identificar_meses_criticos(movimentacoes_obj)
-            sazonalidade = self._analisar_sazonalidade(movimentacoes_obj)
-            projecoes = self._gerar_projecoes(movimentacoes_obj)
+            resumo_mensal = self._analisar_resumo_mensal(movimentacoes_obj, centavos, fluxo)
+            tendencias = self._analisar_tendencias(fluxo)
+            meses_criticos = self._identificar_meses_criticos(movimentacoes_obj, centavos)
+            sazonalidade = self._analisar_sazonalidade(movimentacoes_obj, centavos)
+            projecoes = self._gerar_projecoes(centavos, tendencias[2])
             
             # Métricas consolidadas
-            metricas_gerais = self._calcular_metricas_gerais(movimentacoes_obj)
+            metricas_gerais = self._calcular_metricas_gerais(centavos)
             
             # Alertas e recomendações
-            alertas = self._gerar_alertas_cashflow(movimentacoes_obj, meses_criticos)
+            alertas = self._gerar_alertas_cashflow(meses_criticos, fluxo)
             recomendacoes = self._gerar_recomendacoes_cashflow(tendencias, meses_criticos)
             
             return {
@@ -66,14 +158,53 @@ class CashFlowAnalyzer(BaseAnalyzer):
                 'alertas': alertas,
                 'recomendacoes': recomendacoes,
                 'data_analise': datetime.now(),
-                'periodo_analisado': f"{movimentacoes_obj[0].periodo_completo} - {movimentacoes_obj[-1].periodo_completo}"
+                'periodo_analisado': f"{movimentacoes_obj[0].periodo_completo} - {movimentacoes_obj[-1].periodo_completo}",
+                'sumario': CashflowSummary(
+                    saldo_consolidado=resumo_mensal['saldo_consolidado'],
+                    n_meses_criticos=len(meses_criticos)
+                )
             }
             
         except Exception as e:
             raise CalculationError("analise_cashflow", str(e)) from e
     
+    def analisar_lote(self, cenarios: List[List[Dict[str, Any]]]) -> Dict[str, np.ndarray]:
+        """
+        Calcula estatísticas do saldo operacional de vários cenários em uma única passagem.
+
+        Voltado a simulações (what-if, backtesting) que repetem a análise muitas vezes;
+        não gera tendências, alertas nem recomendações.
+        
+        Args:
+            cenarios: Lista de cenários, cada um com as movimentações mensais de um mesmo número de meses
+            
+        Returns:
+            Dict com vetores (um valor por cenário): inclinacao, media, desvio_padrao,
+            meses_positivos, meses_negativos, indice_pior_mes e indice_melhor_mes
+        """
+        try:
+            tamanho = min((len(cenario) for cenario in cenarios), default=0)
+            if tamanho < 2:
+                raise InsufficientDataError("analise_cashflow_lote", 2, tamanho)
+            if any(len(cenario) != tamanho for cenario in cenarios):
+                raise ValueError("Todos os cenários devem ter o mesmo número de meses")
+            
+            saldos = np.stack([
+                self._montar_matriz_centavos(self._converter_movimentacoes(cenario))[2]
+                for cenario in cenarios
+            ]) / 100
+            return _estatisticas_lote(saldos)
+            
+        except Exception as e:
+            raise CalculationError("analise_cashflow_lote", str(e)) from e
+    
     def _converter_movimentacoes(self, movimentacoes: List[Dict[str, Any]]) -> List[MovimentacaoFinanceira]:
-        """Converte dados brutos em objetos MovimentacaoFinanceira"""
+        """
+        Converte dados brutos em objetos MovimentacaoFinanceira.
+
+        Valores com frações abaixo do centavo são arredondados a centavos (ROUND_HALF_EVEN)
+        já nos modelos, que assim coincidem com a matriz em centavos usada nos cálculos.
+        """
         movimentacoes_obj = []
         
         for mov in movimentacoes:
@@ -81,9 +212,9 @@ class CashFlowAnalyzer(BaseAnalyzer):
                 obj = MovimentacaoFinanceira(
                     mes=mov['mes'],
                     ano=mov.get('ano', 2025),
-                    credito=Decimal(str(mov['credito'])),
-                    debito=abs(Decimal(str(mov['debito']))),  # Garantir que débito seja positivo
-                    saldo_operacional=Decimal(str(mov['saldo_operacional']))
+                    credito=arredondar_centavos(self._como_decimal(mov['credito'])),
+                    debito=arredondar_centavos(abs(self._como_decimal(mov['debito']))),  # Garantir que débito seja positivo
+                    saldo_operacional=arredondar_centavos(self._como_decimal(mov['saldo_operacional']))
                 )
                 movimentacoes_obj.append(obj)
             except Exception as e:
@@ -93,23 +224,58 @@ class CashFlowAnalyzer(BaseAnalyzer):
         return sorted(movimentacoes_obj, key=lambda x: self._obter_indice_mes(x.mes))
     
     def _obter_indice_mes(self, mes: str) -> int:
-        """Obtém índice numérico do mês para ordenação"""
-        mes_lower = mes.lower()
-        try:
-            return self.meses_ordem.index(mes_lower)
-        except ValueError:
-            # Fallback para meses abreviados
-            abreviacoes = {
-                'mai': 4, 'jun': 5, 'jul': 6, 'ago': 7,
-                'set': 8, 'out': 9, 'nov': 10, 'dez': 11
-            }
-            return abreviacoes.get(mes_lower, 0)
+        """Obtém índice numérico do mês para ordenação (meses desconhecidos vão para o início)"""
+        return self._indice_mes.get(mes.lower(), 0)
+    
+    def _montar_matriz_centavos(self, movimentacoes: List[MovimentacaoFinanceira]) -> np.ndarray:
+        """
+        Monta matriz (3, n) int64 em centavos com as linhas crédito, débito e saldo, já ordenadas por mês.
+
+        Cada linha é um vetor contíguo (estrutura de arrays), de modo que
+        `creditos, debitos, saldos = centavos` não copia dados. Somas e
+        comparações em centavos inteiros são exatas.
+        """
+        return np.array([
+            [self._para_centavos(mov.credito) for mov in movimentacoes],
+            [self._para_centavos(mov.debito) for mov in movimentacoes],
+            [self._para_centavos(mov.saldo_operacional) for mov in movimentacoes],
+        ], dtype=np.int64).reshape(3, -1)
+    
+    @staticmethod
+    def _como_decimal(valor: Any) -> Decimal:
+        """Converte valor de entrada para Decimal; só floats e outros tipos passam por str()"""
+        tipo = type(valor)
+        if tipo is Decimal:
+            return valor
+        if tipo is int:
+            return Decimal(valor)
+        return Decimal(str(valor))
+    
+    @staticmethod
+    def _para_centavos(valor: Decimal) -> int:
+        """Converte valor monetário Decimal (já arredondado a centavos na conversão) para centavos inteiros"""
+        return int(valor.scaleb(2).to_integral_value())
     
-    def _analisar_resumo_mensal(self, movimentacoes: List[MovimentacaoFinanceira]) -> Dict[str, Any]:
+    @staticmethod
+    def _centavos_para_decimal(centavos: int) -> Decimal:
+        """Converte centavos inteiros de volta para Decimal com duas casas"""
+        return Decimal(int(centavos)).scaleb(-2)
+    
+    @staticmethod
+    def _para_decimal(valor: float) -> Decimal:
+        """Converte resultado float64 de volta para Decimal em centavos"""
+        return float_para_decimal(valor, _Q2)
+    
+    def _analisar_resumo_mensal(self, movimentacoes: List[MovimentacaoFinanceira],
+                                centavos: np.ndarray, fluxo: np.ndarray) -> Dict[str, Any]:
         """Gera resumo mensal das movimentações"""
-        total_creditos = sum(mov.credito for mov in movimentacoes)
-        total_debitos = sum(mov.debito for mov in movimentacoes)
-        saldo_final = sum(mov.saldo_operacional for mov in movimentacoes)
+        totais = centavos.sum(axis=1)
+        total_creditos = self._centavos_para_decimal(totais[0])
+        total_debitos = self._centavos_para_decimal(totais[1])
+        saldo_final = self._centavos_para_decimal(totais[2])
+        saldos = centavos[2]
+        # Meses negativos, zerados e positivos contados em uma única passagem
+        negativos, _, positivos = np.bincount(np.sign(saldos) + 1, minlength=3)
         
         # Médias mensais
         media_creditos = total_creditos / len(movimentacoes)
@@ -117,159 +283,119 @@ class CashFlowAnalyzer(BaseAnalyzer):
         media_saldo = saldo_final / len(movimentacoes)
         
         # Mês com maior e menor performance
-        melhor_mes = max(movimentacoes, key=lambda x: x.saldo_operacional)
-        pior_mes = min(movimentacoes, key=lambda x: x.saldo_operacional)
+        melhor_mes = movimentacoes[int(np.argmax(saldos))]
+        pior_mes = movimentacoes[int(np.argmin(saldos))]
         
         return {
             'total_creditos': total_creditos,
             'total_debitos': total_debitos,
             'saldo_consolidado': saldo_final,
+            'saldo_consolidado_formatado': self.formatter.formatar_moeda(saldo_final, compacto=True),
             'media_creditos_mensal': media_creditos,
             'media_debitos_mensal': media_debitos,
             'media_saldo_mensal': media_saldo,
             'melhor_mes': {
                 'periodo': melhor_mes.periodo_completo,
-                'saldo': melhor_mes.saldo_operacional
+                'saldo': melhor_mes.saldo_operacional,
+                'saldo_formatado': self.formatter.formatar_moeda(melhor_mes.saldo_operacional, compacto=True)
             },
             'pior_mes': {
                 'periodo': pior_mes.periodo_completo,
-                'saldo': pior_mes.saldo_operacional
+                'saldo': pior_mes.saldo_operacional,
+                'saldo_formatado': self.formatter.formatar_moeda(pior_mes.saldo_operacional, compacto=True)
             },
-            'meses_positivos': len([m for m in movimentacoes if m.saldo_operacional > 0]),
-            'meses_negativos': len([m for m in movimentacoes if m.saldo_operacional < 0]),
-            'volatilidade': self._calcular_volatilidade_saldos(movimentacoes)
+            'meses_positivos': int(positivos),
+            'meses_negativos': int(negativos),
+            'saldo_acumulado': [self._centavos_para_decimal(v) for v in np.cumsum(saldos)],
+            'volatilidade': self._calcular_volatilidade_saldos(fluxo[2])
         }
     
-    def _calcular_volatilidade_saldos(self, movimentacoes: List[MovimentacaoFinanceira]) -> Decimal:
-        """Calcula volatilidade dos saldos operacionais"""
-        saldos = [float(mov.saldo_operacional) for mov in movimentacoes]
-        if len(saldos) < 2:
+    def _calcular_volatilidade_saldos(self, saldos: np.ndarray) -> Decimal:
+        """Calcula volatilidade (desvio padrão amostral) dos saldos operacionais"""
+        if saldos.size < 2:
             return Decimal('0')
         
-        volatilidade = statistics.stdev(saldos)
-        return Decimal(str(volatilidade)).quantize(Decimal('0.01'))
+        _, volatilidade = _media_desvio_amostral(saldos)
+        return float_para_decimal(volatilidade, _Q2)
     
-    def _analisar_tendencias(self, movimentacoes: List[MovimentacaoFinanceira]) -> List[TendenciaFinanceira]:
+    def _analisar_tendencias(self, fluxo: np.ndarray) -> List[TendenciaFinanceira]:
         """Analisa tendências do fluxo de caixa"""
-        tendencias = []
-        
-        # Tendência de créditos
-        tendencia_creditos = self._calcular_tendencia_metrica(
-            [mov.credito for mov in movimentacoes], "Créditos Mensais"
-        )
-        tendencias.append(tendencia_creditos)
-        
-        # Tendência de débitos
-        tendencia_debitos = self._calcular_tendencia_metrica(
-            [mov.debito for mov in movimentacoes], "Débitos Mensais"
-        )
-        tendencias.append(tendencia_debitos)
-        
-        # Tendência de saldo operacional
-        tendencia_saldo = self._calcular_tendencia_metrica(
-            [mov.saldo_operacional for mov in movimentacoes], "Saldo Operacional"
-        )
-        tendencias.append(tendencia_saldo)
-        
-        return tendencias
+        creditos, debitos, saldos = fluxo
+        return [
+            self._calcular_tendencia_metrica(creditos, "Créditos Mensais"),
+            self._calcular_tendencia_metrica(debitos, "Débitos Mensais"),
+            self._calcular_tendencia_metrica(saldos, "Saldo Operacional"),
+        ]
     
-    def _calcular_tendencia_metrica(self, valores: List[Decimal], nome_metrica: str) -> TendenciaFinanceira:
-        """Calcula tendência de uma métrica específica"""
-        valores_float = [float(v) for v in valores]
-        
+    def _calcular_tendencia_metrica(self, valores: np.ndarray, nome_metrica: str) -> TendenciaFinanceira:
+        """Calcula tendência de uma métrica específica a partir do vetor float64 mensal"""
         # Calcular slope da regressão linear simples
-        n = len(valores_float)
-        x = list(range(n))
+        n = valores.size
+        x = np.arange(n, dtype=np.float64)
         
         # Fórmulas da regressão linear
-        sum_x = sum(x)
-        sum_y = sum(valores_float)
-        sum_xy = sum(x[i] * valores_float[i] for i in range(n))
-        sum_x2 = sum(xi ** 2 for xi in x)
+        sum_x = x.sum()
+        sum_y = valores.sum()
+        sum_xy = x @ valores
+        sum_x2 = x @ x
         
         if n * sum_x2 - sum_x ** 2 == 0:
             slope = 0
         else:
-            slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x ** 2)
+            slope = float((n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x ** 2))
         
         # Determinar direção da tendência
-        if abs(slope) < 0.1:
-            direcao = TrendDirection.ESTAVEL
-            intensidade = Decimal('20')
-        elif slope > 0:
-            direcao = TrendDirection.CRESCIMENTO
-            intensidade = min(Decimal('100'), Decimal(str(abs(slope * 100))))
-        else:
-            direcao = TrendDirection.DECLINIO
-            intensidade = min(Decimal('100'), Decimal(str(abs(slope * 100))))
+        faixa = (abs(slope) >= 0.1) * (1 if slope > 0 else 2)
+        direcao = _DIRECOES_TENDENCIA[faixa]
+        intensidade = float_para_decimal(min(100.0, abs(slope) * 100), _Q1) if faixa else Decimal('20')
         
         # Calcular volatilidade como indicador de estabilidade
-        volatilidade = statistics.stdev(valores_float) if len(valores_float) > 1 else 0
-        confiabilidade = max(Decimal('50'), Decimal('100') - Decimal(str(volatilidade / max(valores_float) * 100)))
+        _, volatilidade = _media_desvio_amostral(valores)
+        confiabilidade = max(Decimal('50'), _CEM - Decimal(repr(volatilidade / float(valores.max()) * 100)))
         
         # Identificar pontos críticos
         pontos_criticos = []
-        for i, valor in enumerate(valores):
-            if valor < 0:
-                mes_index = i
-                pontos_criticos.append(f"Mês {mes_index + 1}: Valor negativo ({self.formatter.formatar_moeda(valor, compacto=True)})")
+        for mes_index in np.flatnonzero(valores < 0):
+            valor = self._para_decimal(valores[mes_index])
+            pontos_criticos.append(f"Mês {mes_index + 1}: Valor negativo ({self.formatter.formatar_moeda(valor, compacto=True)})")
         
         return TendenciaFinanceira(
             metrica=nome_metrica,
             direcao=direcao,
-            intensidade=intensidade.quantize(Decimal('0.1')),
-            periodo_analise=f"{len(valores)} meses",
+            intensidade=intensidade.quantize(_Q1),
+            periodo_analise=f"{n} meses",
             pontos_criticos=pontos_criticos,
-            confiabilidade=confiabilidade.quantize(Decimal('0.1'))
+            confiabilidade=confiabilidade.quantize(_Q1)
         )
     
-    def _identificar_meses_criticos(self, movimentacoes: List[MovimentacaoFinanceira]) -> List[Dict[str, Any]]:
+    def _identificar_meses_criticos(self, movimentacoes: List[MovimentacaoFinanceira],
+                                    centavos: np.ndarray) -> List[Dict[str, Any]]:
         """Identifica meses com performance crítica"""
-        meses_criticos = []
+        criterios, scores = _pontuar_meses_criticos(centavos)
         
-        for mov in movimentacoes:
-            criticidade = []
-            score_risco = 0
-            
-            # Verificar saldo negativo
-            if mov.saldo_operacional < 0:
-                criticidade.append("Saldo operacional negativo")
-                score_risco += 50
-            
-            # Verificar desbalanceamento extremo (débitos >> créditos)
-            if mov.debito > mov.credito * Decimal('1.5'):
-                criticidade.append("Débitos muito superiores aos créditos")
-                score_risco += 30
-            
-            # Verificar valores extremos
-            media_creditos = sum(m.credito for m in movimentacoes) / len(movimentacoes)
-            if mov.credito < media_creditos * Decimal('0.5'):
-                criticidade.append("Créditos muito abaixo da média")
-                score_risco += 20
+        meses_criticos = []
+        for i in np.flatnonzero(scores):
+            mov = movimentacoes[i]
+            criticidade = [problema for problema, ativo in zip(_PROBLEMAS_CRITICIDADE, criterios[:, i]) if ativo]
             
-            # Se há alguma criticidade, incluir no resultado
-            if criticidade:
-                meses_criticos.append({
-                    'periodo': mov.periodo_completo,
-                    'saldo_operacional': mov.saldo_operacional,
-                    'problemas_identificados': criticidade,
-                    'score_risco': min(100, score_risco),
-                    'recomendacao_prazo': self._sugerir_prazo_acao_mes(score_risco)
-                })
+            score_risco = int(scores[i])
+            meses_criticos.append({
+                'periodo': mov.periodo_completo,
+                'saldo_operacional': mov.saldo_operacional,
+                'problemas_identificados': criticidade,
+                'score_risco': min(100, score_risco),
+                'recomendacao_prazo': self._sugerir_prazo_acao_mes(score_risco)
+            })
         
         # Ordenar por score de risco (maior primeiro)
         return sorted(meses_criticos, key=lambda x: x['score_risco'], reverse=True)
     
     def _sugerir_prazo_acao_mes(self, score_risco: int) -> str:
         """Sugere prazo de ação baseado no score de risco"""
-        if score_risco >= 70:
-            return "Ação imediata (0-7 dias)"
-        elif score_risco >= 40:
-            return "Ação prioritária (7-15 dias)"
-        else:
-            return "Monitoramento (15-30 dias)"
+        return _PRAZO_ACAO[bisect_right(_PRAZO_LIMITES, score_risco)]
     
-    def _analisar_sazonalidade(self, movimentacoes: List[MovimentacaoFinanceira]) -> Dict[str, Any]:
+    def _analisar_sazonalidade(self, movimentacoes: List[MovimentacaoFinanceira],
+                               centavos: np.ndarray) -> Dict[str, Any]:
         """Analisa padrões sazonais no fluxo de caixa"""
         if len(movimentacoes) < 6:
             return {"erro": "Dados insuficientes para análise sazonal"}
@@ -279,12 +405,9 @@ class CashFlowAnalyzer(BaseAnalyzer):
         melhor_performance = max(saldos_por_mes, key=lambda x: x[1])
         pior_performance = min(saldos_por_mes, key=lambda x: x[1])
         
-        # Calcular média móvel para suavizar flutuações
-        saldos = [mov.saldo_operacional for mov in movimentacoes]
-        media_movel = []
-        for i in range(len(saldos) - 2):
-            media = sum(saldos[i:i+3]) / 3
-            media_movel.append(media)
+        # Calcular média móvel para suavizar flutuações (somas das janelas de 3 meses em centavos)
+        somas_trimestrais = sliding_window_view(centavos[2], 3).sum(axis=1)
+        media_movel = [self._centavos_para_decimal(soma) / 3 for soma in somas_trimestrais]
         
         return {
             'melhor_periodo_sazonal': melhor_performance[0],
@@ -293,57 +416,51 @@ class CashFlowAnalyzer(BaseAnalyzer):
             'pior_valor_sazonal': pior_performance[1],
             'amplitude_sazonal': melhor_performance[1] - pior_performance[1],
             'media_movel_trimestral': media_movel,
-            'variacao_sazonal': self._calcular_coeficiente_variacao(saldos)
+            'variacao_sazonal': self._calcular_coeficiente_variacao(centavos[2])
         }
     
-    def _calcular_coeficiente_variacao(self, valores: List[Decimal]) -> Decimal:
+    def _calcular_coeficiente_variacao(self, valores: np.ndarray) -> Decimal:
         """Calcula coeficiente de variação (desvio padrão / média)"""
-        valores_float = [float(v) for v in valores]
-        if not valores_float:
+        if not valores.size:
             return Decimal('0')
         
-        media = statistics.mean(valores_float)
+        media, desvio = _media_desvio_amostral(valores)
         if media == 0:
             return Decimal('0')
         
-        desvio = statistics.stdev(valores_float) if len(valores_float) > 1 else 0
         coef_variacao = (desvio / abs(media)) * 100
         
-        return Decimal(str(coef_variacao)).quantize(Decimal('0.1'))
+        return float_para_decimal(coef_variacao, _Q1)
     
-    def _gerar_projecoes(self, movimentacoes: List[MovimentacaoFinanceira]) -> Dict[str, Any]:
-        """Gera projeções para próximos meses"""
-        if len(movimentacoes) < 3:
+    def _gerar_projecoes(self, centavos: np.ndarray,
+                         tendencia_saldo: TendenciaFinanceira) -> Dict[str, Any]:
+        """Gera projeções para próximos meses a partir da tendência do saldo operacional"""
+        if centavos.shape[1] < 3:
             return {"erro": "Dados insuficientes para projeção"}
         
         # Calcular médias dos últimos 3 meses
-        ultimos_3 = movimentacoes[-3:]
-        media_creditos = sum(mov.credito for mov in ultimos_3) / 3
-        media_debitos = sum(mov.debito for mov in ultimos_3) / 3
-        
-        # Projeção simples baseada na tendência
-        tendencia_saldo = self._calcular_tendencia_metrica(
-            [mov.saldo_operacional for mov in movimentacoes], "Saldo"
-        )
+        soma_creditos, soma_debitos = centavos[:2, -3:].sum(axis=1)
+        media_creditos = self._centavos_para_decimal(soma_creditos) / 3
+        media_debitos = self._centavos_para_decimal(soma_debitos) / 3
+        
+        # Aplicar tendência à média (o fator é o mesmo para os três meses projetados)
+        fator_tendencia = 1.0
+        if tendencia_saldo.direcao is TrendDirection.CRESCIMENTO:
+            fator_tendencia = 1.0 + (float(tendencia_saldo.intensidade) / 100 * 0.1)
+        elif tendencia_saldo.direcao is TrendDirection.DECLINIO:
+            fator_tendencia = 1.0 - (float(tendencia_saldo.intensidade) / 100 * 0.1)
+        
+        credito_projetado = media_creditos * Decimal(repr(fator_tendencia))
+        debito_projetado = media_debitos
+        saldo_projetado = credito_projetado - debito_projetado
+        projecao = {
+            'credito_projetado': credito_projetado.quantize(_Q2),
+            'debito_projetado': debito_projetado.quantize(_Q2),
+            'saldo_projetado': saldo_projetado.quantize(_Q2)
+        }
         
-        projecoes_meses = {}
-        for i in range(1, 4):  # Próximos 3 meses
-            # Aplicar tendência à média
-            fator_tendencia = 1.0
-            if tendencia_saldo.direcao == TrendDirection.CRESCIMENTO:
-                fator_tendencia = 1.0 + (float(tendencia_saldo.intensidade) / 100 * 0.1)
-            elif tendencia_saldo.direcao == TrendDirection.DECLINIO:
-                fator_tendencia = 1.0 - (float(tendencia_saldo.intensidade) / 100 * 0.1)
-            
-            credito_projetado = media_creditos * Decimal(str(fator_tendencia))
-            debito_projetado = media_debitos
-            saldo_projetado = credito_projetado - debito_projetado
-            
-            projecoes_meses[f"mes_{i}"] = {
-                'credito_projetado': credito_projetado.quantize(Decimal('0.01')),
-                'debito_projetado': debito_projetado.quantize(Decimal('0.01')),
-                'saldo_projetado': saldo_projetado.quantize(Decimal('0.01'))
-            }
+        # Próximos 3 meses
+        projecoes_meses = {f"mes_{i}": dict(projecao) for i in range(1, 4)}
         
         return {
             'projecoes_mensais': projecoes_meses,
@@ -352,57 +469,55 @@ class CashFlowAnalyzer(BaseAnalyzer):
             'observacoes': ["Projeção baseada em tendência histórica", "Considerar fatores externos e sazonalidade"]
         }
     
-    def _calcular_metricas_gerais(self, movimentacoes: List[MovimentacaoFinanceira]) -> Dict[str, Any]:
-        """Calcula métricas gerais do fluxo de caixa"""
-        creditos = [mov.credito for mov in movimentacoes]
-        debitos = [mov.debito for mov in movimentacoes]
-        saldos = [mov.saldo_operacional for mov in movimentacoes]
+    def _calcular_metricas_gerais(self, centavos: np.ndarray) -> Dict[str, Any]:
+        """
+        Calcula métricas gerais do fluxo de caixa.
+        
+        Totais somados em centavos exatos; as razões são divididas em Decimal, com a
+        mesma precisão (sem quantização) da divisão dos totais em reais.
+        """
+        total_creditos, total_debitos, total_saldos = (Decimal(int(v)) for v in centavos.sum(axis=1))
+        saldos = centavos[2]  # coeficiente de variação independe da escala
         
         return {
-            'eficiencia_operacional': (sum(creditos) / sum(debitos)) * 100 if sum(debitos) > 0 else Decimal('0'),
-            'margem_operacional_media': (sum(saldos) / sum(creditos)) * 100 if sum(creditos) > 0 else Decimal('0'),
-            'crescimento_creditos': self._calcular_crescimento_periodo(creditos),
-            'crescimento_debitos': self._calcular_crescimento_periodo(debitos),
-            'estabilidade_saldo': Decimal('100') - self._calcular_coeficiente_variacao(saldos),
-            'meses_superavit': len([s for s in saldos if s > 0]),
-            'meses_deficit': len([s for s in saldos if s < 0])
+            'eficiencia_operacional': total_creditos / total_debitos * 100 if total_debitos > 0 else Decimal('0'),
+            'margem_operacional_media': total_saldos / total_creditos * 100 if total_creditos > 0 else Decimal('0'),
+            'crescimento_creditos': self._calcular_crescimento_periodo(centavos[0]),
+            'crescimento_debitos': self._calcular_crescimento_periodo(centavos[1]),
+            'estabilidade_saldo': _CEM - self._calcular_coeficiente_variacao(saldos),
+            'meses_superavit': int((saldos > 0).sum()),
+            'meses_deficit': int((saldos < 0).sum())
         }
     
-    def _calcular_crescimento_periodo(self, valores: List[Decimal]) -> Decimal:
+    def _calcular_crescimento_periodo(self, valores: np.ndarray) -> Decimal:
         """Calcula crescimento entre primeiro e último período"""
-        if len(valores) < 2 or valores[0] == 0:
+        if valores.size < 2 or valores[0] == 0:
             return Decimal('0')
         
-        crescimento = ((valores[-1] - valores[0]) / valores[0]) * 100
-        return crescimento.quantize(Decimal('0.1'))
+        crescimento = (float(valores[-1]) / float(valores[0]) - 1) * 100
+        return float_para_decimal(crescimento, _Q1)
     
-    def _gerar_alertas_cashflow(self, movimentacoes: List[MovimentacaoFinanceira], 
-                              meses_criticos: List[Dict]) -> List[Dict[str, Any]]:
+    def _gerar_alertas_cashflow(self, meses_criticos: List[Dict], fluxo: np.ndarray) -> List[Dict[str, Any]]:
         """Gera alertas baseados na análise do fluxo de caixa"""
         alertas = []
         
-        # Alerta para meses consecutivos negativos
-        meses_negativos_consecutivos = 0
-        for mov in movimentacoes:
-            if mov.saldo_operacional < 0:
-                meses_negativos_consecutivos += 1
-            else:
-                meses_negativos_consecutivos = 0
-                
-            if meses_negativos_consecutivos >= 2:
-                alertas.append({
-                    'tipo': 'CRITICO',
-                    'titulo': 'Meses Consecutivos com Saldo Negativo',
-                    'descricao': f'Identificados {meses_negativos_consecutivos} meses consecutivos com saldo operacional negativo',
-                    'impacto': 'Alto - Comprometimento do fluxo de caixa',
-                    'acao_requerida': 'Revisão urgente da estrutura de custos e estratégia de receitas'
-                })
-                break
+        # Alerta para meses consecutivos negativos: soma dos pares vizinhos == 2 marca uma sequência
+        negativos = (fluxo[2] < 0).astype(np.int8)
+        pares_negativos = np.convolve(negativos, np.ones(2, dtype=np.int8), 'valid')
+        if (pares_negativos >= 2).any():
+            meses_negativos_consecutivos = 2  # o alerta dispara no segundo mês negativo seguido
+            alertas.append({
+                'tipo': 'CRITICO',
+                'titulo': 'Meses Consecutivos com Saldo Negativo',
+                'descricao': f'Identificados {meses_negativos_consecutivos} meses consecutivos com saldo operacional negativo',
+                'impacto': 'Alto - Comprometimento do fluxo de caixa',
+                'acao_requerida': 'Revisão urgente da estrutura de custos e estratégia de receitas'
+            })
         
         # Alerta para alta volatilidade
-        volatilidade = self._calcular_volatilidade_saldos(movimentacoes)
-        media_saldos = sum(mov.saldo_operacional for mov in movimentacoes) / len(movimentacoes)
-        if float(volatilidade) > abs(float(media_saldos)) * 0.5:
+        volatilidade = self._calcular_volatilidade_saldos(fluxo[2])
+        media_saldos = float(fluxo[2].mean())
+        if float(volatilidade) > abs(media_saldos) * 0.5:
             alertas.append({
                 'tipo': 'ATENCAO',
                 'titulo': 'Alta Volatilidade no Fluxo de Caixa',
@@ -420,7 +535,7 @@ class CashFlowAnalyzer(BaseAnalyzer):
         
         # Recomendações baseadas em tendências
         for tendencia in tendencias:
-            if tendencia.direcao == TrendDirection.DECLINIO and tendencia.intensidade > 30:
+            if tendencia.direcao is TrendDirection.DECLINIO and tendencia.intensidade > 30:
                 if 'Crédito' in tendencia.metrica:
                     recomendacoes.append(
                         f"📉 {tendencia.metrica}: Implementar ações para reversão da tendência de queda. "
@@ -453,11 +568,11 @@ class CashFlowAnalyzer(BaseAnalyzer):
         # Resumo executivo
         relatorio.append("📊 RESUMO EXECUTIVO:")
         relatorio.append(f"   • Período: {analise_cashflow['periodo_analisado']}")  
-        relatorio.append(f"   • Saldo Consolidado: {self.formatter.formatar_moeda(resumo['saldo_consolidado'], compacto=True)}")
+        relatorio.append(f"   • Saldo Consolidado: {resumo['saldo_consolidado_formatado']}")
         relatorio.append(f"   • Meses Positivos: {resumo['meses_positivos']}")
         relatorio.append(f"   • Meses Negativos: {resumo['meses_negativos']}")
-        relatorio.append(f"   • Melhor Mês: {resumo['melhor_mes']['periodo']} ({self.formatter.formatar_moeda(resumo['melhor_mes']['saldo'], compacto=True)})")
-        relatorio.append(f"   • Pior Mês: {resumo['pior_mes']['periodo']} ({self.formatter.formatar_moeda(resumo['pior_mes']['saldo'], compacto=True)})")
+        relatorio.append(f"   • Melhor Mês: {resumo['melhor_mes']['periodo']} ({resumo['melhor_mes']['saldo_formatado']})")
+        relatorio.append(f"   • Pior Mês: {resumo['pior_mes']['periodo']} ({resumo['pior_mes']['saldo_formatado']})")
         relatorio.append("")
         
         # Meses críticos
@@ -473,7 +588,7 @@ class CashFlowAnalyzer(BaseAnalyzer):
         # Tendências
         relatorio.append("📈 TENDÊNCIAS IDENTIFICADAS:")
         for tendencia in analise_cashflow['tendencias']:
-            emoji_tendencia = {"CRESCIMENTO": "📈", "DECLÍNIO": "📉", "ESTÁVEL": "➡️"}.get(tendencia.direcao.value, "⚪")
+            emoji_tendencia = self._EMOJI_DIRECAO.get(tendencia.direcao, "⚪")
             relatorio.append(f"   {emoji_tendencia} {tendencia.metrica}:")
             relatorio.append(f"      Direção: {tendencia.direcao.value}")
             relatorio.append(f"      Intensidade: {self.formatter.formatar_porcentagem(tendencia.intensidade)}")
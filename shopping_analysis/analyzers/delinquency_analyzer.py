@@ -2,22 +2,108 @@
 Analisador de Inadimplência para Shopping Centers.
 Análise especializada dos maiores inadimplentes do Shopping Park Botucatu.
 """
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from typing import List, Dict, Optional, Any, Tuple
-from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Any, Tuple, Union, NamedTuple
+from datetime import datetime
+from operator import itemgetter
+
+import numpy as np
 
 from .kpi_analyzer import BaseAnalyzer
 from ..core.models import Inadimplente, ConfiguracaoAnalise
-from ..core.enums import DebtStatus, RiskLevel, InsightType, InsightPriority
+from ..core.enums import DebtStatus, RiskLevel
 from ..core.exceptions import CalculationError, InsufficientDataError
-from ..formatters.brazilian import BrazilianFormatter
+from ..core.memo import MemoriaAnalises
+from ..core.money import arredondar_centavos, float_para_decimal
+from ..core.summaries import DelinquencySummary
+
+
+# Códigos inteiros dos enums (posição na declaração), usados nos vetores da carteira
+_CODIGO_STATUS = {status: codigo for codigo, status in enumerate(DebtStatus)}
+_CODIGO_RISCO = {nivel: codigo for codigo, nivel in enumerate(RiskLevel)}
+
+# Status informados nos dados brutos (status desconhecido vira confissão de dívida)
+_STATUS_MAP = {
+    'confissao_divida': DebtStatus.CONFISSAO_DIVIDA,
+    'em_atraso': DebtStatus.EM_ATRASO,
+    'negociacao': DebtStatus.NEGOCIACAO,
+    'acordo': DebtStatus.ACORDO,
+    'juridico': DebtStatus.JURIDICO
+}
+
+# Valores dos enums na mesma ordem dos códigos (chaves das distribuições)
+_CHAVES_STATUS = tuple(status.value for status in DebtStatus)
+_CHAVES_RISCO = tuple(nivel.value for nivel in RiskLevel)
+
+# Quantidade de análises mantidas em memória por instância (LRU)
+_MAX_ANALISES_MEMORIZADAS = 32
+
+# A partir deste tamanho de carteira as sub-análises rodam em threads (o NumPy libera o GIL);
+# abaixo dele o custo de criar o pool supera o ganho
+_MIN_INADIMPLENTES_PARALELO = 5000
+
+# Ações individuais: valor alto com confissão, valor alto, valor médio, demais
+_ACOES_INDIVIDUAIS = (
+    "Execução judicial imediata",
+    "Negociação com desconto máximo de 20%",
+    "Acordo parcelado com entrada de 30%",
+    "Negociação direta com flexibilidade de prazo",
+)
+
+# Estratégias de recuperação por faixa (chave, ação, prazo), na ordem de prioridade da classificação
+_ESTRATEGIAS_RECUPERACAO = (
+    ('acao_imediata', 'Execução judicial ou acordo com desconto máximo de 15%', '7 dias'),
+    ('negociacao_prioritaria', 'Negociação ativa com proposta de parcelamento', '15 dias'),
+    ('monitoramento_ativo', 'Contato semanal e acompanhamento próximo', '30 dias'),
+    ('juridico', 'Análise jurídica para execução', '45 dias'),
+)
+
+# Prioridades de cobrança por faixa de score (np.digitize com limites 40, 60, 80)
+_PRIORIDADES_COBRANCA = ("BAIXA", "MÉDIA", "ALTA", "CRÍTICA")
+
+# Pesos de status e risco no score de prioridade, indexados pelos códigos da carteira
+# (status sem peso definido, como QUITADO, valem 10)
+_SCORE_STATUS = np.array([20, 15, 10, 5, 10, 15], dtype=np.int64)
+_SCORE_RISCO = np.array([10, 8, 5, 3, 1], dtype=np.int64)
+
+# Estimativas de recuperação por status (50% para status sem taxa definida)
+_TAXA_RECUPERACAO_PADRAO = Decimal('0.50')
+_TAXAS_RECUPERACAO = {
+    DebtStatus.CONFISSAO_DIVIDA: Decimal('0.70'),  # 70%
+    DebtStatus.EM_ATRASO: Decimal('0.60'),         # 60%
+    DebtStatus.NEGOCIACAO: Decimal('0.80'),        # 80%
+    DebtStatus.ACORDO: Decimal('0.90'),            # 90%
+    DebtStatus.JURIDICO: Decimal('0.40')           # 40%
+}
+# Mesmas taxas em centésimos (inteiros), indexadas pelo código de status da carteira
+_TAXAS_RECUPERACAO_CENTESIMOS = np.array(
+    [int(_TAXAS_RECUPERACAO.get(status, _TAXA_RECUPERACAO_PADRAO) * 100) for status in DebtStatus],
+    dtype=np.int64
+)
+
+
+class _Carteira(NamedTuple):
+    """Carteira de inadimplentes em vetores paralelos (mesma ordem da lista de objetos)"""
+    valores: np.ndarray  # float64, valor da dívida em R$
+    centavos: np.ndarray  # int64, valor da dívida em centavos (somas e comparações exatas)
+    status: np.ndarray   # int8, código de DebtStatus
+    risco: np.ndarray    # int8, código de RiskLevel
+    ordem: np.ndarray    # índices por valor decrescente (estável, como sorted(reverse=True))
+    acumulado: np.ndarray  # soma acumulada dos valores na ordem decrescente
+    limites: Dict[str, Any]  # thresholds_risco em float, lidos uma vez por análise
 
 
 class DelinquencyAnalyzer(BaseAnalyzer):
     """Analisador especializado em inadimplência e recuperação de crédito"""
     
-    def __init__(self, configuracao: Optional[ConfiguracaoAnalise] = None):
+    def __init__(self, configuracao: Optional[ConfiguracaoAnalise] = None, decimal_estrito: bool = False):
         super().__init__(configuracao)
+        # Totais e percentuais são calculados em float64 e quantizados na saída;
+        # decimal_estrito=True mantém a aritmética em Decimal (execuções regulatórias)
+        self.decimal_estrito = decimal_estrito
+        # Resultados de analisar() por impressão digital da entrada (ver _chave_memoria)
+        self._memoria = MemoriaAnalises(_MAX_ANALISES_MEMORIZADAS)
         self.thresholds_risco = {
             'valor_alto': Decimal('50000'),      # Valores acima de R$ 50k
             'valor_medio': Decimal('20000'),     # Valores entre R$ 20k-50k
@@ -27,7 +113,15 @@ class DelinquencyAnalyzer(BaseAnalyzer):
             'dias_medio': 30                     # 30-60 dias
         }
     
-    def analisar(self, inadimplentes: List[Dict[str, Any]], receita_total: Optional[Decimal] = None) -> Dict[str, Any]:
+    def _limites_float(self) -> Dict[str, Any]:
+        """Converte thresholds_risco para float, para comparação direta com os vetores da carteira"""
+        return {
+            chave: float(valor) if isinstance(valor, Decimal) else valor
+            for chave, valor in self.thresholds_risco.items()
+        }
+    
+    def analisar(self, inadimplentes: List[Dict[str, Any]],
+                 receita_total: Optional[Union[Decimal, float]] = None) -> Dict[str, Any]:
         """
         Analisa dados de inadimplência.
         
@@ -42,74 +136,108 @@ class DelinquencyAnalyzer(BaseAnalyzer):
             if not inadimplentes:
                 raise InsufficientDataError("analise_inadimplencia", 1, 0)
             
-            # Converter para objetos Inadimplente
-            inadimplentes_obj = self._converter_inadimplentes(inadimplentes)
-            
-            # Análises principais
-            ranking_valor = self._gerar_ranking_por_valor(inadimplentes_obj)
-            analise_risco = self._analisar_perfil_risco(inadimplentes_obj)
-            concentracao = self._analisar_concentracao_dividas(inadimplentes_obj)
-            impacto_financeiro = self._calcular_impacto_financeiro(inadimplentes_obj, receita_total)
-            
-            # Estratégias de recuperação
-            estrategias_recuperacao = self._gerar_estrategias_recuperacao(inadimplentes_obj)
-            
-            # Métricas consolidadas
-            metricas_gerais = self._calcular_metricas_inadimplencia(inadimplentes_obj, receita_total)
-            
-            # Recomendações específicas
-            recomendacoes = self._gerar_recomendacoes_inadimplencia(inadimplentes_obj, analise_risco)
-            
-            return {
-                'inadimplentes_analisados': inadimplentes_obj,
-                'ranking_por_valor': ranking_valor,
-                'analise_risco': analise_risco,
-                'concentracao_dividas': concentracao,
-                'impacto_financeiro': impacto_financeiro,
-                'estrategias_recuperacao': estrategias_recuperacao,
-                'metricas_gerais': metricas_gerais,
-                'recomendacoes': recomendacoes,
-                'data_analise': datetime.now(),
-                'total_inadimplentes': len(inadimplentes_obj)
-            }
+            # Entradas idênticas reaproveitam a análise memorizada (cópia independente do cache)
+            resultado = self._memoria.obter(
+                self._chave_memoria(inadimplentes, receita_total),
+                lambda: self._analisar_inadimplentes(inadimplentes, receita_total)
+            )
+            resultado['data_analise'] = datetime.now()
+            return resultado
             
         except Exception as e:
             raise CalculationError("analise_inadimplencia", str(e)) from e
     
+    def _chave_memoria(self, inadimplentes: List[Dict[str, Any]],
+                       receita_total: Optional[Union[Decimal, float]]) -> Tuple:
+        """Impressão digital da entrada: limites de risco, modo de cálculo, todos os campos de cada inadimplente e a receita"""
+        return (
+            tuple((chave, str(valor)) for chave, valor in sorted(self.thresholds_risco.items())),
+            self.decimal_estrito,
+            str(receita_total),
+            tuple(tuple((campo, str(valor)) for campo, valor in sorted(inad.items())) for inad in inadimplentes)
+        )
+    
+    def _analisar_inadimplentes(self, inadimplentes: List[Dict[str, Any]],
+                                receita_total: Optional[Union[Decimal, float]]) -> Dict[str, Any]:
+        """Executa todas as análises de inadimplência (sem memorização)"""
+        # Converter para objetos Inadimplente
+        inadimplentes_obj = self._converter_inadimplentes(inadimplentes)
+        carteira = self._montar_carteira(inadimplentes_obj)
+        valor_total = self._somar_valores(inadimplentes_obj, carteira)
+        
+        # Análises principais, estratégias de recuperação e métricas consolidadas são independentes
+        # entre si: apenas leem a carteira e o total
+        tarefas = {
+            'ranking_por_valor': (self._gerar_ranking_por_valor, (inadimplentes_obj, carteira, valor_total)),
+            'analise_risco': (self._analisar_perfil_risco, (inadimplentes_obj, carteira, valor_total)),
+            'concentracao_dividas': (self._analisar_concentracao_dividas, (inadimplentes_obj, carteira, valor_total)),
+            'impacto_financeiro': (
+                self._calcular_impacto_financeiro, (inadimplentes_obj, carteira, valor_total, receita_total)
+            ),
+            'estrategias_recuperacao': (self._gerar_estrategias_recuperacao, (inadimplentes_obj, carteira)),
+            'metricas_gerais': (
+                self._calcular_metricas_inadimplencia, (inadimplentes_obj, carteira, valor_total, receita_total)
+            ),
+        }
+        if len(inadimplentes_obj) >= _MIN_INADIMPLENTES_PARALELO:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futuros = {chave: executor.submit(funcao, *args) for chave, (funcao, args) in tarefas.items()}
+                analises = {chave: futuro.result() for chave, futuro in futuros.items()}
+        else:
+            analises = {chave: funcao(*args) for chave, (funcao, args) in tarefas.items()}
+        
+        ranking_valor = analises['ranking_por_valor']
+        metricas_gerais = analises['metricas_gerais']
+        
+        # Recomendações específicas (dependem do perfil de risco)
+        recomendacoes = self._gerar_recomendacoes_inadimplencia(inadimplentes_obj, carteira, analises['analise_risco'])
+        
+        return {
+            'inadimplentes_analisados': inadimplentes_obj,
+            **analises,
+            'recomendacoes': recomendacoes,
+            'data_analise': datetime.now(),
+            'total_inadimplentes': len(inadimplentes_obj),
+            'sumario': DelinquencySummary(
+                total_dividas=metricas_gerais['valor_total_inadimplencia'],
+                maior_devedor=ranking_valor[0]['nome'],
+                maior_divida=ranking_valor[0]['valor_divida']
+            )
+        }
+    
     def _converter_inadimplentes(self, inadimplentes: List[Dict[str, Any]]) -> List[Inadimplente]:
-        """Converte dados brutos em objetos Inadimplente"""
+        """
+        Converte dados brutos em objetos Inadimplente.
+
+        Valores com frações abaixo do centavo são arredondados a centavos (ROUND_HALF_EVEN)
+        já nos modelos, que assim coincidem com os centavos da carteira.
+        """
         inadimplentes_obj = []
+        obter_basicos = itemgetter('nome', 'valor_divida')
+        classificar_risco = self.formatter.classificar_risco_inadimplencia
         
         for inad in inadimplentes:
             try:
+                nome, valor_bruto = obter_basicos(inad)
+                valor_divida = arredondar_centavos(Decimal(str(valor_bruto)))
+                
                 # Determinar status baseado nas informações disponíveis
                 status = DebtStatus.CONFISSAO_DIVIDA  # Status padrão dos dados fornecidos
                 if 'status' in inad:
-                    status_map = {
-                        'confissao_divida': DebtStatus.CONFISSAO_DIVIDA,
-                        'em_atraso': DebtStatus.EM_ATRASO,
-                        'negociacao': DebtStatus.NEGOCIACAO,
-                        'acordo': DebtStatus.ACORDO,
-                        'juridico': DebtStatus.JURIDICO
-                    }
-                    status = status_map.get(inad['status'].lower(), DebtStatus.CONFISSAO_DIVIDA)
+                    status = _STATUS_MAP.get(inad['status'].lower(), DebtStatus.CONFISSAO_DIVIDA)
                 
                 # Calcular dias de atraso estimados (se não fornecido)
                 dias_atraso = inad.get('dias_atraso', 60)  # Estimativa padrão
                 
-                # Classificar risco baseado em valor e tempo
-                risco = self.formatter.classificar_risco_inadimplencia(
-                    inad['valor_divida'], dias_atraso
-                )
-                
                 obj = Inadimplente(
-                    nome=inad['nome'],
-                    valor_divida=Decimal(str(inad['valor_divida'])),
+                    nome=nome,
+                    valor_divida=valor_divida,
                     status=status,
                     dias_atraso=dias_atraso,
                     categoria=inad.get('categoria', 'Não informado'),
                     observacoes=inad.get('observacoes', ''),
-                    risco=risco
+                    # Classificar risco baseado em valor e tempo
+                    risco=classificar_risco(valor_divida, dias_atraso)
                 )
                 inadimplentes_obj.append(obj)
                 
@@ -118,193 +246,228 @@ class DelinquencyAnalyzer(BaseAnalyzer):
         
         return inadimplentes_obj
     
-    def _gerar_ranking_por_valor(self, inadimplentes: List[Inadimplente]) -> List[Dict[str, Any]]:
+    def _montar_carteira(self, inadimplentes: List[Inadimplente]) -> _Carteira:
+        """
+        Extrai valores, status e risco dos inadimplentes para vetores NumPy (uma passagem por campo).
+        
+        Os limites de thresholds_risco são convertidos uma única vez e seguem com a carteira.
+        """
+        n = len(inadimplentes)
+        valores = np.fromiter((float(i.valor_divida) for i in inadimplentes), dtype=np.float64, count=n)
+        ordem = np.argsort(-valores, kind='stable')
+        return _Carteira(
+            valores=valores,
+            # Valores já em centavos na conversão: o arredondamento só remove o erro de representação do float
+            centavos=np.rint(valores * 100).astype(np.int64),
+            status=np.fromiter((_CODIGO_STATUS[i.status] for i in inadimplentes), dtype=np.int8, count=n),
+            risco=np.fromiter((_CODIGO_RISCO[i.risco] for i in inadimplentes), dtype=np.int8, count=n),
+            ordem=ordem,
+            acumulado=np.cumsum(valores[ordem]),
+            limites=self._limites_float(),
+        )
+    
+    def _gerar_ranking_por_valor(self, inadimplentes: List[Inadimplente], carteira: _Carteira,
+                                 valor_total: Decimal) -> List[Dict[str, Any]]:
         """Gera ranking dos inadimplentes por valor da dívida"""
-        # Ordenar por valor decrescente
-        inadimplentes_ordenados = sorted(inadimplentes, key=lambda x: x.valor_divida, reverse=True)
+        # Ordem decrescente e total já calculados na carteira
+        ordem = carteira.ordem.tolist()
+        if self.decimal_estrito:
+            participacoes = [self._percentual(inadimplentes[k].valor_divida, valor_total) for k in ordem]
+        else:
+            participacoes = [
+                float_para_decimal(p, Decimal('0.1'))
+                for p in (carteira.valores[carteira.ordem] / carteira.acumulado[-1] * 100).tolist()
+            ]
+        
+        acoes = self._recomendar_acoes(carteira)
+        prioridades = self._calcular_prioridades_cobranca(carteira)
         
         ranking = []
-        total = len(inadimplentes)
         
-        for i, inad in enumerate(inadimplentes_ordenados, 1):
-            participacao = (inad.valor_divida / sum(i.valor_divida for i in inadimplentes)) * 100
+        for i, (indice, participacao, prioridade) in enumerate(zip(ordem, participacoes, prioridades), 1):
+            inad = inadimplentes[indice]
             
             ranking_item = {
                 'posicao': i,
                 'nome': inad.nome,
                 'valor_divida': inad.valor_divida,
-                'participacao_percentual': participacao.quantize(Decimal('0.1')),
+                'participacao_percentual': participacao,
                 'status': inad.status,
                 'risco': inad.risco,
                 'categoria': inad.categoria,
-                'recomendacao_acao': self._recomendar_acao_individual(inad),
-                'prioridade_cobranca': self._calcular_prioridade_cobranca(inad, i, total)
+                'recomendacao_acao': acoes[indice],
+                'prioridade_cobranca': prioridade
             }
             ranking.append(ranking_item)
         
         return ranking
     
-    def _recomendar_acao_individual(self, inadimplente: Inadimplente) -> str:
-        """Recomenda ação específica para cada inadimplente"""
-        if inadimplente.valor_divida >= self.thresholds_risco['valor_alto']:
-            if inadimplente.status == DebtStatus.CONFISSAO_DIVIDA:
-                return "Execução judicial imediata"
-            else:
-                return "Negociação com desconto máximo de 20%"
-        elif inadimplente.valor_divida >= self.thresholds_risco['valor_medio']:
-            return "Acordo parcelado com entrada de 30%"
-        else:
-            return "Negociação direta com flexibilidade de prazo"
+    def _recomendar_acoes(self, carteira: _Carteira, indices: Optional[np.ndarray] = None) -> List[str]:
+        """Recomenda ação específica para cada inadimplente (ordem original) ou só para os índices dados"""
+        valores = carteira.valores if indices is None else carteira.valores[indices]
+        status = carteira.status if indices is None else carteira.status[indices]
+        codigos = np.select(
+            [
+                (valores >= carteira.limites['valor_alto'])
+                & (status == _CODIGO_STATUS[DebtStatus.CONFISSAO_DIVIDA]),
+                valores >= carteira.limites['valor_alto'],
+                valores >= carteira.limites['valor_medio'],
+            ],
+            [0, 1, 2],
+            default=3
+        )
+        return [_ACOES_INDIVIDUAIS[codigo] for codigo in codigos.tolist()]
     
-    def _calcular_prioridade_cobranca(self, inadimplente: Inadimplente, posicao: int, total: int) -> str:
-        """Calcula prioridade de cobrança baseada em múltiplos fatores"""
-        score = 0
+    def _calcular_prioridades_cobranca(self, carteira: _Carteira) -> List[str]:
+        """Calcula prioridade de cobrança baseada em múltiplos fatores (na ordem do ranking)"""
+        valores = carteira.valores[carteira.ordem]
+        total = valores.shape[0]
+        posicoes = np.arange(1, total + 1)
         
         # Peso do valor (40%)
-        if inadimplente.valor_divida >= self.thresholds_risco['valor_alto']:
-            score += 40
-        elif inadimplente.valor_divida >= self.thresholds_risco['valor_medio']:
-            score += 25
-        else:
-            score += 10
-        
-        # Peso da posição no ranking (30%)
-        if posicao <= total * 0.2:  # Top 20%
-            score += 30
-        elif posicao <= total * 0.5:  # Top 50%
-            score += 20
-        else:
-            score += 10
-        
-        # Peso do status (20%)
-        status_scores = {
-            DebtStatus.CONFISSAO_DIVIDA: 20,
-            DebtStatus.EM_ATRASO: 15,
-            DebtStatus.NEGOCIACAO: 10,
-            DebtStatus.ACORDO: 5,
-            DebtStatus.JURIDICO: 15
-        }
-        score += status_scores.get(inadimplente.status, 10)
-        
-        # Peso do risco (10%)
-        risco_scores = {
-            RiskLevel.MUITO_ALTO: 10,
-            RiskLevel.ALTO: 8,
-            RiskLevel.MEDIO: 5,
-            RiskLevel.BAIXO: 3,
-            RiskLevel.MUITO_BAIXO: 1
-        }
-        score += risco_scores.get(inadimplente.risco, 5)
-        
-        # Classificar prioridade final
-        if score >= 80:
-            return "CRÍTICA"
-        elif score >= 60:
-            return "ALTA"
-        elif score >= 40:
-            return "MÉDIA"
-        else:
-            return "BAIXA"
+        score = np.select(
+            [valores >= carteira.limites['valor_alto'],
+             valores >= carteira.limites['valor_medio']],
+            [40, 25],
+            default=10
+        )
+        
+        # Peso da posição no ranking (30%): top 20%, top 50%, demais
+        score += np.select([posicoes <= total * 0.2, posicoes <= total * 0.5], [30, 20], default=10)
+        
+        # Peso do status (20%) e do risco (10%)
+        score += _SCORE_STATUS[carteira.status[carteira.ordem]]
+        score += _SCORE_RISCO[carteira.risco[carteira.ordem]]
+        
+        # Classificar prioridade final: <40 BAIXA, <60 MÉDIA, <80 ALTA, demais CRÍTICA
+        faixas = np.digitize(score, [40, 60, 80])
+        return [_PRIORIDADES_COBRANCA[faixa] for faixa in faixas.tolist()]
     
-    def _analisar_perfil_risco(self, inadimplentes: List[Inadimplente]) -> Dict[str, Any]:
+    def _analisar_perfil_risco(self, inadimplentes: List[Inadimplente], carteira: _Carteira,
+                               valor_total: Decimal) -> Dict[str, Any]:
         """Analisa o perfil de risco dos inadimplentes"""
         # Distribuição por nível de risco
-        distribuicao_risco = {}
-        for nivel in RiskLevel:
-            distribuicao_risco[nivel.value] = len([i for i in inadimplentes if i.risco == nivel])
-        
-        # Distribuição por faixa de valor
+        contagem_risco = np.bincount(carteira.risco, minlength=len(_CHAVES_RISCO))
+        distribuicao_risco = dict(zip(_CHAVES_RISCO, contagem_risco.tolist()))
+        
+        # Distribuição por faixa de valor: 0 = abaixo de 5k, 1 = 5k-20k, 2 = 20k-50k, 3 = acima de 50k
+        limites_valor = [carteira.limites[chave] for chave in ('valor_baixo', 'valor_medio', 'valor_alto')]
+        abaixo_5k, de_5k_20k, de_20k_50k, acima_50k = np.bincount(
+            np.digitize(carteira.valores, limites_valor), minlength=4
+        ).tolist()
         distribuicao_valor = {
-            'acima_50k': len([i for i in inadimplentes if i.valor_divida >= self.thresholds_risco['valor_alto']]),
-            '20k_50k': len([i for i in inadimplentes if self.thresholds_risco['valor_medio'] <= i.valor_divida < self.thresholds_risco['valor_alto']]),
-            '5k_20k': len([i for i in inadimplentes if self.thresholds_risco['valor_baixo'] <= i.valor_divida < self.thresholds_risco['valor_medio']]),
-            'abaixo_5k': len([i for i in inadimplentes if i.valor_divida < self.thresholds_risco['valor_baixo']])
+            'acima_50k': acima_50k,
+            '20k_50k': de_20k_50k,
+            '5k_20k': de_5k_20k,
+            'abaixo_5k': abaixo_5k
         }
         
         # Distribuição por status
-        distribuicao_status = {}
-        for status in DebtStatus:
-            distribuicao_status[status.value] = len([i for i in inadimplentes if i.status == status])
+        distribuicao_status = dict(zip(
+            _CHAVES_STATUS, np.bincount(carteira.status, minlength=len(_CHAVES_STATUS)).tolist()
+        ))
         
         # Análise de concentração de risco
-        inadimplentes_alto_risco = [i for i in inadimplentes if i.risco in [RiskLevel.MUITO_ALTO, RiskLevel.ALTO]]
-        concentracao_alto_risco = Decimal(str((len(inadimplentes_alto_risco) / len(inadimplentes)) * 100))
+        alto_risco = int(contagem_risco[_CODIGO_RISCO[RiskLevel.MUITO_ALTO]] + contagem_risco[_CODIGO_RISCO[RiskLevel.ALTO]])
+        concentracao_alto_risco = Decimal(str((alto_risco / len(inadimplentes)) * 100))
         
         return {
             'distribuicao_risco': distribuicao_risco,
             'distribuicao_valor': distribuicao_valor,
             'distribuicao_status': distribuicao_status,
             'concentracao_alto_risco': concentracao_alto_risco.quantize(Decimal('0.1')),
-            'inadimplentes_criticos': len([i for i in inadimplentes if i.risco == RiskLevel.MUITO_ALTO]),
-            'valor_medio_divida': (sum(i.valor_divida for i in inadimplentes) / len(inadimplentes)).quantize(Decimal('0.01')),
-            'maior_divida': max(i.valor_divida for i in inadimplentes),
-            'menor_divida': min(i.valor_divida for i in inadimplentes)
+            'inadimplentes_criticos': int(contagem_risco[_CODIGO_RISCO[RiskLevel.MUITO_ALTO]]),
+            'valor_medio_divida': self._media_valores(valor_total, len(inadimplentes)),
+            'maior_divida': inadimplentes[int(carteira.valores.argmax())].valor_divida,
+            'menor_divida': inadimplentes[int(carteira.valores.argmin())].valor_divida
         }
     
-    def _analisar_concentracao_dividas(self, inadimplentes: List[Inadimplente]) -> Dict[str, Any]:
+    def _analisar_concentracao_dividas(self, inadimplentes: List[Inadimplente], carteira: _Carteira,
+                                       valor_total: Decimal) -> Dict[str, Any]:
         """Analisa concentração das dívidas (Princípio de Pareto)"""
-        inadimplentes_ordenados = sorted(inadimplentes, key=lambda x: x.valor_divida, reverse=True)
-        valor_total = sum(i.valor_divida for i in inadimplentes)
-        
         # Análise 80/20 (Pareto)
-        valor_acumulado = Decimal('0')
         top_20_percent = max(1, int(len(inadimplentes) * 0.2))
+        valor_acumulado = self._somar_maiores(inadimplentes, carteira, top_20_percent)
         
-        for i, inad in enumerate(inadimplentes_ordenados[:top_20_percent]):
-            valor_acumulado += inad.valor_divida
-        
-        concentracao_pareto = Decimal(str((valor_acumulado / valor_total) * 100))
-        
-        # Top 3 representam quanto do total?
-        top_3_valor = sum(i.valor_divida for i in inadimplentes_ordenados[:3])
-        concentracao_top3 = Decimal(str((top_3_valor / valor_total) * 100))
-        
-        # Top 10 representam quanto do total?
-        top_10_count = min(10, len(inadimplentes))
-        top_10_valor = sum(i.valor_divida for i in inadimplentes_ordenados[:top_10_count])
-        concentracao_top10 = Decimal(str((top_10_valor / valor_total) * 100))
+        # Top 3 e top 10 representam quanto do total?
+        top_3_valor = self._somar_maiores(inadimplentes, carteira, 3)
+        top_10_valor = self._somar_maiores(inadimplentes, carteira, 10)
         
         return {
-            'concentracao_pareto_20': concentracao_pareto.quantize(Decimal('0.1')),
-            'concentracao_top3': concentracao_top3.quantize(Decimal('0.1')),
-            'concentracao_top10': concentracao_top10.quantize(Decimal('0.1')),
+            'concentracao_pareto_20': self._percentual(valor_acumulado, valor_total),
+            'concentracao_top3': self._percentual(top_3_valor, valor_total),
+            'concentracao_top10': self._percentual(top_10_valor, valor_total),
             'valor_top_20_percent': valor_acumulado,
             'valor_top_3': top_3_valor,
             'valor_top_10': top_10_valor,
-            'indice_concentracao': self._calcular_indice_gini(inadimplentes_ordenados)
+            'indice_concentracao': self._calcular_indice_gini(carteira.valores[carteira.ordem])
         }
     
-    def _calcular_indice_gini(self, inadimplentes_ordenados: List[Inadimplente]) -> Decimal:
+    def _somar_maiores(self, inadimplentes: List[Inadimplente], carteira: _Carteira, quantidade: int) -> Decimal:
+        """Soma as `quantidade` maiores dívidas em centavos exatos, na ordem decrescente da carteira"""
+        quantidade = min(quantidade, len(inadimplentes))
+        if self.decimal_estrito:
+            return sum((inadimplentes[k].valor_divida for k in carteira.ordem[:quantidade].tolist()), Decimal('0'))
+        return self._centavos_para_decimal(carteira.centavos[carteira.ordem[:quantidade]].sum())
+    
+    def _calcular_indice_gini(self, valores_ordenados: np.ndarray) -> Decimal:
         """Calcula índice de Gini para concentração das dívidas"""
-        valores = [float(i.valor_divida) for i in inadimplentes_ordenados]
-        n = len(valores)
+        n = valores_ordenados.shape[0]
         
         if n == 0:
             return Decimal('0')
         
-        # Calcular índice de Gini
-        index = list(range(1, n + 1))
-        gini = (2 * sum(index[i] * valores[i] for i in range(n))) / (n * sum(valores)) - (n + 1) / n
+        # Forma fechada: 2·Σ(i·vᵢ) / (n·Σvᵢ) - (n+1)/n, com i = 1..n
+        posicoes = np.arange(1, n + 1, dtype=np.float64)
+        gini = 2 * float(posicoes @ valores_ordenados) / (n * float(valores_ordenados.sum())) - (n + 1) / n
         
         return Decimal(str(gini)).quantize(Decimal('0.001'))
     
-    def _calcular_impacto_financeiro(self, inadimplentes: List[Inadimplente], 
-                                   receita_total: Optional[Decimal]) -> Dict[str, Any]:
+    def _somar_valores(self, inadimplentes: List[Inadimplente], carteira: _Carteira) -> Decimal:
+        """Soma os valores das dívidas (centavos int64 exatos por padrão, Decimal no modo estrito)"""
+        if self.decimal_estrito:
+            return sum((i.valor_divida for i in inadimplentes), Decimal('0'))
+        return self._centavos_para_decimal(carteira.centavos.sum())
+    
+    @staticmethod
+    def _centavos_para_decimal(centavos: int) -> Decimal:
+        """Converte centavos inteiros de volta para Decimal com duas casas"""
+        return Decimal(int(centavos)).scaleb(-2)
+    
+    def _media_valores(self, valor_total: Decimal, quantidade: int) -> Decimal:
+        """Valor médio das dívidas: total (float64 ou Decimal) dividido uma vez em Decimal, exato nos empates"""
+        return (valor_total / quantidade).quantize(Decimal('0.01'))
+    
+    def _quantizar(self, valor: Union[Decimal, float], casas: Decimal) -> Decimal:
+        """Converte um resultado intermediário (Decimal ou float) para Decimal quantizado"""
+        if isinstance(valor, Decimal):
+            return valor.quantize(casas)
+        return float_para_decimal(valor, casas)
+    
+    def _percentual(self, parte: Union[Decimal, float], total: Union[Decimal, float],
+                    casas: Decimal = Decimal('0.1')) -> Decimal:
+        """Calcula parte/total em percentual (float64 por padrão, Decimal no modo estrito)"""
+        if self.decimal_estrito:
+            parte = parte if isinstance(parte, Decimal) else Decimal(str(parte))
+            total = total if isinstance(total, Decimal) else Decimal(str(total))
+            return ((parte / total) * 100).quantize(casas)
+        return float_para_decimal(float(parte) / float(total) * 100, casas)
+    
+    def _calcular_impacto_financeiro(self, inadimplentes: List[Inadimplente], carteira: _Carteira, valor_total: Decimal,
+                                   receita_total: Optional[Union[Decimal, float]]) -> Dict[str, Any]:
         """Calcula impacto financeiro da inadimplência"""
-        valor_total_dividas = sum(i.valor_divida for i in inadimplentes)
-        
         impacto = {
-            'valor_total_inadimplencia': valor_total_dividas,
+            'valor_total_inadimplencia': valor_total,
             'numero_inadimplentes': len(inadimplentes),
-            'ticket_medio_inadimplencia': (valor_total_dividas / len(inadimplentes)).quantize(Decimal('0.01'))
+            'ticket_medio_inadimplencia': self._media_valores(valor_total, len(inadimplentes))
         }
         
         if receita_total and receita_total > 0:
-            impacto['percentual_receita'] = ((valor_total_dividas / receita_total) * 100).quantize(Decimal('0.1'))
+            impacto['percentual_receita'] = self._percentual(valor_total, receita_total)
             impacto['impacto_fluxo_caixa'] = self._classificar_impacto_fluxo(impacto['percentual_receita'])
         
         # Calcular potencial de recuperação
-        impacto['potencial_recuperacao'] = self._calcular_potencial_recuperacao(inadimplentes)
+        impacto['potencial_recuperacao'] = self._calcular_potencial_recuperacao(inadimplentes, carteira, valor_total)
         
         return impacto
     
@@ -319,112 +482,106 @@ class DelinquencyAnalyzer(BaseAnalyzer):
         else:
             return "BAIXO - Impacto mínimo no fluxo de caixa"
     
-    def _calcular_potencial_recuperacao(self, inadimplentes: List[Inadimplente]) -> Dict[str, Any]:
+    def _calcular_potencial_recuperacao(self, inadimplentes: List[Inadimplente], carteira: _Carteira,
+                                        valor_total: Decimal) -> Dict[str, Any]:
         """Calcula potencial de recuperação baseado em status e risco"""
-        # Estimativas de recuperação por status
-        taxas_recuperacao = {
-            DebtStatus.CONFISSAO_DIVIDA: Decimal('0.70'),  # 70%
-            DebtStatus.EM_ATRASO: Decimal('0.60'),         # 60%
-            DebtStatus.NEGOCIACAO: Decimal('0.80'),        # 80%
-            DebtStatus.ACORDO: Decimal('0.90'),            # 90%
-            DebtStatus.JURIDICO: Decimal('0.40')           # 40%
-        }
-        
-        recuperacao_otimista = Decimal('0')
-        recuperacao_conservadora = Decimal('0')
-        
-        for inad in inadimplentes:
-            taxa_base = taxas_recuperacao.get(inad.status, Decimal('0.50'))
-            
-            # Cenário otimista (taxa base)
-            recuperacao_otimista += inad.valor_divida * taxa_base
-            
+        if self.decimal_estrito:
+            recuperacao_otimista = sum(
+                (i.valor_divida * _TAXAS_RECUPERACAO.get(i.status, _TAXA_RECUPERACAO_PADRAO) for i in inadimplentes),
+                Decimal('0')
+            )
             # Cenário conservador (taxa base * 0.7)
-            recuperacao_conservadora += inad.valor_divida * taxa_base * Decimal('0.7')
-        
-        valor_total = sum(i.valor_divida for i in inadimplentes)
+            recuperacao_conservadora = recuperacao_otimista * Decimal('0.7')
+        else:
+            # Taxa de cada dívida obtida pelo código de status; centavos × centésimos somados
+            # em inteiros (unidades de R$ 0,0001), sem erro de arredondamento nos empates
+            recuperacao_otimista = Decimal(int(carteira.centavos @ _TAXAS_RECUPERACAO_CENTESIMOS[carteira.status])).scaleb(-4)
+            recuperacao_conservadora = recuperacao_otimista * Decimal('0.7')
         
         return {
-            'cenario_otimista': recuperacao_otimista.quantize(Decimal('0.01')),
-            'cenario_conservador': recuperacao_conservadora.quantize(Decimal('0.01')),
-            'taxa_recuperacao_otimista': ((recuperacao_otimista / valor_total) * 100).quantize(Decimal('0.1')),
-            'taxa_recuperacao_conservadora': ((recuperacao_conservadora / valor_total) * 100).quantize(Decimal('0.1')),
-            'valor_irrecuperavel_estimado': (valor_total - recuperacao_conservadora).quantize(Decimal('0.01'))
+            'cenario_otimista': self._quantizar(recuperacao_otimista, Decimal('0.01')),
+            'cenario_conservador': self._quantizar(recuperacao_conservadora, Decimal('0.01')),
+            'taxa_recuperacao_otimista': self._percentual(recuperacao_otimista, valor_total),
+            'taxa_recuperacao_conservadora': self._percentual(recuperacao_conservadora, valor_total),
+            'valor_irrecuperavel_estimado': self._quantizar(valor_total - recuperacao_conservadora, Decimal('0.01'))
         }
     
-    def _gerar_estrategias_recuperacao(self, inadimplentes: List[Inadimplente]) -> Dict[str, Any]:
+    def _gerar_estrategias_recuperacao(self, inadimplentes: List[Inadimplente], carteira: _Carteira) -> Dict[str, Any]:
         """Gera estratégias específicas de recuperação"""
-        estrategias = {
-            'acao_imediata': [],
-            'negociacao_prioritaria': [],
-            'monitoramento_ativo': [],
-            'juridico': []
-        }
-        
-        for inad in inadimplentes:
-            if inad.risco == RiskLevel.MUITO_ALTO and inad.valor_divida >= self.thresholds_risco['valor_alto']:
-                estrategias['acao_imediata'].append({
-                    'nome': inad.nome,
-                    'valor': inad.valor_divida,
-                    'acao': 'Execução judicial ou acordo com desconto máximo de 15%',
-                    'prazo': '7 dias'
-                })
-            elif inad.valor_divida >= self.thresholds_risco['valor_medio']:
-                estrategias['negociacao_prioritaria'].append({
-                    'nome': inad.nome,
-                    'valor': inad.valor_divida,
-                    'acao': 'Negociação ativa com proposta de parcelamento',
-                    'prazo': '15 dias'
-                })
-            elif inad.risco in [RiskLevel.ALTO, RiskLevel.MEDIO]:
-                estrategias['monitoramento_ativo'].append({
-                    'nome': inad.nome,
-                    'valor': inad.valor_divida,
-                    'acao': 'Contato semanal e acompanhamento próximo',
-                    'prazo': '30 dias'
-                })
-            else:
-                estrategias['juridico'].append({
-                    'nome': inad.nome,
-                    'valor': inad.valor_divida,
-                    'acao': 'Análise jurídica para execução',
-                    'prazo': '45 dias'
-                })
+        valores = carteira.valores
+        faixas = np.select(
+            [
+                (carteira.risco == _CODIGO_RISCO[RiskLevel.MUITO_ALTO])
+                & (valores >= carteira.limites['valor_alto']),
+                valores >= carteira.limites['valor_medio'],
+                np.isin(carteira.risco, [_CODIGO_RISCO[RiskLevel.ALTO], _CODIGO_RISCO[RiskLevel.MEDIO]]),
+            ],
+            [0, 1, 2],
+            default=3
+        )
+        
+        estrategias = {}
+        for faixa, (chave, acao, prazo) in enumerate(_ESTRATEGIAS_RECUPERACAO):
+            estrategias[chave] = [
+                {
+                    'nome': inadimplentes[indice].nome,
+                    'valor': inadimplentes[indice].valor_divida,
+                    'acao': acao,
+                    'prazo': prazo
+                }
+                for indice in np.flatnonzero(faixas == faixa).tolist()
+            ]
         
         return estrategias
     
-    def _calcular_metricas_inadimplencia(self, inadimplentes: List[Inadimplente], 
-                                       receita_total: Optional[Decimal]) -> Dict[str, Any]:
+    def _calcular_metricas_inadimplencia(self, inadimplentes: List[Inadimplente], carteira: _Carteira,
+                                       valor_total: Decimal,
+                                       receita_total: Optional[Union[Decimal, float]]) -> Dict[str, Any]:
         """Calcula métricas gerais de inadimplência"""
-        valor_total = sum(i.valor_divida for i in inadimplentes)
+        n = len(inadimplentes)
+        if self.decimal_estrito:
+            media = valor_total / n
+            acima_media = sum(1 for i in inadimplentes if i.valor_divida > media)
+        else:
+            # valor > total/n comparado em centavos inteiros (valor·n > total), sem erro de arredondamento
+            acima_media = int(np.count_nonzero(carteira.centavos * n > int(valor_total.scaleb(2))))
+        alto_risco = np.isin(carteira.risco, [_CODIGO_RISCO[RiskLevel.MUITO_ALTO], _CODIGO_RISCO[RiskLevel.ALTO]])
         
         metricas = {
             'valor_total_inadimplencia': valor_total,
             'numero_total_inadimplentes': len(inadimplentes),
-            'ticket_medio': (valor_total / len(inadimplentes)).quantize(Decimal('0.01')),
-            'mediana_valores': self._calcular_mediana_valores(inadimplentes),
-            'inadimplentes_acima_media': len([i for i in inadimplentes if i.valor_divida > (valor_total / len(inadimplentes))]),
-            'concentracao_risco_alto': len([i for i in inadimplentes if i.risco in [RiskLevel.MUITO_ALTO, RiskLevel.ALTO]])
+            'ticket_medio': self._media_valores(valor_total, len(inadimplentes)),
+            'mediana_valores': self._calcular_mediana_valores(inadimplentes, carteira),
+            'inadimplentes_acima_media': acima_media,
+            'concentracao_risco_alto': int(np.count_nonzero(alto_risco))
         }
         
         if receita_total and receita_total > 0:
-            metricas['taxa_inadimplencia_receita'] = ((valor_total / receita_total) * 100).quantize(Decimal('0.1'))
+            metricas['taxa_inadimplencia_receita'] = self._percentual(valor_total, receita_total)
         
         return metricas
     
-    def _calcular_mediana_valores(self, inadimplentes: List[Inadimplente]) -> Decimal:
-        """Calcula mediana dos valores de dívida"""
-        valores = sorted([i.valor_divida for i in inadimplentes])
-        n = len(valores)
+    def _calcular_mediana_valores(self, inadimplentes: List[Inadimplente], carteira: _Carteira) -> Decimal:
+        """Calcula mediana dos valores de dívida (seleção parcial em O(n) por padrão)"""
+        n = len(inadimplentes)
+        meio = n // 2
+        
+        if self.decimal_estrito:
+            valores = sorted([i.valor_divida for i in inadimplentes])
+            if n % 2 == 0:
+                mediana = (valores[meio - 1] + valores[meio]) / 2
+            else:
+                mediana = valores[meio]
+            return mediana.quantize(Decimal('0.01'))
         
         if n % 2 == 0:
-            mediana = (valores[n//2 - 1] + valores[n//2]) / 2
-        else:
-            mediana = valores[n//2]
-        
-        return mediana.quantize(Decimal('0.01'))
+            # Média dos dois centrais em Decimal (repr recupera o valor de entrada), exata nos empates
+            particionados = np.partition(carteira.valores, [meio - 1, meio]).tolist()
+            mediana = (Decimal(repr(particionados[meio - 1])) + Decimal(repr(particionados[meio]))) / 2
+            return mediana.quantize(Decimal('0.01'))
+        return float_para_decimal(np.partition(carteira.valores, meio)[meio])
     
-    def _gerar_recomendacoes_inadimplencia(self, inadimplentes: List[Inadimplente], 
+    def _gerar_recomendacoes_inadimplencia(self, inadimplentes: List[Inadimplente], carteira: _Carteira,
                                          analise_risco: Dict[str, Any]) -> List[str]:
         """Gera recomendações específicas para inadimplência"""
         recomendacoes = []
@@ -437,11 +594,12 @@ class DelinquencyAnalyzer(BaseAnalyzer):
             )
         
         # Recomendações para top inadimplentes
-        top_3 = sorted(inadimplentes, key=lambda x: x.valor_divida, reverse=True)[:3]
-        for i, inad in enumerate(top_3, 1):
+        top_3 = carteira.ordem[:3]
+        for i, (indice, acao) in enumerate(zip(top_3.tolist(), self._recomendar_acoes(carteira, top_3)), 1):
+            inad = inadimplentes[indice]
             recomendacoes.append(
                 f"🎯 TOP {i} - {inad.nome}: {self.formatter.formatar_moeda(inad.valor_divida, compacto=True)} "
-                f"({inad.status.value}). {self._recomendar_acao_individual(inad)}"
+                f"({inad.status.value}). {acao}"
             )
         
         # Recomendação geral de processo
@@ -463,6 +621,8 @@ class DelinquencyAnalyzer(BaseAnalyzer):
         
         metricas = analise_inadimplencia['metricas_gerais']
         impacto = analise_inadimplencia['impacto_financeiro']
+        ranking = analise_inadimplencia['ranking_por_valor']
+        recuperacao = impacto['potencial_recuperacao']
         
         # Resumo executivo
         relatorio.append("📊 RESUMO EXECUTIVO:")
@@ -476,7 +636,6 @@ class DelinquencyAnalyzer(BaseAnalyzer):
         relatorio.append("")
         
         # Ranking dos maiores
-        ranking = analise_inadimplencia['ranking_por_valor']
         relatorio.append("🏆 TOP 5 MAIORES INADIMPLENTES:")
         for item in ranking[:5]:
             relatorio.append(f"   {item['posicao']}º - {item['nome']}:")
@@ -487,7 +646,6 @@ class DelinquencyAnalyzer(BaseAnalyzer):
             relatorio.append("")
         
         # Potencial de recuperação
-        recuperacao = analise_inadimplencia['impacto_financeiro']['potencial_recuperacao']
         relatorio.append("💰 POTENCIAL DE RECUPERAÇÃO:")
         relatorio.append(f"   • Cenário Otimista: {self.formatter.formatar_moeda(recuperacao['cenario_otimista'], compacto=True)} "
                         f"({self.formatter.formatar_porcentagem(recuperacao['taxa_recuperacao_otimista'])})")
@@ -4,15 +4,132 @@ Baseado nos dados reais do Shopping Park Botucatu.
 """
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Mapping, Optional, Any, Tuple, NamedTuple
 from datetime import datetime
+from types import MappingProxyType
+
+import numpy as np
 
 from ..core.models import KPIFinanceiro, ConfiguracaoAnalise
-from ..core.enums import StatusKPI, InsightType, InsightPriority
-from ..core.exceptions import CalculationError, InsufficientDataError
+from ..core.enums import StatusKPI, KPICategoria
+from ..core.exceptions import CalculationError
+from ..core.money import float_para_decimal
+from ..core.summaries import KpiSummary
 from ..formatters.brazilian import BrazilianFormatter
 
 
+# KPIs com thresholds padrão, na ordem das linhas de _LIMITES_PADRAO
+_KPIS_PADRAO = (
+    'receita_total',
+    'taxa_inadimplencia',
+    'saldo_operacional',
+    'saldo_projetado',
+    'despesa_total',
+    'recebidos_atraso',
+)
+_INDICE_KPI_PADRAO = {nome: i for i, nome in enumerate(_KPIS_PADRAO)}
+
+# Limites padrão [critico, atencao, bom] por KPI
+_LIMITES_PADRAO = np.array([
+    [10000000, 15000000, 20000000],
+    [50, 20, 10],                    # Invertido (menor é melhor)
+    [0, 1000000, 2000000],
+    [0, 2000000, 4000000],
+    [20000000, 15000000, 10000000],  # Invertido
+    [200, 100, 50],                  # Invertido
+], dtype=np.float64)
+_LIMITES_PADRAO.setflags(write=False)
+
+# Visão somente leitura dos limites padrão por nome, exposta em KPIAnalyzer.thresholds_padrao
+_THRESHOLDS_PADRAO = MappingProxyType({
+    nome: MappingProxyType(dict(zip(('critico', 'atencao', 'bom'), limites)))
+    for nome, limites in zip(_KPIS_PADRAO, _LIMITES_PADRAO.tolist())
+})
+
+# KPIs onde menor valor é melhor (invertidos)
+_INVERTIDOS_PADRAO = np.array([False, True, False, False, True, True])
+_KPIS_INVERTIDOS = frozenset(nome for nome, invertido in zip(_KPIS_PADRAO, _INVERTIDOS_PADRAO) if invertido)
+
+# Termos do nome de exibição que definem a categoria, em ordem de precedência
+_TERMOS_CATEGORIA = (
+    ('inadimplência', KPICategoria.INADIMPLENCIA),
+    ('receita', KPICategoria.RECEITA),
+    ('saldo', KPICategoria.SALDO),
+    ('despesa', KPICategoria.DESPESA),
+)
+
+# Responsável sugerido por categoria
+_RESPONSAVEL_POR_CATEGORIA = {
+    KPICategoria.INADIMPLENCIA: "Gerência Financeira + Jurídico",
+    KPICategoria.RECEITA: "Gerência Comercial + Marketing",
+    KPICategoria.DESPESA: "Gerência Administrativa",
+}
+
+# Status por código de classificação (0 = crítico ... 3 = excelente)
+_STATUS_POR_CODIGO = (StatusKPI.CRITICO, StatusKPI.ATENCAO, StatusKPI.BOM, StatusKPI.EXCELENTE)
+
+# Chaves do resumo de status, na ordem dos códigos
+_CHAVES_RESUMO_STATUS = ("critico", "atencao", "bom", "excelente")
+
+# Observações por código, separadas para KPIs normais (False) e invertidos (True)
+_OBSERVACOES_STATUS = {
+    False: (
+        "Valor muito baixo, requer ação imediata",
+        "Valor abaixo do ideal, monitorar",
+        "Valor dentro do esperado",
+        "Valor acima das expectativas",
+    ),
+    True: (
+        "Valor muito alto, requer ação imediata",
+        "Valor acima do ideal, monitorar",
+        "Valor dentro do aceitável",
+        "Valor excelente",
+    ),
+}
+
+# Cabeçalho fixo do relatório de KPIs
+_CABECALHO_RELATORIO = "=" * 60 + "\n📊 ANÁLISE DE KPIs FINANCEIROS\n" + "=" * 60 + "\n"
+
+
+class _EntradaKPI(NamedTuple):
+    """Dados de um KPI que dependem apenas do nome e da configuração"""
+    nome_exibicao: str
+    categoria: KPICategoria
+    unidade: str
+    limites: Tuple[float, float, float]
+    invertido: bool
+    sem_limites: bool
+    meta: Optional[Decimal]
+
+
+def _classificar_status_lote(valores: np.ndarray, limites: np.ndarray,
+                             invertidos: np.ndarray, sem_limites: np.ndarray) -> np.ndarray:
+    """
+    Classifica vários KPIs de uma vez.
+    
+    Para KPIs normais o primeiro limite com valor <= limite define o código; para os invertidos,
+    o primeiro com valor >= limite. Nenhum atingido = 3 (excelente); sem thresholds = 2 (bom).
+    
+    Args:
+        valores: Array float64 (K,) com os valores dos KPIs
+        limites: Array (K, 3) com os limites [critico, atencao, bom]
+        invertidos: Máscara bool (K,) dos KPIs onde menor é melhor
+        sem_limites: Máscara bool (K,) dos KPIs sem thresholds configurados
+        
+    Returns:
+        Array int8 (K,) com os códigos 0-3 (índices de _STATUS_POR_CODIGO)
+    """
+    n = valores.shape[0]
+    coluna = valores[:, None]
+    # Coluna extra sempre atingida: o argmax devolve 3 quando nenhum limite é atingido
+    atingidos = np.ones((n, 4), dtype=bool)
+    np.greater_equal(coluna, limites, out=atingidos[:, :3], where=invertidos[:, None])
+    np.less_equal(coluna, limites, out=atingidos[:, :3], where=~invertidos[:, None])
+    codigos = atingidos.argmax(axis=1).astype(np.int8)
+    codigos[sem_limites] = 2
+    return codigos
+
+
 class BaseAnalyzer(ABC):
     """Classe base abstrata para todos os analisadores"""
     
@@ -29,16 +146,27 @@ class BaseAnalyzer(ABC):
 class KPIAnalyzer(BaseAnalyzer):
     """Analisador especializado em KPIs financeiros"""
     
+    _EMOJI_STATUS = {
+        StatusKPI.CRITICO: "🔴",
+        StatusKPI.ATENCAO: "🟡",
+        StatusKPI.BOM: "🟢",
+        StatusKPI.EXCELENTE: "🌟",
+    }
+    
     def __init__(self, configuracao: Optional[ConfiguracaoAnalise] = None):
         super().__init__(configuracao)
-        self.thresholds_padrao = {
-            'receita_total': {'critico': 10000000, 'atencao': 15000000, 'bom': 20000000},
-            'taxa_inadimplencia': {'critico': 50, 'atencao': 20, 'bom': 10},  # Invertido (menor é melhor)
-            'saldo_operacional': {'critico': 0, 'atencao': 1000000, 'bom': 2000000},
-            'saldo_projetado': {'critico': 0, 'atencao': 2000000, 'bom': 4000000},
-            'despesa_total': {'critico': 20000000, 'atencao': 15000000, 'bom': 10000000},  # Invertido
-            'recebidos_atraso': {'critico': 200, 'atencao': 100, 'bom': 50}  # Invertido
-        }
+        # Tabela de KPIs pré-calculada por nome, válida para os thresholds e metas da assinatura
+        self._tabela_kpis: Dict[str, _EntradaKPI] = {}
+        self._assinatura_tabela: Optional[Tuple] = None
+    
+    @property
+    def thresholds_padrao(self) -> Mapping[str, Mapping[str, float]]:
+        """
+        Limites padrão [critico, atencao, bom] por KPI (somente leitura).
+        
+        Para personalizar limites use `configuracao.thresholds_kpi`, que tem precedência.
+        """
+        return _THRESHOLDS_PADRAO
     
     def analisar(self, dados_kpis: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -51,27 +179,53 @@ class KPIAnalyzer(BaseAnalyzer):
             Dict com análise completa dos KPIs
         """
         try:
+            # Data única da análise, compartilhada por todos os KPIs
+            agora = datetime.now()
+            itens = list(dados_kpis.items())
+            self._sincronizar_tabela_kpis()
+            entradas = [self._obter_entrada_kpi(nome) for nome, _ in itens]
+            valores = [self._converter_valor_kpi(nome, valor) for nome, valor in itens]
+            
+            # Classificar todos os KPIs de uma vez
+            invertidos = np.fromiter((e.invertido for e in entradas), dtype=bool, count=len(entradas))
+            sem_limites = np.fromiter((e.sem_limites for e in entradas), dtype=bool, count=len(entradas))
+            codigos = _classificar_status_lote(
+                np.fromiter((float(v) for v in valores), dtype=np.float64, count=len(valores)),
+                np.array([e.limites for e in entradas], dtype=np.float64).reshape(-1, 3),
+                invertidos, sem_limites
+            )
+            
             kpis_analisados = []
-            resumo_status = {"critico": 0, "atencao": 0, "bom": 0, "excelente": 0}
             
-            # Analisar cada KPI individualmente
-            for nome_kpi, valor in dados_kpis.items():
-                kpi_analise = self._analisar_kpi_individual(nome_kpi, valor)
-                kpis_analisados.append(kpi_analise)
-                
-                # Contar status para resumo
-                status_lower = kpi_analise.status.value.lower()
-                if status_lower in resumo_status:
-                    resumo_status[status_lower] += 1
+            # Montar cada KPI com o status já classificado
+            for (nome_kpi, _), entrada, valor, codigo in zip(itens, entradas, valores, codigos.tolist()):
+                if entrada.sem_limites:
+                    status, observacao = StatusKPI.BOM, "Thresholds não configurados"
+                else:
+                    status, observacao = _STATUS_POR_CODIGO[codigo], _OBSERVACOES_STATUS[entrada.invertido][codigo]
+                kpis_analisados.append(
+                    self._analisar_kpi_individual(nome_kpi, entrada, valor, status, observacao, agora)
+                )
+            
+            # Contar status para resumo
+            contagem = np.bincount(codigos, minlength=4).tolist()
+            resumo_status = dict(zip(_CHAVES_RESUMO_STATUS, contagem))
             
             # Calcular score geral de saúde financeira
             score_saude = self._calcular_score_saude_financeira(kpis_analisados)
             
-            # Identificar KPIs críticos
-            kpis_criticos = [kpi for kpi in kpis_analisados if kpi.status == StatusKPI.CRITICO]
-            
-            # Gerar recomendações específicas
-            recomendacoes = self._gerar_recomendacoes_kpis(kpis_analisados)
+            # Recomendações e ações só existem para KPIs críticos ou em atenção
+            if contagem[0] == 0 and contagem[1] == 0:
+                kpis_criticos, recomendacoes, prioridades_acao = [], [], []
+            else:
+                # Identificar KPIs críticos
+                kpis_criticos = [kpis_analisados[i] for i in np.flatnonzero(codigos == 0).tolist()]
+                
+                # Gerar recomendações específicas
+                recomendacoes = self._gerar_recomendacoes_kpis(
+                    [kpis_analisados[i] for i in np.flatnonzero(codigos <= 1).tolist()]
+                )
+                prioridades_acao = self._priorizar_acoes(kpis_criticos)
             
             return {
                 'kpis_analisados': kpis_analisados,
@@ -80,80 +234,109 @@ class KPIAnalyzer(BaseAnalyzer):
                 'kpis_criticos': kpis_criticos,
                 'total_kpis': len(kpis_analisados),
                 'recomendacoes': recomendacoes,
-                'data_analise': datetime.now(),
-                'prioridades_acao': self._priorizar_acoes(kpis_criticos)
+                'data_analise': agora,
+                'prioridades_acao': prioridades_acao,
+                'sumario': KpiSummary(score=score_saude, n_criticos=len(kpis_criticos))
             }
             
         except Exception as e:
             raise CalculationError("analise_kpis", str(e)) from e
     
-    def _analisar_kpi_individual(self, nome: str, valor: Any) -> KPIFinanceiro:
-        """Analisa um KPI individual"""
+    def _converter_valor_kpi(self, nome: str, valor: Any) -> Decimal:
+        """Converte o valor bruto do KPI para Decimal (valor exposto no modelo)"""
         try:
-            valor_decimal = Decimal(str(valor))
-            nome_normalizado = nome.lower().replace(' ', '_')
-            
-            # Obter thresholds específicos
-            thresholds = self.configuracao.thresholds_kpi.get(
-                nome_normalizado, 
-                self.thresholds_padrao.get(nome_normalizado, {})
-            )
-            
-            # Determinar status baseado no tipo de KPI
-            status, observacao = self._classificar_status_kpi(nome_normalizado, valor_decimal, thresholds)
-            
-            # Determinar unidade
-            unidade = self._determinar_unidade_kpi(nome_normalizado)
-            
-            # Calcular variação se houver meta
-            meta = self._obter_meta_kpi(nome_normalizado)
+            return Decimal(str(valor))
+        except Exception as e:
+            raise CalculationError(f"analise_kpi_{nome}", str(e)) from e
+    
+    def _sincronizar_tabela_kpis(self) -> None:
+        """
+        Descarta a tabela de KPIs quando thresholds ou metas mudam.
+        
+        A assinatura usa o conteúdo da configuração, de modo que tanto substituir
+        `configuracao` quanto alterá-la no lugar refazem a tabela.
+        """
+        configuracao = self.configuracao
+        assinatura = (
+            tuple(sorted(
+                (nome, tuple(sorted((chave, str(valor)) for chave, valor in limites.items())))
+                for nome, limites in configuracao.thresholds_kpi.items()
+            )),
+            tuple(sorted((nome, str(meta)) for nome, meta in (configuracao.metas_mensais or {}).items())),
+        )
+        if assinatura != self._assinatura_tabela:
+            self._tabela_kpis = {}
+            self._assinatura_tabela = assinatura
+    
+    def _obter_entrada_kpi(self, nome: str) -> _EntradaKPI:
+        """Obtém os dados pré-calculados do KPI (nome, unidade, limites e meta)"""
+        entrada = self._tabela_kpis.get(nome)
+        if entrada is None:
+            entrada = self._tabela_kpis[nome] = self._montar_entrada_kpi(nome)
+        return entrada
+    
+    def _montar_entrada_kpi(self, nome: str) -> _EntradaKPI:
+        """Monta a entrada da tabela de KPIs para um nome"""
+        nome_normalizado = nome.lower().replace(' ', '_')
+        
+        invertido = nome_normalizado in _KPIS_INVERTIDOS
+        
+        # Thresholds da configuração têm precedência sobre os padrão
+        thresholds = self.configuracao.thresholds_kpi.get(nome_normalizado)
+        if thresholds is not None:
+            # Limite ausente nunca é atingido: +inf nos invertidos, 0 nos demais
+            padrao = float('inf') if invertido else 0
+            limites = tuple(float(thresholds.get(chave, padrao)) for chave in ('critico', 'atencao', 'bom'))
+            sem_limites = not thresholds
+        elif nome_normalizado in _INDICE_KPI_PADRAO:
+            limites = tuple(_LIMITES_PADRAO[_INDICE_KPI_PADRAO[nome_normalizado]].tolist())
+            sem_limites = False
+        else:
+            limites, sem_limites = (0.0, 0.0, 0.0), True
+        
+        nome_exibicao = nome.replace('_', ' ').title()
+        nome_minusculo = nome_exibicao.lower()
+        categoria = next(
+            (categoria for termo, categoria in _TERMOS_CATEGORIA if termo in nome_minusculo),
+            KPICategoria.OUTROS
+        )
+        
+        return _EntradaKPI(
+            nome_exibicao=nome_exibicao,
+            categoria=categoria,
+            unidade=self._determinar_unidade_kpi(nome_normalizado),
+            limites=limites,
+            invertido=invertido,
+            sem_limites=sem_limites,
+            meta=self._obter_meta_kpi(nome_normalizado)
+        )
+    
+    def _analisar_kpi_individual(self, nome: str, entrada: _EntradaKPI, valor_decimal: Decimal,
+                                 status: StatusKPI, observacao: str, data_referencia: datetime) -> KPIFinanceiro:
+        """Monta um KPI individual já classificado"""
+        try:
+            # Calcular variação se houver meta (em float64)
+            meta = entrada.meta
             variacao = None
             if meta:
-                variacao = ((valor_decimal - meta) / meta) * 100
+                meta_float = float(meta)
+                variacao = float_para_decimal((float(valor_decimal) - meta_float) / meta_float * 100)
             
             return KPIFinanceiro(
-                nome=nome.replace('_', ' ').title(),
+                nome=entrada.nome_exibicao,
                 valor=valor_decimal,
-                unidade=unidade,
+                unidade=entrada.unidade,
                 status=status,
+                categoria=entrada.categoria,
                 meta=meta,
                 variacao_percentual=variacao,
                 observacoes=observacao,
-                data_referencia=datetime.now()
+                data_referencia=data_referencia
             )
             
         except Exception as e:
             raise CalculationError(f"analise_kpi_{nome}", str(e)) from e
     
-    def _classificar_status_kpi(self, nome_kpi: str, valor: Decimal, thresholds: Dict) -> tuple:
-        """Classifica o status de um KPI específico"""
-        if not thresholds:
-            return StatusKPI.BOM, "Thresholds não configurados"
-        
-        # KPIs onde menor valor é melhor (invertidos)
-        kpis_invertidos = ['taxa_inadimplencia', 'despesa_total', 'recebidos_atraso']
-        
-        if nome_kpi in kpis_invertidos:
-            # Para KPIs invertidos, usar lógica contrária
-            if valor >= thresholds.get('critico', float('inf')):
-                return StatusKPI.CRITICO, "Valor muito alto, requer ação imediata"
-            elif valor >= thresholds.get('atencao', float('inf')):
-                return StatusKPI.ATENCAO, "Valor acima do ideal, monitorar"
-            elif valor >= thresholds.get('bom', float('inf')):
-                return StatusKPI.BOM, "Valor dentro do aceitável"
-            else:
-                return StatusKPI.EXCELENTE, "Valor excelente"
-        else:
-            # Para KPIs normais, maior valor é melhor
-            if valor <= thresholds.get('critico', 0):
-                return StatusKPI.CRITICO, "Valor muito baixo, requer ação imediata"
-            elif valor <= thresholds.get('atencao', 0):
-                return StatusKPI.ATENCAO, "Valor abaixo do ideal, monitorar"
-            elif valor <= thresholds.get('bom', 0):
-                return StatusKPI.BOM, "Valor dentro do esperado"
-            else:
-                return StatusKPI.EXCELENTE, "Valor acima das expectativas"
-    
     def _determinar_unidade_kpi(self, nome_kpi: str) -> str:
         """Determina a unidade apropriada para cada KPI"""
         unidades = {
@@ -186,33 +369,33 @@ class KPIAnalyzer(BaseAnalyzer):
         }
         
         total_pontos = sum(pesos_status.get(kpi.status, 0) for kpi in kpis)
-        score = Decimal(total_pontos) / Decimal(len(kpis))
         
-        return score.quantize(Decimal('0.1'))
+        # Média em float; float_para_decimal arredonda empates (ex.: 31.25) como a divisão Decimal
+        return float_para_decimal(total_pontos / len(kpis), Decimal('0.1'))
     
     def _gerar_recomendacoes_kpis(self, kpis: List[KPIFinanceiro]) -> List[str]:
         """Gera recomendações específicas baseadas nos KPIs"""
         recomendacoes = []
         
         for kpi in kpis:
-            if kpi.status == StatusKPI.CRITICO:
-                if 'inadimplência' in kpi.nome.lower():
+            if kpi.status is StatusKPI.CRITICO:
+                if kpi.categoria is KPICategoria.INADIMPLENCIA:
                     recomendacoes.append(
                         f"🚨 {kpi.nome}: Implementar estratégia urgente de recuperação de crédito. "
                         f"Taxa atual de {self.formatter.formatar_porcentagem(kpi.valor)} está crítica."
                     )
-                elif 'receita' in kpi.nome.lower():
+                elif kpi.categoria is KPICategoria.RECEITA:
                     recomendacoes.append(
                         f"📉 {kpi.nome}: Revisar estratégia comercial e campanhas de marketing. "
                         f"Valor atual de {self.formatter.formatar_moeda(kpi.valor, compacto=True)} abaixo do esperado."
                     )
-                elif 'saldo' in kpi.nome.lower():
+                elif kpi.categoria is KPICategoria.SALDO:
                     recomendacoes.append(
                         f"💰 {kpi.nome}: Urgente revisão do fluxo de caixa. "
                         f"Saldo de {self.formatter.formatar_moeda(kpi.valor, compacto=True)} requer atenção imediata."
                     )
             
-            elif kpi.status == StatusKPI.ATENCAO:
+            elif kpi.status is StatusKPI.ATENCAO:
                 recomendacoes.append(
                     f"⚠️ {kpi.nome}: Monitorar de perto e implementar ações preventivas. "
                     f"Valor atual: {self._formatar_valor_kpi(kpi)}"
@@ -221,26 +404,26 @@ class KPIAnalyzer(BaseAnalyzer):
         return recomendacoes
     
     def _formatar_valor_kpi(self, kpi: KPIFinanceiro) -> str:
-        """Formata o valor do KPI conforme sua unidade"""
+        """Formata o valor do KPI conforme sua unidade (o formatter já memoriza os textos)"""
         if kpi.unidade == 'R$':
             return self.formatter.formatar_moeda(kpi.valor, compacto=True)
-        elif kpi.unidade == '%':
+        if kpi.unidade == '%':
             return self.formatter.formatar_porcentagem(kpi.valor)
-        else:
-            return str(kpi.valor)
+        return str(kpi.valor)
     
     def _priorizar_acoes(self, kpis_criticos: List[KPIFinanceiro]) -> List[Dict[str, Any]]:
         """Prioriza ações baseadas na criticidade e impacto"""
         acoes_priorizadas = []
         
-        # Ordenar por impacto (valor absoluto para KPIs em R$)
-        kpis_ordenados = sorted(
-            kpis_criticos, 
-            key=lambda k: abs(k.valor) if k.unidade == 'R$' else k.valor, 
-            reverse=True
+        # Ordenar por impacto (valor absoluto para KPIs em R$), estável como sorted(reverse=True)
+        impactos = np.fromiter(
+            (float(abs(k.valor)) if k.unidade == 'R$' else float(k.valor) for k in kpis_criticos),
+            dtype=np.float64, count=len(kpis_criticos)
         )
+        ordem = np.argsort(-impactos, kind='stable')
         
-        for i, kpi in enumerate(kpis_ordenados, 1):
+        for i, indice in enumerate(ordem.tolist(), 1):
+            kpi = kpis_criticos[indice]
             acao = {
                 'prioridade': i,
                 'kpi': kpi.nome,
@@ -257,78 +440,56 @@ class KPIAnalyzer(BaseAnalyzer):
         """Calcula o impacto financeiro potencial"""
         if kpi.unidade == 'R$':
             return f"Alto - {self.formatter.formatar_moeda(abs(kpi.valor), compacto=True)}"
-        elif 'inadimplência' in kpi.nome.lower():
+        elif kpi.categoria is KPICategoria.INADIMPLENCIA:
             return "Muito Alto - Impacta fluxo de caixa diretamente"
         else:
             return "Médio - Monitoramento necessário"
     
     def _sugerir_prazo_acao(self, kpi: KPIFinanceiro) -> str:
         """Sugere prazo para ação baseado na criticidade"""
-        if 'inadimplência' in kpi.nome.lower():
+        if kpi.categoria is KPICategoria.INADIMPLENCIA:
             return "0-15 dias"
-        elif 'saldo' in kpi.nome.lower() and kpi.valor <= 0:
+        elif kpi.categoria is KPICategoria.SALDO and kpi.valor <= 0:
             return "0-7 dias"
         else:
             return "15-30 dias"
     
     def _sugerir_responsavel(self, kpi: KPIFinanceiro) -> str:
         """Sugere responsável pela ação"""
-        if 'inadimplência' in kpi.nome.lower():
-            return "Gerência Financeira + Jurídico"
-        elif 'receita' in kpi.nome.lower():
-            return "Gerência Comercial + Marketing"
-        elif 'despesa' in kpi.nome.lower():
-            return "Gerência Administrativa"
-        else:
-            return "Diretoria Executiva"
+        return _RESPONSAVEL_POR_CATEGORIA.get(kpi.categoria, "Diretoria Executiva")
     
     def gerar_relatorio_kpis(self, analise_kpis: Dict[str, Any]) -> str:
         """Gera relatório formatado dos KPIs"""
-        relatorio = []
-        relatorio.append("=" * 60)
-        relatorio.append("📊 ANÁLISE DE KPIs FINANCEIROS")
-        relatorio.append("=" * 60)
-        relatorio.append("")
-        
         # Resumo geral
         resumo = analise_kpis['resumo_status']
         score = analise_kpis['score_saude_financeira']
         
-        relatorio.append("🎯 RESUMO EXECUTIVO:")
-        relatorio.append(f"   • Score de Saúde Financeira: {score}/100")
-        relatorio.append(f"   • KPIs Críticos: {resumo['critico']}")
-        relatorio.append(f"   • KPIs em Atenção: {resumo['atencao']}")
-        relatorio.append(f"   • KPIs Bons/Excelentes: {resumo['bom'] + resumo['excelente']}")
-        relatorio.append("")
+        relatorio = [
+            _CABECALHO_RELATORIO,
+            "🎯 RESUMO EXECUTIVO:\n"
+            f"   • Score de Saúde Financeira: {score}/100\n"
+            f"   • KPIs Críticos: {resumo['critico']}\n"
+            f"   • KPIs em Atenção: {resumo['atencao']}\n"
+            f"   • KPIs Bons/Excelentes: {resumo['bom'] + resumo['excelente']}\n",
+            "📈 DETALHAMENTO DOS KPIs:",
+        ]
         
         # Detalhamento dos KPIs
-        relatorio.append("📈 DETALHAMENTO DOS KPIs:")
+        emojis = self._EMOJI_STATUS
         for kpi in analise_kpis['kpis_analisados']:
-            emoji = self._obter_emoji_status(kpi.status)
-            valor_formatado = self._formatar_valor_kpi(kpi)
-            
-            relatorio.append(f"   {emoji} {kpi.nome}:")
-            relatorio.append(f"      Valor: {valor_formatado}")
-            relatorio.append(f"      Status: {kpi.status.value}")
+            bloco = (
+                f"   {emojis.get(kpi.status, '⚪')} {kpi.nome}:\n"
+                f"      Valor: {self._formatar_valor_kpi(kpi)}\n"
+                f"      Status: {kpi.status.value}"
+            )
             if kpi.observacoes:
-                relatorio.append(f"      Observação: {kpi.observacoes}")
-            relatorio.append("")
+                bloco += f"\n      Observação: {kpi.observacoes}"
+            relatorio.append(bloco + "\n")
         
         # Recomendações
         if analise_kpis['recomendacoes']:
             relatorio.append("💡 RECOMENDAÇÕES PRIORITÁRIAS:")
-            for rec in analise_kpis['recomendacoes']:
-                relatorio.append(f"   • {rec}")
+            relatorio.extend(f"   • {rec}" for rec in analise_kpis['recomendacoes'])
             relatorio.append("")
         
         return "\n".join(relatorio)
-    
-    def _obter_emoji_status(self, status: StatusKPI) -> str:
-        """Retorna emoji correspondente ao status"""
-        emojis = {
-            StatusKPI.CRITICO: "🔴",
-            StatusKPI.ATENCAO: "🟡",
-            StatusKPI.BOM: "🟢",
-            StatusKPI.EXCELENTE: "🌟"
-        }
-        return emojis.get(status, "⚪")
\ No newline at end of file
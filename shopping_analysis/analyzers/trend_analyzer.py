@@ -2,27 +2,123 @@
 Analisador de Tendências para Shopping Centers.
 Identifica tendências, pontos críticos e padrões temporais nos dados financeiros.
 """
+from collections import defaultdict
 from decimal import Decimal
 from typing import List, Dict, Optional, Any, Tuple
-from datetime import datetime, timedelta
-import statistics
-from math import sqrt
+from datetime import datetime
+from operator import itemgetter
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from .kpi_analyzer import BaseAnalyzer
-from ..core.models import MovimentacaoFinanceira, ConfiguracaoAnalise
-from ..core.enums import TrendDirection, InsightType, InsightPriority, StatusKPI
+from ._trend_kernels import (
+    EstatisticasTendencia, candidatos_mudanca_brusca, correlacao_lag1, estatisticas_tendencia,
+    estatisticas_tendencia_lote, extremos_locais, para_vetor, variacoes_relativas
+)
+from ..core.models import ConfiguracaoAnalise
+from ..core.enums import TrendDirection
 from ..core.exceptions import CalculationError, InsufficientDataError
-from ..formatters.brazilian import BrazilianFormatter
+from ..core.memo import MemoriaAnalises
+from ..core.summaries import TrendSummary
+
+
+# Quantidade de análises mantidas em memória por instância (LRU)
+_MAX_ANALISES_MEMORIZADAS = 32
+
+# Cabeçalho fixo do relatório de tendências
+_CABECALHO_RELATORIO = "=" * 60 + "\n📈 ANÁLISE DE TENDÊNCIAS\n" + "=" * 60 + "\n"
+
+# Correlações de uma série constante (variâncias nulas: correlação lag-1 igual a zero)
+_CORRELACOES_SERIE_CONSTANTE = {
+    'correlacao_lag1': Decimal('0.000'),
+    'autocorrelacao': 'FRACA',
+    'direcao_correlacao': 'NEGATIVA'
+}
+
+
+def _converter_periodo_fluxo(i: int, periodo: Dict[str, Any]) -> Dict[str, Any]:
+    """Converte um período de fluxo de caixa (saldo operacional como valor principal)"""
+    return {
+        'periodo': i + 1,
+        'mes': periodo.get('mes', f'Período {i+1}'),
+        'ano': periodo.get('ano', 2025),
+        'valor_principal': Decimal(str(periodo.get('saldo_operacional', 0))),
+        'credito': Decimal(str(periodo.get('credito', 0))),
+        'debito': Decimal(str(periodo.get('debito', 0))),
+        'data_periodo': f"{periodo.get('mes', f'P{i+1}')}/{periodo.get('ano', 2025)}"
+    }
+
+
+def _converter_periodo_kpis(i: int, periodo: Dict[str, Any]) -> Dict[str, Any]:
+    """Converte um período de KPIs (receita total como valor principal)"""
+    return {
+        'periodo': i + 1,
+        'valor_principal': Decimal(str(periodo.get('receita_total', periodo.get('valor', 0)))),
+        'data_periodo': periodo.get('periodo', f'Período {i+1}')
+    }
+
+
+def _converter_periodo_inadimplencia(i: int, periodo: Dict[str, Any]) -> Dict[str, Any]:
+    """Converte um período de inadimplência (valor total como valor principal)"""
+    return {
+        'periodo': i + 1,
+        'valor_principal': Decimal(str(periodo.get('valor_total', periodo.get('valor', 0)))),
+        'data_periodo': periodo.get('periodo', f'Período {i+1}')
+    }
+
+
+# Conversores de período por tipo de análise
+_CONVERSORES_PERIODO = {
+    'fluxo_caixa': _converter_periodo_fluxo,
+    'kpis': _converter_periodo_kpis,
+    'inadimplencia': _converter_periodo_inadimplencia,
+}
 
 
 class TrendAnalyzer(BaseAnalyzer):
     """Analisador especializado em identificação de tendências financeiras"""
     
+    # Modelos de insight por direção da tendência ({pct} = variação formatada)
+    _MODELOS_INSIGHT_DIRECAO = {
+        TrendDirection.CRESCIMENTO: "📈 TENDÊNCIA POSITIVA: Crescimento de {pct} no período analisado",
+        TrendDirection.DECLINIO: "📉 TENDÊNCIA NEGATIVA: Declínio de {pct} no período analisado",
+    }
+    _INSIGHT_ESTAVEL = "📊 TENDÊNCIA ESTÁVEL: Variação mínima observada no período"
+    _MODELO_INSIGHT_VOLATILIDADE = "⚡ ALTA VOLATILIDADE: Coeficiente de variação de {pct}"
+    _MODELO_INSIGHT_MUDANCA = "🚨 MUDANÇA BRUSCA DETECTADA: {tipo} de {pct} no período {periodo}"
+    _MODELO_INSIGHT_SAZONALIDADE = "📅 PADRÃO SAZONAL: Melhor performance em {melhor}, pior em {pior}"
+    
+    # Recomendações por (direção, intensidade) da tendência
+    _RECOMENDACOES_DIRECAO = {
+        (TrendDirection.DECLINIO, 'ALTA'): (
+            "🔴 AÇÃO URGENTE: Tendência de declínio acentuado detectada. Implementar medidas corretivas imediatas."
+        ),
+        **{
+            (TrendDirection.CRESCIMENTO, intensidade): (
+                "🟢 APROVEITAR MOMENTUM: Tendência positiva identificada. Considerar investimentos para acelerar crescimento."
+            )
+            for intensidade in ('ALTA', 'MODERADA', 'BAIXA')
+        },
+    }
+    _RECOMENDACAO_VOLATILIDADE = (
+        "⚖️ GESTÃO DE RISCO: Alta volatilidade detectada. Implementar controles de risco e monitoramento contínuo."
+    )
+    _RECOMENDACAO_MUDANCAS = (
+        "📊 MONITORAMENTO INTENSIVO: Múltiplas mudanças bruscas detectadas. Revisar processos operacionais."
+    )
+    _RECOMENDACAO_PREVISIBILIDADE = (
+        "🔍 ANÁLISE APROFUNDADA: Padrão pouco previsível. Coletar mais dados para melhor compreensão."
+    )
+    
     def __init__(self, configuracao: Optional[ConfiguracaoAnalise] = None):
         super().__init__(configuracao)
         self.min_periodos_tendencia = 3  # Mínimo de períodos para identificar tendência
-        self.threshold_volatilidade = Decimal('0.15')  # 15% de variação para alta volatilidade
-        self.threshold_crescimento = Decimal('0.05')   # 5% de crescimento significativo
+        # Limites de política (não monetários), comparados diretamente com as métricas em float
+        self.threshold_volatilidade = 0.15  # 15% de variação para alta volatilidade
+        self.threshold_crescimento = 0.05   # 5% de crescimento significativo
+        # Resultados de analisar() por impressão digital da entrada (ver _chave_memoria)
+        self._memoria = MemoriaAnalises(_MAX_ANALISES_MEMORIZADAS)
     
     def analisar(self, dados_temporais: List[Dict[str, Any]], tipo_analise: str = 'fluxo_caixa') -> Dict[str, Any]:
         """
@@ -39,107 +135,139 @@ class TrendAnalyzer(BaseAnalyzer):
             if len(dados_temporais) < self.min_periodos_tendencia:
                 raise InsufficientDataError("analise_tendencias", self.min_periodos_tendencia, len(dados_temporais))
             
-            # Converter dados para formato padronizado
-            series_temporais = self._converter_series_temporais(dados_temporais, tipo_analise)
-            
-            # Análises principais
-            tendencia_geral = self._identificar_tendencia_geral(series_temporais)
-            pontos_criticos = self._detectar_pontos_criticos(series_temporais)
-            volatilidade = self._calcular_volatilidade(series_temporais)
-            sazonalidade = self._analisar_sazonalidade(series_temporais)
+            # Entradas idênticas reaproveitam a análise memorizada (cópia independente do cache)
+            resultado = self._memoria.obter(
+                self._chave_memoria(dados_temporais, tipo_analise),
+                lambda: self._analisar_series(dados_temporais, tipo_analise)
+            )
+            resultado['data_analise'] = datetime.now()
+            return resultado
             
-            # Análises estatísticas avançadas
-            correlacoes = self._analisar_correlacoes_temporais(series_temporais)
-            previsoes = self._gerar_previsoes_simples(series_temporais)
+        except Exception as e:
+            raise CalculationError("analise_tendencias", str(e)) from e
+    
+    def analisar_lote(self, series: List[List[Dict[str, Any]]],
+                      tipo_analise: str = 'fluxo_caixa') -> Dict[str, np.ndarray]:
+        """
+        Calcula estatísticas de tendência de várias séries (ex.: shoppings de uma carteira) em uma única passagem.
+        
+        Não gera pontos críticos, sazonalidade, insights nem recomendações.
+        
+        Args:
+            series: Lista de séries, todas com o mesmo número de períodos
+            tipo_analise: Tipo de análise ('fluxo_caixa', 'kpis', 'inadimplencia')
             
-            # Insights e recomendações
-            insights_tendencia = self._gerar_insights_tendencia(
-                tendencia_geral, pontos_criticos, volatilidade, sazonalidade
-            )
-            recomendacoes = self._gerar_recomendacoes_tendencia(
-                tendencia_geral, pontos_criticos, volatilidade
-            )
+        Returns:
+            Dict com vetores (um valor por série): media, desvio_padrao, inclinacao, intercepto,
+            r_squared, volatilidade_media e correlacao_lag1
+        """
+        try:
+            tamanho = min((len(serie) for serie in series), default=0)
+            if tamanho < self.min_periodos_tendencia:
+                raise InsufficientDataError("analise_tendencias_lote", self.min_periodos_tendencia, tamanho)
+            if any(len(serie) != tamanho for serie in series):
+                raise ValueError("Todas as séries devem ter o mesmo número de períodos")
             
-            return {
-                'series_analisadas': series_temporais,
-                'tendencia_geral': tendencia_geral,
-                'pontos_criticos': pontos_criticos,
-                'volatilidade': volatilidade,
-                'sazonalidade': sazonalidade,
-                'correlacoes_temporais': correlacoes,
-                'previsoes': previsoes,
-                'insights_tendencia': insights_tendencia,
-                'recomendacoes': recomendacoes,
-                'data_analise': datetime.now(),
-                'periodos_analisados': len(series_temporais),
-                'tipo_analise': tipo_analise
-            }
+            matriz = np.stack([
+                para_vetor(item['valor_principal'] for item in self._converter_series_temporais(serie, tipo_analise))
+                for serie in series
+            ])
+            return estatisticas_tendencia_lote(matriz)
             
         except Exception as e:
-            raise CalculationError("analise_tendencias", str(e)) from e
+            raise CalculationError("analise_tendencias_lote", str(e)) from e
+    
+    def _chave_memoria(self, dados_temporais: List[Dict[str, Any]], tipo_analise: str) -> Tuple:
+        """Impressão digital da entrada: tipo, limites, janela da média móvel e todos os campos de cada período"""
+        return (
+            tipo_analise,
+            str(self.threshold_volatilidade),
+            str(self.threshold_crescimento),
+            self.configuracao.janela_media_movel,
+            tuple(tuple((campo, str(valor)) for campo, valor in sorted(periodo.items())) for periodo in dados_temporais)
+        )
+    
+    def _analisar_series(self, dados_temporais: List[Dict[str, Any]], tipo_analise: str) -> Dict[str, Any]:
+        """Executa todas as análises de tendência (sem memorização)"""
+        # Converter dados para formato padronizado
+        series_temporais = self._converter_series_temporais(dados_temporais, tipo_analise)
+        # Valores principais em float64, convertidos uma única vez
+        vetor = para_vetor(item['valor_principal'] for item in series_temporais)
+        
+        # Estatísticas compartilhadas, calculadas uma única vez por série
+        estatisticas = estatisticas_tendencia(vetor)
+        variacoes = variacoes_relativas(vetor)
+        # Série constante (ex.: shopping novo com valores zerados): sem pontos críticos nem correlação
+        serie_constante = bool(np.ptp(vetor) == 0)
+        
+        # Análises principais
+        tendencia_geral = self._identificar_tendencia_geral(series_temporais, estatisticas)
+        if serie_constante:
+            pontos_criticos = self._pontos_criticos_serie_constante(series_temporais)
+        else:
+            pontos_criticos = self._detectar_pontos_criticos(series_temporais, vetor)
+        volatilidade = self._calcular_volatilidade(estatisticas, variacoes)
+        sazonalidade = self._analisar_sazonalidade(series_temporais, vetor)
+        
+        # Análises estatísticas avançadas
+        if serie_constante:
+            correlacoes = dict(_CORRELACOES_SERIE_CONSTANTE)
+        else:
+            correlacoes = self._analisar_correlacoes_temporais(vetor)
+        previsoes = self._gerar_previsoes_simples(vetor, estatisticas)
+        
+        # Insights e recomendações
+        insights_tendencia = self._gerar_insights_tendencia(
+            tendencia_geral, pontos_criticos, volatilidade, sazonalidade
+        )
+        recomendacoes = self._gerar_recomendacoes_tendencia(
+            tendencia_geral, pontos_criticos, volatilidade
+        )
+        
+        return {
+            'series_analisadas': series_temporais,
+            'tendencia_geral': tendencia_geral,
+            'pontos_criticos': pontos_criticos,
+            'volatilidade': volatilidade,
+            'sazonalidade': sazonalidade,
+            'correlacoes_temporais': correlacoes,
+            'previsoes': previsoes,
+            'insights_tendencia': insights_tendencia,
+            'recomendacoes': recomendacoes,
+            'data_analise': datetime.now(),
+            'periodos_analisados': len(series_temporais),
+            'tipo_analise': tipo_analise,
+            'sumario': TrendSummary(
+                direcao=tendencia_geral['direcao'],
+                volatilidade=volatilidade['classificacao']
+            )
+        }
     
     def _converter_series_temporais(self, dados: List[Dict[str, Any]], tipo: str) -> List[Dict[str, Any]]:
         """Converte dados brutos em séries temporais padronizadas"""
+        # Conversor escolhido uma única vez pelo tipo de análise (padrão: inadimplência)
+        conversor = _CONVERSORES_PERIODO.get(tipo, _converter_periodo_inadimplencia)
         series = []
         
-        for i, periodo in enumerate(dados):
-            try:
-                # Determinar valor principal baseado no tipo de análise
-                if tipo == 'fluxo_caixa':
-                    valor = Decimal(str(periodo.get('saldo_operacional', 0)))
-                    credito = Decimal(str(periodo.get('credito', 0)))
-                    debito = Decimal(str(periodo.get('debito', 0)))
-                    
-                    item = {
-                        'periodo': i + 1,
-                        'mes': periodo.get('mes', f'Período {i+1}'),
-                        'ano': periodo.get('ano', 2025),
-                        'valor_principal': valor,
-                        'credito': credito,
-                        'debito': debito,
-                        'data_periodo': f"{periodo.get('mes', f'P{i+1}')}/{periodo.get('ano', 2025)}"
-                    }
-                elif tipo == 'kpis':
-                    # Para KPIs, usar receita total como principal
-                    valor = Decimal(str(periodo.get('receita_total', periodo.get('valor', 0))))
-                    item = {
-                        'periodo': i + 1,
-                        'valor_principal': valor,
-                        'data_periodo': periodo.get('periodo', f'Período {i+1}')
-                    }
-                else:  # inadimplencia
-                    valor = Decimal(str(periodo.get('valor_total', periodo.get('valor', 0))))
-                    item = {
-                        'periodo': i + 1,
-                        'valor_principal': valor,
-                        'data_periodo': periodo.get('periodo', f'Período {i+1}')
-                    }
-                
-                series.append(item)
-                
-            except Exception as e:
-                raise CalculationError(f"conversao_periodo_{i}", str(e)) from e
+        i = 0
+        try:
+            for i, periodo in enumerate(dados):
+                series.append(conversor(i, periodo))
+        except Exception as e:
+            # Um único try para o laço; o índice do período com erro vem do enumerate
+            raise CalculationError(f"conversao_periodo_{i}", str(e)) from e
         
         return series
     
-    def _identificar_tendencia_geral(self, series: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _identificar_tendencia_geral(self, series: List[Dict[str, Any]],
+                                     estatisticas: EstatisticasTendencia) -> Dict[str, Any]:
         """Identifica tendência geral da série temporal"""
         valores = [item['valor_principal'] for item in series]
-        n = len(valores)
-        
-        # Regressão linear simples
-        x_medio = (n + 1) / 2
-        y_medio = sum(valores) / n
-        
-        numerador = sum((i + 1 - x_medio) * (float(valores[i]) - float(y_medio)) for i in range(n))
-        denominador = sum((i + 1 - x_medio) ** 2 for i in range(n))
-        
-        if denominador == 0:
-            inclinacao = 0
-        else:
-            inclinacao = numerador / denominador
         
-        intercepto = float(y_medio) - inclinacao * x_medio
+        # Regressão linear simples (x = 1..n)
+        inclinacao = estatisticas.inclinacao
+        intercepto = estatisticas.intercepto
+        r_squared = estatisticas.r_squared
         
         # Classificar tendência
         if abs(inclinacao) < 100:  # Ajustar threshold baseado nos dados
@@ -152,12 +280,6 @@ class TrendAnalyzer(BaseAnalyzer):
             direcao = TrendDirection.DECLINIO
             intensidade = "ALTA" if inclinacao < -1000 else "MODERADA"
         
-        # Calcular R²
-        y_pred = [inclinacao * (i + 1) + intercepto for i in range(n)]
-        ss_res = sum((float(valores[i]) - y_pred[i]) ** 2 for i in range(n))
-        ss_tot = sum((float(valores[i]) - float(y_medio)) ** 2 for i in range(n))
-        r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
-        
         # Determinar confiabilidade
         if r_squared > 0.8:
             confiabilidade = "ALTA"
@@ -179,48 +301,41 @@ class TrendAnalyzer(BaseAnalyzer):
             'variacao_percentual': ((valores[-1] - valores[0]) / valores[0] * 100).quantize(Decimal('0.1')) if valores[0] != 0 else Decimal('0')
         }
     
-    def _detectar_pontos_criticos(self, series: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _detectar_pontos_criticos(self, series: List[Dict[str, Any]], vetor: np.ndarray) -> Dict[str, Any]:
         """Detecta pontos críticos na série temporal"""
         valores = [item['valor_principal'] for item in series]
         
         # Encontrar máximos e mínimos locais
-        maximos_locais = []
-        minimos_locais = []
-        
-        for i in range(1, len(valores) - 1):
-            if valores[i] > valores[i-1] and valores[i] > valores[i+1]:
-                maximos_locais.append({
-                    'periodo': i + 1,
-                    'valor': valores[i],
-                    'data_periodo': series[i]['data_periodo']
-                })
-            elif valores[i] < valores[i-1] and valores[i] < valores[i+1]:
-                minimos_locais.append({
-                    'periodo': i + 1,
-                    'valor': valores[i],
-                    'data_periodo': series[i]['data_periodo']
-                })
-        
-        # Maior e menor valores absolutos
-        max_absoluto = max(valores)
-        min_absoluto = min(valores)
-        idx_max = valores.index(max_absoluto)
-        idx_min = valores.index(min_absoluto)
+        indices_maximos, indices_minimos = extremos_locais(vetor)
+        maximos_locais = [
+            {'periodo': i + 1, 'valor': valores[i], 'data_periodo': series[i]['data_periodo']}
+            for i in indices_maximos.tolist()
+        ]
+        minimos_locais = [
+            {'periodo': i + 1, 'valor': valores[i], 'data_periodo': series[i]['data_periodo']}
+            for i in indices_minimos.tolist()
+        ]
+        
+        # Maior e menor valores absolutos (primeira ocorrência)
+        idx_max = int(vetor.argmax())
+        idx_min = int(vetor.argmin())
+        max_absoluto = valores[idx_max]
+        min_absoluto = valores[idx_min]
         
         # Detectar mudanças bruscas (>20% entre períodos consecutivos)
         mudancas_bruscas = []
-        for i in range(1, len(valores)):
-            if valores[i-1] != 0:
-                variacao = abs((valores[i] - valores[i-1]) / valores[i-1] * 100)
-                if variacao > 20:  # Mudança maior que 20%
-                    mudancas_bruscas.append({
-                        'periodo_anterior': i,
-                        'periodo_atual': i + 1,
-                        'valor_anterior': valores[i-1],
-                        'valor_atual': valores[i],
-                        'variacao_percentual': variacao.quantize(Decimal('0.1')),
-                        'tipo': 'QUEDA' if valores[i] < valores[i-1] else 'ALTA'
-                    })
+        for i in candidatos_mudanca_brusca(vetor, 20).tolist():
+            # Confirmação exata em Decimal apenas para os candidatos
+            variacao = abs((valores[i] - valores[i-1]) / valores[i-1] * 100)
+            if variacao > 20:  # Mudança maior que 20%
+                mudancas_bruscas.append({
+                    'periodo_anterior': i,
+                    'periodo_atual': i + 1,
+                    'valor_anterior': valores[i-1],
+                    'valor_atual': valores[i],
+                    'variacao_percentual': variacao.quantize(Decimal('0.1')),
+                    'tipo': 'QUEDA' if valores[i] < valores[i-1] else 'ALTA'
+                })
         
         return {
             'maximo_absoluto': {
@@ -240,18 +355,25 @@ class TrendAnalyzer(BaseAnalyzer):
             'numero_pontos_criticos': len(maximos_locais) + len(minimos_locais) + len(mudancas_bruscas)
         }
     
-    def _calcular_volatilidade(self, series: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calcula métricas de volatilidade"""
-        valores = [float(item['valor_principal']) for item in series]
-        
-        # Variações período a período
-        variacoes = []
-        for i in range(1, len(valores)):
-            if valores[i-1] != 0:
-                variacao = (valores[i] - valores[i-1]) / valores[i-1]
-                variacoes.append(variacao)
-        
-        if not variacoes:
+    def _pontos_criticos_serie_constante(self, series: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Pontos críticos de uma série constante: sem extremos locais nem mudanças bruscas"""
+        primeiro = series[0]
+        valor = primeiro['valor_principal']
+        extremo = {'periodo': 1, 'valor': valor, 'data_periodo': primeiro['data_periodo']}
+        
+        return {
+            'maximo_absoluto': extremo,
+            'minimo_absoluto': dict(extremo),
+            'maximos_locais': [],
+            'minimos_locais': [],
+            'mudancas_bruscas': [],
+            'amplitude_total': valor - valor,
+            'numero_pontos_criticos': 0
+        }
+    
+    def _calcular_volatilidade(self, estatisticas: EstatisticasTendencia, variacoes: np.ndarray) -> Dict[str, Any]:
+        """Calcula métricas de volatilidade a partir das variações período a período"""
+        if variacoes.size == 0:
             return {
                 'desvio_padrao': Decimal('0'),
                 'coeficiente_variacao': Decimal('0'),
@@ -260,11 +382,12 @@ class TrendAnalyzer(BaseAnalyzer):
             }
         
         # Métricas estatísticas
-        media_valores = sum(valores) / len(valores)
-        desvio_padrao = Decimal(str(sqrt(sum((v - media_valores) ** 2 for v in valores) / len(valores))))
+        media_valores = estatisticas.media
+        desvio_padrao = Decimal(str(estatisticas.desvio_padrao))
         coeficiente_variacao = (desvio_padrao / Decimal(str(media_valores))) * 100 if media_valores != 0 else Decimal('0')
         
-        volatilidade_media = Decimal(str(sum(abs(v) for v in variacoes) / len(variacoes)))
+        variacoes_absolutas = np.abs(variacoes)
+        volatilidade_media = float(variacoes_absolutas.mean())
         
         # Classificar volatilidade
         if volatilidade_media > self.threshold_volatilidade:
@@ -277,44 +400,41 @@ class TrendAnalyzer(BaseAnalyzer):
         return {
             'desvio_padrao': desvio_padrao.quantize(Decimal('0.01')),
             'coeficiente_variacao': coeficiente_variacao.quantize(Decimal('0.1')),
-            'volatilidade_media': volatilidade_media.quantize(Decimal('0.003')),
+            'volatilidade_media': Decimal(str(volatilidade_media)).quantize(Decimal('0.003')),
             'classificacao': classificacao,
-            'numero_variacoes_significativas': len([v for v in variacoes if abs(v) > float(self.threshold_volatilidade)]),
-            'maior_variacao_positiva': max(variacoes) if variacoes else 0,
-            'maior_variacao_negativa': min(variacoes) if variacoes else 0
+            'numero_variacoes_significativas': int(np.count_nonzero(variacoes_absolutas > self.threshold_volatilidade)),
+            # argmax/argmin devolvem a primeira ocorrência, como max()/min() (preserva o sinal de -0.0)
+            'maior_variacao_positiva': float(variacoes[variacoes.argmax()]),
+            'maior_variacao_negativa': float(variacoes[variacoes.argmin()])
         }
     
-    def _analisar_sazonalidade(self, series: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analisar_sazonalidade(self, series: List[Dict[str, Any]], vetor: np.ndarray) -> Dict[str, Any]:
         """Analisa padrões sazonais nos dados"""
         # Para uma análise simples, verificar se há padrões por mês
-        valores_por_mes = {}
+        valores_por_mes = defaultdict(list)
         
-        for item in series:
-            mes = item.get('mes', f"P{item['periodo']}")
-            if mes not in valores_por_mes:
-                valores_por_mes[mes] = []
-            valores_por_mes[mes].append(float(item['valor_principal']))
+        # Valores em float já convertidos no vetor da série
+        for item, valor in zip(series, vetor.tolist()):
+            valores_por_mes[item.get('mes', f"P{item['periodo']}")].append(valor)
         
         # Calcular médias por mês
-        medias_mensais = {}
-        for mes, valores in valores_por_mes.items():
-            medias_mensais[mes] = sum(valores) / len(valores)
+        medias_mensais = {mes: sum(valores) / len(valores) for mes, valores in valores_por_mes.items()}
         
         # Identificar mês com melhor e pior performance
         if medias_mensais:
-            melhor_mes = max(medias_mensais.keys(), key=lambda k: medias_mensais[k])
-            pior_mes = min(medias_mensais.keys(), key=lambda k: medias_mensais[k])
+            melhor_mes, media_melhor = max(medias_mensais.items(), key=itemgetter(1))
+            pior_mes, media_pior = min(medias_mensais.items(), key=itemgetter(1))
             
             # Calcular amplitude sazonal
-            amplitude_sazonal = medias_mensais[melhor_mes] - medias_mensais[pior_mes]
+            amplitude_sazonal = media_melhor - media_pior
             
             return {
                 'medias_por_periodo': {mes: Decimal(str(media)).quantize(Decimal('0.01')) 
                                      for mes, media in medias_mensais.items()},
                 'melhor_periodo': melhor_mes,
                 'pior_periodo': pior_mes,
-                'valor_melhor_periodo': Decimal(str(medias_mensais[melhor_mes])).quantize(Decimal('0.01')),
-                'valor_pior_periodo': Decimal(str(medias_mensais[pior_mes])).quantize(Decimal('0.01')),
+                'valor_melhor_periodo': Decimal(str(media_melhor)).quantize(Decimal('0.01')),
+                'valor_pior_periodo': Decimal(str(media_pior)).quantize(Decimal('0.01')),
                 'amplitude_sazonal': Decimal(str(amplitude_sazonal)).quantize(Decimal('0.01')),
                 'tem_sazonalidade': amplitude_sazonal > (sum(medias_mensais.values()) / len(medias_mensais)) * 0.2
             }
@@ -324,33 +444,13 @@ class TrendAnalyzer(BaseAnalyzer):
             'tem_sazonalidade': False
         }
     
-    def _analisar_correlacoes_temporais(self, series: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analisar_correlacoes_temporais(self, valores: np.ndarray) -> Dict[str, Any]:
         """Analisa correlações entre períodos consecutivos"""
-        valores = [float(item['valor_principal']) for item in series]
-        
-        if len(valores) < 2:
+        if valores.shape[0] < 2:
             return {'correlacao_lag1': Decimal('0'), 'autocorrelacao': 'INDEFINIDA'}
         
         # Correlação lag-1 (período atual vs anterior)
-        valores_atual = valores[1:]
-        valores_anterior = valores[:-1]
-        
-        if len(valores_atual) == 0:
-            return {'correlacao_lag1': Decimal('0'), 'autocorrelacao': 'INDEFINIDA'}
-        
-        # Calcular correlação de Pearson simples
-        n = len(valores_atual)
-        media_atual = sum(valores_atual) / n
-        media_anterior = sum(valores_anterior) / n
-        
-        numerador = sum((valores_atual[i] - media_atual) * (valores_anterior[i] - media_anterior) for i in range(n))
-        denominador_atual = sum((v - media_atual) ** 2 for v in valores_atual)
-        denominador_anterior = sum((v - media_anterior) ** 2 for v in valores_anterior)
-        
-        if denominador_atual == 0 or denominador_anterior == 0:
-            correlacao = 0
-        else:
-            correlacao = numerador / sqrt(denominador_atual * denominador_anterior)
+        correlacao = correlacao_lag1(valores)
         
         # Classificar autocorrelação
         if abs(correlacao) > 0.7:
@@ -366,33 +466,21 @@ class TrendAnalyzer(BaseAnalyzer):
             'direcao_correlacao': 'POSITIVA' if correlacao > 0 else 'NEGATIVA'
         }
     
-    def _gerar_previsoes_simples(self, series: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _gerar_previsoes_simples(self, valores: np.ndarray, estatisticas: EstatisticasTendencia) -> Dict[str, Any]:
         """Gera previsões simples baseadas na tendência"""
-        if len(series) < 3:
+        n = valores.shape[0]
+        janela = self.configuracao.janela_media_movel
+        if n < max(3, janela):
             return {'previsoes_disponiveis': False}
         
-        valores = [float(item['valor_principal']) for item in series]
-        
-        # Previsão por média móvel simples (últimos 3 períodos)
-        media_movel = sum(valores[-3:]) / 3
+        # Previsão por média móvel simples (últimos `janela` períodos, visão sem cópia)
+        media_movel = float(sliding_window_view(valores, janela)[-1].mean())
         
         # Previsão por tendência linear
-        n = len(valores)
-        x_values = list(range(1, n + 1))
-        y_values = valores
-        
-        x_medio = sum(x_values) / n
-        y_medio = sum(y_values) / n
-        
-        numerador = sum((x_values[i] - x_medio) * (y_values[i] - y_medio) for i in range(n))
-        denominador = sum((x - x_medio) ** 2 for x in x_values)
-        
-        if denominador != 0:
-            inclinacao = numerador / denominador
-            intercepto = y_medio - inclinacao * x_medio
-            previsao_linear = inclinacao * (n + 1) + intercepto
+        if n > 1:
+            previsao_linear = estatisticas.inclinacao * (n + 1) + estatisticas.intercepto
         else:
-            previsao_linear = y_medio
+            previsao_linear = estatisticas.media
         
         return {
             'previsoes_disponiveis': True,
@@ -400,34 +488,45 @@ class TrendAnalyzer(BaseAnalyzer):
             'proximo_periodo_tendencia_linear': Decimal(str(previsao_linear)).quantize(Decimal('0.01')),
             'cenario_conservador': min(media_movel, previsao_linear),
             'cenario_otimista': max(media_movel, previsao_linear),
-            'confiabilidade_previsao': 'BAIXA' if len(series) < 6 else 'MODERADA'
+            'confiabilidade_previsao': 'BAIXA' if n < 6 else 'MODERADA'
         }
     
     def _gerar_insights_tendencia(self, tendencia: Dict[str, Any], pontos_criticos: Dict[str, Any], 
                                 volatilidade: Dict[str, Any], sazonalidade: Dict[str, Any]) -> List[str]:
         """Gera insights baseados na análise de tendências"""
-        insights = []
+        formatar_porcentagem = self.formatter.formatar_porcentagem
         
         # Insight sobre tendência geral
-        if tendencia['direcao'] == TrendDirection.CRESCIMENTO:
-            insights.append(f"📈 TENDÊNCIA POSITIVA: Crescimento de {self.formatter.formatar_porcentagem(tendencia['variacao_percentual'])} no período analisado")
-        elif tendencia['direcao'] == TrendDirection.DECLINIO:
-            insights.append(f"📉 TENDÊNCIA NEGATIVA: Declínio de {self.formatter.formatar_porcentagem(abs(tendencia['variacao_percentual']))} no período analisado")
+        direcao = tendencia['direcao']
+        modelo = self._MODELOS_INSIGHT_DIRECAO.get(direcao)
+        if modelo is None:
+            insights = [self._INSIGHT_ESTAVEL]
         else:
-            insights.append("📊 TENDÊNCIA ESTÁVEL: Variação mínima observada no período")
+            variacao = tendencia['variacao_percentual']
+            if direcao is TrendDirection.DECLINIO:
+                variacao = abs(variacao)
+            insights = [modelo.format(pct=formatar_porcentagem(variacao))]
         
         # Insight sobre volatilidade
         if volatilidade['classificacao'] == 'ALTA':
-            insights.append(f"⚡ ALTA VOLATILIDADE: Coeficiente de variação de {self.formatter.formatar_porcentagem(volatilidade['coeficiente_variacao'])}")
+            insights.append(self._MODELO_INSIGHT_VOLATILIDADE.format(
+                pct=formatar_porcentagem(volatilidade['coeficiente_variacao'])
+            ))
         
         # Insight sobre pontos críticos
-        if len(pontos_criticos['mudancas_bruscas']) > 0:
+        if pontos_criticos['mudancas_bruscas']:
             maior_mudanca = max(pontos_criticos['mudancas_bruscas'], key=lambda x: x['variacao_percentual'])
-            insights.append(f"🚨 MUDANÇA BRUSCA DETECTADA: {maior_mudanca['tipo']} de {self.formatter.formatar_porcentagem(maior_mudanca['variacao_percentual'])} no período {maior_mudanca['periodo_atual']}")
+            insights.append(self._MODELO_INSIGHT_MUDANCA.format(
+                tipo=maior_mudanca['tipo'],
+                pct=formatar_porcentagem(maior_mudanca['variacao_percentual']),
+                periodo=maior_mudanca['periodo_atual']
+            ))
         
         # Insight sobre sazonalidade
         if sazonalidade.get('tem_sazonalidade', False):
-            insights.append(f"📅 PADRÃO SAZONAL: Melhor performance em {sazonalidade['melhor_periodo']}, pior em {sazonalidade['pior_periodo']}")
+            insights.append(self._MODELO_INSIGHT_SAZONALIDADE.format(
+                melhor=sazonalidade['melhor_periodo'], pior=sazonalidade['pior_periodo']
+            ))
         
         return insights
     
@@ -437,71 +536,65 @@ class TrendAnalyzer(BaseAnalyzer):
         recomendacoes = []
         
         # Recomendações baseadas na tendência
-        if tendencia['direcao'] == TrendDirection.DECLINIO and tendencia['intensidade'] == 'ALTA':
-            recomendacoes.append("🔴 AÇÃO URGENTE: Tendência de declínio acentuado detectada. Implementar medidas corretivas imediatas.")
-        elif tendencia['direcao'] == TrendDirection.CRESCIMENTO:
-            recomendacoes.append("🟢 APROVEITAR MOMENTUM: Tendência positiva identificada. Considerar investimentos para acelerar crescimento.")
+        recomendacao = self._RECOMENDACOES_DIRECAO.get((tendencia['direcao'], tendencia['intensidade']))
+        if recomendacao is not None:
+            recomendacoes.append(recomendacao)
         
         # Recomendações baseadas na volatilidade
         if volatilidade['classificacao'] == 'ALTA':
-            recomendacoes.append("⚖️ GESTÃO DE RISCO: Alta volatilidade detectada. Implementar controles de risco e monitoramento contínuo.")
+            recomendacoes.append(self._RECOMENDACAO_VOLATILIDADE)
         
         # Recomendações baseadas em pontos críticos
         if len(pontos_criticos['mudancas_bruscas']) > 2:
-            recomendacoes.append("📊 MONITORAMENTO INTENSIVO: Múltiplas mudanças bruscas detectadas. Revisar processos operacionais.")
+            recomendacoes.append(self._RECOMENDACAO_MUDANCAS)
         
         # Recomendação sobre previsibilidade
         if tendencia['confiabilidade'] == 'BAIXA':
-            recomendacoes.append("🔍 ANÁLISE APROFUNDADA: Padrão pouco previsível. Coletar mais dados para melhor compreensão.")
+            recomendacoes.append(self._RECOMENDACAO_PREVISIBILIDADE)
         
         return recomendacoes
     
     def gerar_relatorio_tendencias(self, analise_tendencias: Dict[str, Any]) -> str:
         """Gera relatório formatado de análise de tendências"""
-        relatorio = []
-        relatorio.append("=" * 60)
-        relatorio.append("📈 ANÁLISE DE TENDÊNCIAS")
-        relatorio.append("=" * 60)
-        relatorio.append("")
-        
         tendencia = analise_tendencias['tendencia_geral']
         volatilidade = analise_tendencias['volatilidade']
         pontos_criticos = analise_tendencias['pontos_criticos']
-        
-        # Tendência geral
-        relatorio.append("📊 TENDÊNCIA GERAL:")
-        relatorio.append(f"   • Direção: {tendencia['direcao'].value}")
-        relatorio.append(f"   • Intensidade: {tendencia['intensidade']}")
-        relatorio.append(f"   • Variação Total: {self.formatter.formatar_porcentagem(tendencia['variacao_percentual'])}")
-        relatorio.append(f"   • Confiabilidade: {tendencia['confiabilidade']} (R² = {tendencia['r_squared']})")
-        relatorio.append("")
-        
-        # Volatilidade
-        relatorio.append("⚡ VOLATILIDADE:")
-        relatorio.append(f"   • Classificação: {volatilidade['classificacao']}")
-        relatorio.append(f"   • Coeficiente de Variação: {self.formatter.formatar_porcentagem(volatilidade['coeficiente_variacao'])}")
-        relatorio.append(f"   • Variações Significativas: {volatilidade['numero_variacoes_significativas']}")
-        relatorio.append("")
-        
-        # Pontos críticos
-        relatorio.append("🔍 PONTOS CRÍTICOS:")
-        relatorio.append(f"   • Máximo: {self.formatter.formatar_moeda(pontos_criticos['maximo_absoluto']['valor'], compacto=True)} ({pontos_criticos['maximo_absoluto']['data_periodo']})")
-        relatorio.append(f"   • Mínimo: {self.formatter.formatar_moeda(pontos_criticos['minimo_absoluto']['valor'], compacto=True)} ({pontos_criticos['minimo_absoluto']['data_periodo']})")
-        relatorio.append(f"   • Mudanças Bruscas: {len(pontos_criticos['mudancas_bruscas'])}")
-        relatorio.append("")
+        maximo = pontos_criticos['maximo_absoluto']
+        minimo = pontos_criticos['minimo_absoluto']
+        
+        formatar_porcentagem = self.formatter.formatar_porcentagem
+        formatar_moeda = self.formatter.formatar_moeda
+        
+        relatorio = [
+            _CABECALHO_RELATORIO,
+            # Tendência geral
+            "📊 TENDÊNCIA GERAL:\n"
+            f"   • Direção: {tendencia['direcao'].value}\n"
+            f"   • Intensidade: {tendencia['intensidade']}\n"
+            f"   • Variação Total: {formatar_porcentagem(tendencia['variacao_percentual'])}\n"
+            f"   • Confiabilidade: {tendencia['confiabilidade']} (R² = {tendencia['r_squared']})\n",
+            # Volatilidade
+            "⚡ VOLATILIDADE:\n"
+            f"   • Classificação: {volatilidade['classificacao']}\n"
+            f"   • Coeficiente de Variação: {formatar_porcentagem(volatilidade['coeficiente_variacao'])}\n"
+            f"   • Variações Significativas: {volatilidade['numero_variacoes_significativas']}\n",
+            # Pontos críticos
+            "🔍 PONTOS CRÍTICOS:\n"
+            f"   • Máximo: {formatar_moeda(maximo['valor'], compacto=True)} ({maximo['data_periodo']})\n"
+            f"   • Mínimo: {formatar_moeda(minimo['valor'], compacto=True)} ({minimo['data_periodo']})\n"
+            f"   • Mudanças Bruscas: {len(pontos_criticos['mudancas_bruscas'])}\n",
+        ]
         
         # Insights
         if analise_tendencias['insights_tendencia']:
             relatorio.append("💡 INSIGHTS:")
-            for insight in analise_tendencias['insights_tendencia']:
-                relatorio.append(f"   • {insight}")
+            relatorio.extend(f"   • {insight}" for insight in analise_tendencias['insights_tendencia'])
             relatorio.append("")
         
         # Recomendações
         if analise_tendencias['recomendacoes']:
             relatorio.append("🎯 RECOMENDAÇÕES:")
-            for rec in analise_tendencias['recomendacoes']:
-                relatorio.append(f"   • {rec}")
+            relatorio.extend(f"   • {rec}" for rec in analise_tendencias['recomendacoes'])
             relatorio.append("")
         
         return "\n".join(relatorio)
\ No newline at end of file
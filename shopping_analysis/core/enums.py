@@ -13,6 +13,15 @@ class StatusKPI(str, Enum):
     EXCELENTE = "EXCELENTE"
 
 
+class KPICategoria(str, Enum):
+    """Categoria dos KPIs financeiros, usada para direcionar recomendações"""
+    INADIMPLENCIA = "INADIMPLÊNCIA"
+    RECEITA = "RECEITA"
+    SALDO = "SALDO"
+    DESPESA = "DESPESA"
+    OUTROS = "OUTROS"
+
+
 class RiskLevel(str, Enum):
     """Níveis de risco para inadimplência e análises"""
     MUITO_ALTO = "MUITO_ALTO"
@@ -0,0 +1,37 @@
+"""
+Memória LRU de resultados de análise, compartilhada pelos analisadores.
+Os resultados guardados nunca saem da memória: cada consulta devolve uma cópia profunda.
+"""
+import copy
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+class MemoriaAnalises:
+    """Resultados de analisar() indexados pela impressão digital da entrada (LRU)"""
+
+    __slots__ = ('capacidade', '_itens')
+
+    def __init__(self, capacidade: int = 32):
+        self.capacidade = capacidade
+        self._itens: 'OrderedDict[Hashable, Dict[str, Any]]' = OrderedDict()
+
+    def obter(self, chave: Hashable, calcular: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Retorna uma cópia do resultado memorizado para a chave, calculando-o na primeira consulta.
+
+        A cópia é profunda para que o chamador possa alterar listas e dicts aninhados
+        (rankings, métricas) sem afetar as próximas consultas.
+        """
+        resultado = self._itens.get(chave)
+        if resultado is None:
+            resultado = calcular()
+            self._itens[chave] = resultado
+            if len(self._itens) > self.capacidade:
+                self._itens.popitem(last=False)
+        else:
+            self._itens.move_to_end(chave)
+        return copy.deepcopy(resultado)
+
+    def __len__(self) -> int:
+        return len(self._itens)
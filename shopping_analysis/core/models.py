@@ -5,10 +5,10 @@ Baseado nos dados reais do Shopping Park Botucatu com validação robusta.
 from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from .enums import (
     StatusKPI, RiskLevel, TrendDirection, InsightType, 
-    InsightPriority, DebtStatus, CashFlowType, PeriodType
+    InsightPriority, DebtStatus, PeriodType, KPICategoria
 )
 
 
@@ -18,18 +18,21 @@ class KPIFinanceiro(BaseModel):
     valor: Decimal = Field(..., description="Valor numérico do KPI")
     unidade: str = Field(..., description="Unidade (R$, %, unidade)")
     status: StatusKPI = Field(..., description="Status de classificação")
+    categoria: KPICategoria = Field(KPICategoria.OUTROS, description="Categoria do KPI")
     meta: Optional[Decimal] = Field(None, description="Meta estabelecida")
     variacao_percentual: Optional[Decimal] = Field(None, description="Variação % em relação à meta ou período anterior")
     observacoes: Optional[str] = Field(None, description="Observações adicionais")
     data_referencia: datetime = Field(default_factory=datetime.now, description="Data de referência do KPI")
 
-    @validator('valor')
+    @field_validator('valor')
+    @classmethod
     def validar_valor(cls, v):
-        if v < 0 and "saldo" not in cls.__name__.lower():
+        if v < 0:
             raise ValueError("KPIs não podem ter valores negativos (exceto saldos)")
         return v
 
-    @validator('variacao_percentual')
+    @field_validator('variacao_percentual')
+    @classmethod
     def validar_variacao(cls, v):
         if v is not None and abs(v) > 1000:
             raise ValueError("Variação percentual muito alta, verificar dados")
@@ -45,7 +48,8 @@ class MovimentacaoFinanceira(BaseModel):
     saldo_operacional: Decimal = Field(..., description="Saldo operacional do mês")
     tipo_periodo: PeriodType = Field(PeriodType.MENSAL, description="Tipo do período")
 
-    @validator('credito', 'debito')
+    @field_validator('credito', 'debito')
+    @classmethod
     def validar_movimentacoes(cls, v):
         if v < 0:
             raise ValueError("Valores de crédito e débito devem ser positivos")
@@ -74,13 +78,15 @@ class Inadimplente(BaseModel):
     ultima_negociacao: Optional[datetime] = Field(None, description="Data da última negociação")
     risco: Optional[RiskLevel] = Field(None, description="Nível de risco calculado")
 
-    @validator('valor_divida')
+    @field_validator('valor_divida')
+    @classmethod
     def validar_valor_divida(cls, v):
         if v <= 0:
             raise ValueError("Valor da dívida deve ser positivo")
         return v
 
-    @validator('dias_atraso')
+    @field_validator('dias_atraso')
+    @classmethod
     def validar_dias_atraso(cls, v):
         if v is not None and v < 0:
             raise ValueError("Dias em atraso não podem ser negativos")
@@ -105,7 +111,8 @@ class InsightFinanceiro(BaseModel):
     data_geracao: datetime = Field(default_factory=datetime.now, description="Data de geração do insight")
     score_confianca: Optional[Decimal] = Field(None, description="Score de confiança (0-100)")
 
-    @validator('score_confianca')
+    @field_validator('score_confianca')
+    @classmethod
     def validar_score(cls, v):
         if v is not None and not (0 <= v <= 100):
             raise ValueError("Score de confiança deve estar entre 0 e 100")
@@ -122,7 +129,8 @@ class TendenciaFinanceira(BaseModel):
     previsao_proximos_meses: Optional[Dict[str, Decimal]] = Field(None, description="Previsão para próximos meses")
     confiabilidade: Decimal = Field(..., description="Confiabilidade da análise (0-100)")
 
-    @validator('intensidade', 'confiabilidade')
+    @field_validator('intensidade', 'confiabilidade')
+    @classmethod
     def validar_percentuais(cls, v):
         if not (0 <= v <= 100):
             raise ValueError("Valores devem estar entre 0 e 100")
@@ -147,8 +155,16 @@ class RelatorioExecutivo(BaseModel):
     resumo_executivo: Dict[str, Any] = Field(default_factory=dict, description="Resumo executivo")
     recomendacoes_priorizadas: List[str] = Field(default_factory=list, description="Recomendações priorizadas")
     score_saude_financeira: Optional[Decimal] = Field(None, description="Score geral de saúde financeira")
-
-    @validator('score_saude_financeira')
+    
+    # Contagens da análise (calculadas uma vez na geração do relatório)
+    n_kpis: int = Field(0, ge=0, description="Quantidade de KPIs analisados")
+    n_meses: int = Field(0, ge=0, description="Quantidade de meses de fluxo de caixa analisados")
+    n_inadimplentes: int = Field(0, ge=0, description="Quantidade de inadimplentes analisados")
+    n_insights: int = Field(0, ge=0, description="Quantidade de insights gerados")
+    n_periodos_tendencia: int = Field(0, ge=0, description="Quantidade de períodos da análise de tendências")
+
+    @field_validator('score_saude_financeira')
+    @classmethod
     def validar_score_saude(cls, v):
         if v is not None and not (0 <= v <= 100):
             raise ValueError("Score de saúde financeira deve estar entre 0 e 100")
@@ -161,11 +177,12 @@ class ConfiguracaoAnalise(BaseModel):
     metas_mensais: Optional[Dict[str, Decimal]] = Field(None, description="Metas mensais")
     categorias_priorizadas: List[str] = Field(default_factory=list, description="Categorias com prioridade de análise")
     incluir_previsoes: bool = Field(True, description="Incluir análises preditivas")
+    janela_media_movel: int = Field(3, ge=1, description="Períodos da média móvel usada nas previsões de tendência")
     nivel_detalhamento: str = Field("completo", description="Nível de detalhamento (resumido, completo, detalhado)")
     formato_saida: str = Field("json", description="Formato de saída (json, texto, html)")
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "thresholds_kpi": {
                     "taxa_inadimplencia": {"critico": 50, "atencao": 20, "bom": 10},
@@ -175,4 +192,5 @@ class ConfiguracaoAnalise(BaseModel):
                 "incluir_previsoes": True,
                 "nivel_detalhamento": "completo"
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
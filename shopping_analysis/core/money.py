@@ -0,0 +1,32 @@
+"""
+Utilitários para valores monetários.
+Resultados calculados em float64 são convertidos para Decimal (ROUND_HALF_EVEN) apenas na saída;
+valores de entrada com frações de centavo são arredondados a centavos na conversão.
+"""
+from decimal import Decimal, ROUND_HALF_EVEN
+
+CENTAVOS = Decimal('0.01')
+
+
+def float_para_decimal(valor: float, casas: Decimal = CENTAVOS) -> Decimal:
+    """
+    Converte um resultado float64 para Decimal arredondado (arredondamento bancário).
+
+    Usa a representação mais curta do float (repr), que recupera o valor decimal
+    pretendido antes do arredondamento: 1.015 vira 1.02, e não 1.01 como no valor
+    binário exato do float (1.01499999...).
+    """
+    return Decimal(repr(float(valor))).quantize(casas, rounding=ROUND_HALF_EVEN)
+
+
+def arredondar_centavos(valor: Decimal) -> Decimal:
+    """
+    Arredonda para centavos (ROUND_HALF_EVEN) valores com frações abaixo do centavo.
+
+    Aplicado na entrada dos dados, para que os modelos e os vetores em centavos
+    usados nos cálculos representem o mesmo valor; valores já em centavos
+    (ou não finitos) são devolvidos sem alteração.
+    """
+    if valor.is_finite() and valor.as_tuple().exponent < -2:
+        return valor.quantize(CENTAVOS, rounding=ROUND_HALF_EVEN)
+    return valor
@@ -0,0 +1,33 @@
+"""
+Sumários escalares das análises, usados na saída verbose do CLI.
+Cada analisador devolve seu sumário na chave 'sumario' do resultado.
+"""
+from decimal import Decimal
+from typing import NamedTuple
+
+from .enums import TrendDirection
+
+
+class KpiSummary(NamedTuple):
+    """Sumário da análise de KPIs"""
+    score: Decimal  # 0-100, uma casa decimal
+    n_criticos: int
+
+
+class CashflowSummary(NamedTuple):
+    """Sumário da análise de fluxo de caixa"""
+    saldo_consolidado: Decimal
+    n_meses_criticos: int
+
+
+class DelinquencySummary(NamedTuple):
+    """Sumário da análise de inadimplência"""
+    total_dividas: Decimal
+    maior_devedor: str
+    maior_divida: Decimal
+
+
+class TrendSummary(NamedTuple):
+    """Sumário da análise de tendências"""
+    direcao: TrendDirection
+    volatilidade: str
@@ -5,7 +5,8 @@ Inspirado nos formatadores do projeto React/TypeScript (src/lib/formatters.ts).
 import locale
 from decimal import Decimal
 from datetime import datetime
-from typing import Union, Optional, Tuple
+from functools import lru_cache
+from typing import Union, Tuple
 from ..core.enums import StatusKPI, RiskLevel
 from ..core.exceptions import FormattingError
 
@@ -20,6 +21,9 @@ except locale.Error:
         # Fallback para locale C se não encontrar brasileiro
         locale.setlocale(locale.LC_ALL, 'C')
 
+# Quantidade de textos formatados memorizados por formato (LRU)
+_MAX_FORMATOS_MEMORIZADOS = 4096
+
 
 class BrazilianFormatter:
     """Classe principal para formatação brasileira de valores financeiros"""
@@ -37,23 +41,30 @@ class BrazilianFormatter:
             String formatada (ex: "R$ 1.234.567,89" ou "R$ 1.2M")
         """
         try:
-            valor_decimal = Decimal(str(valor))
-            
-            if compacto:
-                return BrazilianFormatter._formatar_moeda_compacta(valor_decimal)
-            
-            # Formatar com locale brasileiro
-            if valor_decimal >= 0:
-                formatado = f"R$ {valor_decimal:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.')
-            else:
-                valor_abs = abs(valor_decimal)
-                formatado = f"-R$ {valor_abs:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.')
-            
-            return formatado
+            # Memorizado pelo texto do valor, que preserva sinal e expoente do Decimal (ex.: -0.00)
+            return BrazilianFormatter._formatar_moeda_texto(str(valor), compacto)
             
         except (ValueError, TypeError) as e:
             raise FormattingError(valor, "moeda") from e
     
+    @staticmethod
+    @lru_cache(maxsize=_MAX_FORMATOS_MEMORIZADOS)
+    def _formatar_moeda_texto(texto: str, compacto: bool) -> str:
+        """Formata o texto de um valor monetário (ver formatar_moeda)"""
+        valor_decimal = Decimal(texto)
+        
+        if compacto:
+            return BrazilianFormatter._formatar_moeda_compacta(valor_decimal)
+        
+        # Formatar com locale brasileiro
+        if valor_decimal >= 0:
+            formatado = f"R$ {valor_decimal:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.')
+        else:
+            valor_abs = abs(valor_decimal)
+            formatado = f"-R$ {valor_abs:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.')
+        
+        return formatado
+    
     @staticmethod
     def _formatar_moeda_compacta(valor: Decimal) -> str:
         """Formata moeda em formato compacto"""
@@ -115,13 +126,18 @@ class BrazilianFormatter:
             String formatada (ex: "12,5%")
         """
         try:
-            valor_decimal = Decimal(str(valor))
-            formatado = f"{valor_decimal:.{casas_decimais}f}%".replace('.', ',')
-            return formatado
+            # Memorizado pelo texto do valor, como em formatar_moeda
+            return BrazilianFormatter._formatar_porcentagem_texto(str(valor), casas_decimais)
             
         except (ValueError, TypeError) as e:
             raise FormattingError(valor, "porcentagem") from e
     
+    @staticmethod
+    @lru_cache(maxsize=_MAX_FORMATOS_MEMORIZADOS)
+    def _formatar_porcentagem_texto(texto: str, casas_decimais: int) -> str:
+        """Formata o texto de um valor percentual (ver formatar_porcentagem)"""
+        return f"{Decimal(texto):.{casas_decimais}f}%".replace('.', ',')
+    
     @staticmethod
     def formatar_variacao(valor: Union[Decimal, float], incluir_sinal: bool = True) -> dict:
         """
@@ -2,15 +2,12 @@
 Engine de Insights Automáticos para Shopping Centers.
 Inspirado no framework AVA (Automated Visual Analytics) do projeto React/TypeScript.
 """
+from collections import Counter
 from decimal import Decimal
-from typing import List, Dict, Optional, Any, Tuple
-from datetime import datetime
+from typing import List, Dict, Optional, Any
 
-from ..core.models import (
-    InsightFinanceiro, KPIFinanceiro, MovimentacaoFinanceira, 
-    Inadimplente, ConfiguracaoAnalise
-)
-from ..core.enums import InsightType, InsightPriority, StatusKPI, RiskLevel
+from ..core.models import InsightFinanceiro, Inadimplente, ConfiguracaoAnalise
+from ..core.enums import InsightType, InsightPriority
 from ..core.exceptions import InsightGenerationError
 from ..formatters.brazilian import BrazilianFormatter
 
@@ -22,6 +19,7 @@ class InsightEngine:
         self.configuracao = configuracao or ConfiguracaoAnalise()
         self.formatter = BrazilianFormatter()
         self.insights_gerados = []
+        self.contagem_prioridades: Counter = Counter()
     
     def gerar_insights_completos(self, dados_analise: Dict[str, Any]) -> List[InsightFinanceiro]:
         """
@@ -35,6 +33,7 @@ class InsightEngine:
         """
         try:
             self.insights_gerados.clear()
+            self.contagem_prioridades.clear()
             
             # Gerar insights por tipo de análise
             if 'analise_kpis' in dados_analise:
@@ -53,9 +52,10 @@ class InsightEngine:
             # Priorizar e classificar insights
             insights_priorizados = self._priorizar_insights(self.insights_gerados)
             
-            # Aplicar score de confiança
+            # Aplicar score de confiança e contar por prioridade (chave: valor do enum)
             for insight in insights_priorizados:
                 insight.score_confianca = self._calcular_score_confianca(insight, dados_analise)
+                self.contagem_prioridades[insight.prioridade.value] += 1
             
             return insights_priorizados
             
@@ -383,24 +383,24 @@ class InsightEngine:
         score_base = Decimal('70')  # Score base
         
         # Ajustar baseado no tipo de insight
-        if insight.tipo == InsightType.KPI:
+        if insight.tipo is InsightType.KPI:
             # KPIs têm alta confiabilidade por serem dados diretos
             score_base += Decimal('20')
-        elif insight.tipo == InsightType.FLUXO_CAIXA:
+        elif insight.tipo is InsightType.FLUXO_CAIXA:
             # Fluxo de caixa depende da quantidade de dados
             num_movimentacoes = len(dados_analise.get('analise_cashflow', {}).get('movimentacoes_analisadas', []))
             if num_movimentacoes >= 6:
                 score_base += Decimal('15')
             elif num_movimentacoes >= 3:
                 score_base += Decimal('10')
-        elif insight.tipo == InsightType.INADIMPLENCIA:
+        elif insight.tipo is InsightType.INADIMPLENCIA:
             # Inadimplência depende da completude dos dados
             num_inadimplentes = len(dados_analise.get('analise_inadimplencia', {}).get('inadimplentes_analisados', []))
             if num_inadimplentes >= 5:
                 score_base += Decimal('10')
         
         # Ajustar baseado na prioridade (insights críticos tendem a ser mais confiáveis)
-        if insight.prioridade == InsightPriority.CRITICA:
+        if insight.prioridade is InsightPriority.CRITICA:
             score_base += Decimal('5')
         
         # Garantir que está no range 0-100
@@ -418,15 +418,13 @@ class InsightEngine:
             'recomendacoes_prioritarias': []
         }
         
-        # Contar por prioridade
+        # Contar por prioridade e por tipo em uma única passada
+        contagem_prioridades = Counter(i.prioridade for i in insights)
+        contagem_tipos = Counter(i.tipo for i in insights)
         for prioridade in InsightPriority:
-            count = len([i for i in insights if i.prioridade == prioridade])
-            resumo['por_prioridade'][prioridade.value] = count
-        
-        # Contar por tipo
+            resumo['por_prioridade'][prioridade.value] = contagem_prioridades[prioridade]
         for tipo in InsightType:
-            count = len([i for i in insights if i.tipo == tipo])
-            resumo['por_tipo'][tipo.value] = count
+            resumo['por_tipo'][tipo.value] = contagem_tipos[tipo]
         
         # Calcular métricas agregadas
         if insights:
@@ -443,12 +441,12 @@ class InsightEngine:
                 'valor_impacto': float(i.valor_impacto or 0),
                 'score_confianca': float(i.score_confianca or 0)
             }
-            for i in insights if i.prioridade == InsightPriority.CRITICA
+            for i in insights if i.prioridade is InsightPriority.CRITICA
         ]
         
         # Extrair recomendações prioritárias (dos insights críticos)
         for insight in insights:
-            if insight.prioridade == InsightPriority.CRITICA and insight.recomendacoes:
+            if insight.prioridade is InsightPriority.CRITICA and insight.recomendacoes:
                 resumo['recomendacoes_prioritarias'].extend(insight.recomendacoes[:2])  # Top 2 por insight
         
         # Limitar a 10 recomendações prioritárias
@@ -475,7 +473,7 @@ class InsightEngine:
         relatorio.append("")
         
         # Insights críticos detalhados
-        insights_criticos = [i for i in insights if i.prioridade == InsightPriority.CRITICA]
+        insights_criticos = [i for i in insights if i.prioridade is InsightPriority.CRITICA]
         if insights_criticos:
             relatorio.append("🚨 INSIGHTS CRÍTICOS:")
             for i, insight in enumerate(insights_criticos, 1):
@@ -495,7 +493,7 @@ class InsightEngine:
             insights_por_tipo[insight.tipo].append(insight)
         
         for tipo, insights_tipo in insights_por_tipo.items():
-            if len(insights_tipo) > 0 and tipo != InsightType.OPERACIONAL:  # Operacional já foi mostrado acima
+            if len(insights_tipo) > 0 and tipo is not InsightType.OPERACIONAL:  # Operacional já foi mostrado acima
                 emoji_tipo = {
                     InsightType.KPI: "📈",
                     InsightType.FLUXO_CAIXA: "💰",
@@ -4,8 +4,15 @@ Consolida todas as análises em relatório final estruturado em português brasi
 """
 import json
 from decimal import Decimal
-from typing import List, Dict, Optional, Any
+from enum import Enum
+from typing import List, Dict, Optional, Any, Union, Iterator
 from datetime import datetime
+from pathlib import Path
+
+try:
+    import orjson  # Serialização JSON acelerada (opcional)
+except ImportError:
+    orjson = None
 
 from ..core.models import RelatorioExecutivo, InsightFinanceiro, ConfiguracaoAnalise
 from ..core.enums import InsightPriority, StatusKPI
@@ -16,9 +23,14 @@ from ..formatters.brazilian import BrazilianFormatter
 class ReportGenerator:
     """Gerador principal de relatórios executivos consolidados"""
     
-    def __init__(self, configuracao: Optional[ConfiguracaoAnalise] = None):
+    def __init__(self, configuracao: Optional[ConfiguracaoAnalise] = None,
+                 diretorio_saida: Optional[Union[str, Path]] = None):
         self.configuracao = configuracao or ConfiguracaoAnalise()
         self.formatter = BrazilianFormatter()
+        # Diretório padrão de salvar_relatorio, criado uma única vez (None: diretório atual)
+        self.diretorio_saida = Path(diretorio_saida) if diretorio_saida is not None else None
+        if self.diretorio_saida is not None:
+            self.diretorio_saida.mkdir(parents=True, exist_ok=True)
     
     def gerar_relatorio_completo(self, dados_analises: Dict[str, Any], 
                                shopping_center: str = "Shopping Park Botucatu") -> RelatorioExecutivo:
@@ -58,7 +70,14 @@ class ReportGenerator:
                 # Resumo executivo
                 resumo_executivo=self._gerar_resumo_executivo(dados_analises),
                 recomendacoes_priorizadas=self._extrair_recomendacoes_priorizadas(insights),
-                score_saude_financeira=self._calcular_score_geral(dados_analises)
+                score_saude_financeira=self._calcular_score_geral(dados_analises),
+                
+                # Contagens
+                n_kpis=len(analise_kpis.get('kpis_analisados', [])),
+                n_meses=len(analise_cashflow.get('movimentacoes_analisadas', [])),
+                n_inadimplentes=len(analise_inadimplencia.get('inadimplentes_analisados', [])),
+                n_insights=len(insights),
+                n_periodos_tendencia=dados_analises.get('analise_tendencias', {}).get('periodos_analisados', 0)
             )
             
             return relatorio
@@ -115,7 +134,7 @@ class ReportGenerator:
         if not insights:
             return []
         
-        return [i for i in insights if i.prioridade == InsightPriority.CRITICA]
+        return [i for i in insights if i.prioridade is InsightPriority.CRITICA]
     
     def _extrair_tendencias(self, dados_analises: Dict[str, Any]) -> List:
         """Extrai tendências de todas as análises"""
@@ -202,7 +221,7 @@ class ReportGenerator:
         recomendacoes = []
         
         # Priorizar recomendações dos insights críticos
-        insights_criticos = [i for i in insights if i.prioridade == InsightPriority.CRITICA]
+        insights_criticos = [i for i in insights if i.prioridade is InsightPriority.CRITICA]
         for insight in insights_criticos:
             if insight.recomendacoes:
                 # Adicionar as 2 primeiras recomendações de cada insight crítico
@@ -210,7 +229,7 @@ class ReportGenerator:
         
         # Adicionar recomendações de insights de alta prioridade se necessário
         if len(recomendacoes) < 8:
-            insights_altos = [i for i in insights if i.prioridade == InsightPriority.ALTA]
+            insights_altos = [i for i in insights if i.prioridade is InsightPriority.ALTA]
             for insight in insights_altos:
                 if len(recomendacoes) >= 10:
                     break
@@ -240,127 +259,134 @@ class ReportGenerator:
     
     def gerar_relatorio_texto(self, relatorio: RelatorioExecutivo) -> str:
         """Gera relatório em formato texto estruturado"""
+        return "\n".join(self.iter_relatorio_texto(relatorio))
+    
+    def iter_relatorio_texto(self, relatorio: RelatorioExecutivo) -> Iterator[str]:
+        """Gera as linhas do relatório em formato texto, uma por vez (sem quebra de linha)"""
         try:
-            texto = []
-            
             # Cabeçalho
-            texto.append("=" * 80)
-            texto.append(f"📊 {relatorio.titulo.upper()}")
-            texto.append("=" * 80)
-            texto.append(f"Shopping Center: {relatorio.shopping_center}")
-            texto.append(f"Período de Referência: {relatorio.periodo_referencia}")
-            texto.append(f"Data de Geração: {self.formatter.formatar_data(relatorio.data_geracao, 'dd/mm/yyyy hh:mm')}")
+            yield "=" * 80
+            yield f"📊 {relatorio.titulo.upper()}"
+            yield "=" * 80
+            yield f"Shopping Center: {relatorio.shopping_center}"
+            yield f"Período de Referência: {relatorio.periodo_referencia}"
+            yield f"Data de Geração: {self.formatter.formatar_data(relatorio.data_geracao, 'dd/mm/yyyy hh:mm')}"
             
             if relatorio.score_saude_financeira:
-                texto.append(f"Score de Saúde Financeira: {self.formatter.formatar_porcentagem(relatorio.score_saude_financeira)}")
+                yield f"Score de Saúde Financeira: {self.formatter.formatar_porcentagem(relatorio.score_saude_financeira)}"
             
-            texto.append("")
+            yield ""
             
             # Resumo Executivo
-            texto.append("🎯 RESUMO EXECUTIVO")
-            texto.append("-" * 50)
+            yield "🎯 RESUMO EXECUTIVO"
+            yield "-" * 50
             resumo = relatorio.resumo_executivo
-            texto.append(f"Situação Geral: {resumo.get('situacao_geral', 'Não avaliada')}")
-            texto.append("")
+            yield f"Situação Geral: {resumo.get('situacao_geral', 'Não avaliada')}"
+            yield ""
             
             # Principais Desafios
             desafios = resumo.get('principais_desafios', [])
             if desafios:
-                texto.append("🚨 PRINCIPAIS DESAFIOS:")
+                yield "🚨 PRINCIPAIS DESAFIOS:"
                 for i, desafio in enumerate(desafios, 1):
-                    texto.append(f"   {i}. {desafio}")
-                texto.append("")
+                    yield f"   {i}. {desafio}"
+                yield ""
             
             # Oportunidades
             oportunidades = resumo.get('oportunidades_identificadas', [])
             if oportunidades:
-                texto.append("💡 OPORTUNIDADES IDENTIFICADAS:")
+                yield "💡 OPORTUNIDADES IDENTIFICADAS:"
                 for i, oportunidade in enumerate(oportunidades, 1):
-                    texto.append(f"   {i}. {oportunidade}")
-                texto.append("")
+                    yield f"   {i}. {oportunidade}"
+                yield ""
             
             # KPIs Principais
             if relatorio.kpis_principais:
-                texto.append("📈 INDICADORES FINANCEIROS PRINCIPAIS")
-                texto.append("-" * 50)
+                yield "📈 INDICADORES FINANCEIROS PRINCIPAIS"
+                yield "-" * 50
                 for kpi in relatorio.kpis_principais:
                     emoji_status = self._obter_emoji_status(kpi.status)
                     valor_formatado = self._formatar_valor_kpi(kpi)
-                    texto.append(f"{emoji_status} {kpi.nome}: {valor_formatado} ({kpi.status.value})")
+                    yield f"{emoji_status} {kpi.nome}: {valor_formatado} ({kpi.status.value})"
                     if kpi.observacoes:
-                        texto.append(f"   Observação: {kpi.observacoes}")
-                texto.append("")
+                        yield f"   Observação: {kpi.observacoes}"
+                yield ""
             
             # Fluxo de Caixa - Resumo
             if relatorio.fluxo_caixa:
-                texto.append("💰 FLUXO DE CAIXA - RESUMO")
-                texto.append("-" * 50)
+                yield "💰 FLUXO DE CAIXA - RESUMO"
+                yield "-" * 50
                 
                 # Calcular totais
                 total_creditos = sum(mov.credito for mov in relatorio.fluxo_caixa)
                 total_debitos = sum(mov.debito for mov in relatorio.fluxo_caixa)
                 saldo_total = sum(mov.saldo_operacional for mov in relatorio.fluxo_caixa)
                 
-                texto.append(f"Total de Créditos: {self.formatter.formatar_moeda(total_creditos, compacto=True)}")
-                texto.append(f"Total de Débitos: {self.formatter.formatar_moeda(total_debitos, compacto=True)}")
-                texto.append(f"Saldo Consolidado: {self.formatter.formatar_moeda(saldo_total, compacto=True)}")
+                yield f"Total de Créditos: {self.formatter.formatar_moeda(total_creditos, compacto=True)}"
+                yield f"Total de Débitos: {self.formatter.formatar_moeda(total_debitos, compacto=True)}"
+                yield f"Saldo Consolidado: {self.formatter.formatar_moeda(saldo_total, compacto=True)}"
                 
                 # Melhor e pior mês
                 melhor_mes = max(relatorio.fluxo_caixa, key=lambda x: x.saldo_operacional)
                 pior_mes = min(relatorio.fluxo_caixa, key=lambda x: x.saldo_operacional)
                 
-                texto.append(f"Melhor Mês: {melhor_mes.periodo_completo} ({self.formatter.formatar_moeda(melhor_mes.saldo_operacional, compacto=True)})")
-                texto.append(f"Pior Mês: {pior_mes.periodo_completo} ({self.formatter.formatar_moeda(pior_mes.saldo_operacional, compacto=True)})")
-                texto.append("")
+                yield f"Melhor Mês: {melhor_mes.periodo_completo} ({self.formatter.formatar_moeda(melhor_mes.saldo_operacional, compacto=True)})"
+                yield f"Pior Mês: {pior_mes.periodo_completo} ({self.formatter.formatar_moeda(pior_mes.saldo_operacional, compacto=True)})"
+                yield ""
             
             # Maiores Inadimplentes
             if relatorio.maiores_inadimplentes:
-                texto.append("⚠️  TOP 5 MAIORES INADIMPLENTES")
-                texto.append("-" * 50)
+                yield "⚠️  TOP 5 MAIORES INADIMPLENTES"
+                yield "-" * 50
                 for i, inadimplente in enumerate(relatorio.maiores_inadimplentes[:5], 1):
                     valor_formatado = self.formatter.formatar_moeda(inadimplente.valor_divida, compacto=True)
-                    texto.append(f"{i}º. {inadimplente.nome}: {valor_formatado}")
-                    texto.append(f"    Status: {inadimplente.status.value} | Risco: {inadimplente.risco.value}")
-                texto.append("")
+                    yield f"{i}º. {inadimplente.nome}: {valor_formatado}"
+                    yield f"    Status: {inadimplente.status.value} | Risco: {inadimplente.risco.value}"
+                yield ""
             
             # Insights Críticos
             if relatorio.insights_criticos:
-                texto.append("🧠 INSIGHTS CRÍTICOS")
-                texto.append("-" * 50)
+                yield "🧠 INSIGHTS CRÍTICOS"
+                yield "-" * 50
                 for i, insight in enumerate(relatorio.insights_criticos, 1):
-                    texto.append(f"{i}. {insight.titulo}")
-                    texto.append(f"   {insight.descricao}")
+                    yield f"{i}. {insight.titulo}"
+                    yield f"   {insight.descricao}"
                     if insight.valor_impacto:
-                        texto.append(f"   Impacto Estimado: {self.formatter.formatar_moeda(insight.valor_impacto, compacto=True)}")
+                        yield f"   Impacto Estimado: {self.formatter.formatar_moeda(insight.valor_impacto, compacto=True)}"
                     if insight.recomendacoes:
-                        texto.append(f"   Ação Principal: {insight.recomendacoes[0]}")
-                    texto.append("")
+                        yield f"   Ação Principal: {insight.recomendacoes[0]}"
+                    yield ""
             
             # Recomendações Priorizadas
             if relatorio.recomendacoes_priorizadas:
-                texto.append("🎯 RECOMENDAÇÕES PRIORITÁRIAS")
-                texto.append("-" * 50)
+                yield "🎯 RECOMENDAÇÕES PRIORITÁRIAS"
+                yield "-" * 50
                 for i, recomendacao in enumerate(relatorio.recomendacoes_priorizadas, 1):
-                    texto.append(f"{i}. {recomendacao}")
-                texto.append("")
+                    yield f"{i}. {recomendacao}"
+                yield ""
             
             # Rodapé
-            texto.append("=" * 80)
-            texto.append("📋 Relatório gerado automaticamente pelo Sistema de Análise Financeira")
-            texto.append(f"🏢 {relatorio.shopping_center} - {self.formatter.formatar_data(datetime.now(), 'dd/mm/yyyy')}")
-            texto.append("=" * 80)
-            
-            return "\n".join(texto)
+            yield "=" * 80
+            yield "📋 Relatório gerado automaticamente pelo Sistema de Análise Financeira"
+            yield f"🏢 {relatorio.shopping_center} - {self.formatter.formatar_data(datetime.now(), 'dd/mm/yyyy')}"
+            yield "=" * 80
             
         except Exception as e:
             raise ReportGenerationError("relatorio_texto", str(e)) from e
     
     def gerar_relatorio_json(self, relatorio: RelatorioExecutivo) -> str:
         """Gera relatório em formato JSON estruturado"""
+        conteudo = self._serializar_json(relatorio)
+        return conteudo.decode('utf-8') if isinstance(conteudo, bytes) else conteudo
+    
+    def _serializar_json(self, relatorio: RelatorioExecutivo) -> Union[bytes, str]:
+        """Serializa o relatório com orjson quando disponível (bytes UTF-8) ou json da stdlib (str)"""
         try:
             # Converter Decimal e outros tipos para JSON serializable
-            relatorio_dict = self._converter_para_json_serializable(relatorio.dict())
+            relatorio_dict = self._converter_para_json_serializable(relatorio.model_dump())
             
+            if orjson is not None:
+                return orjson.dumps(relatorio_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
             return json.dumps(relatorio_dict, indent=2, ensure_ascii=False)
             
         except Exception as e:
@@ -372,9 +398,11 @@ class ReportGenerator:
             return float(obj)
         elif isinstance(obj, datetime):
             return obj.isoformat()
+        elif isinstance(obj, Enum):
+            return obj.value
         elif isinstance(obj, dict):
             return {k: self._converter_para_json_serializable(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
+        elif isinstance(obj, (list, tuple)):
             return [self._converter_para_json_serializable(item) for item in obj]
         elif hasattr(obj, '__dict__'):
             return self._converter_para_json_serializable(obj.__dict__)
@@ -409,7 +437,7 @@ class ReportGenerator:
         Args:
             relatorio: Relatório a ser salvo
             formato: 'texto' ou 'json'
-            caminho: Caminho do arquivo (opcional)
+            caminho: Caminho do arquivo (opcional; padrão: nome com timestamp em diretorio_saida)
             
         Returns:
             Caminho do arquivo salvo
@@ -419,16 +447,22 @@ class ReportGenerator:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 extensao = "txt" if formato == "texto" else "json"
                 caminho = f"relatorio_financeiro_{timestamp}.{extensao}"
+                if self.diretorio_saida is not None:
+                    caminho = str(self.diretorio_saida / caminho)
             
             if formato == "texto":
                 conteudo = self.gerar_relatorio_texto(relatorio)
             elif formato == "json":
-                conteudo = self.gerar_relatorio_json(relatorio)
+                conteudo = self._serializar_json(relatorio)
             else:
                 raise ValueError(f"Formato não suportado: {formato}")
             
-            with open(caminho, 'w', encoding='utf-8') as arquivo:
-                arquivo.write(conteudo)
+            if isinstance(conteudo, bytes):
+                with open(caminho, 'wb') as arquivo:
+                    arquivo.write(conteudo)
+            else:
+                with open(caminho, 'w', encoding='utf-8') as arquivo:
+                    arquivo.write(conteudo)
             
             return caminho
             
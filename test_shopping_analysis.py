@@ -18,6 +18,9 @@ try:
     from shopping_analysis.analyzers.trend_analyzer import TrendAnalyzer
     from shopping_analysis.insights.insight_engine import InsightEngine
     from shopping_analysis.reports.report_generator import ReportGenerator
+    from shopping_analysis.core.models import ConfiguracaoAnalise
+    from shopping_analysis.core.enums import KPICategoria
+    import run_shopping_analysis
     print("✅ Todos os módulos importados com sucesso!")
 except ImportError as e:
     print(f"❌ Erro de import: {e}")
@@ -123,6 +126,337 @@ def teste_dados_basicos():
     
     return True
 
+def teste_memoria_inadimplencia_isolada():
+    """Alterar um resultado devolvido não afeta a próxima análise memorizada"""
+    inadimplentes = [
+        {'nome': 'Teste A', 'valor_divida': 60000, 'status': 'em_atraso'},
+        {'nome': 'Teste B', 'valor_divida': 3000, 'status': 'negociacao'}
+    ]
+    analyzer = DelinquencyAnalyzer()
+
+    resultado = analyzer.analisar(inadimplentes, Decimal('1000000'))
+    resultado['ranking_por_valor'].pop()
+    resultado['metricas_gerais']['valor_total_inadimplencia'] = 0
+    resultado['recomendacoes'].clear()
+
+    novo = analyzer.analisar(inadimplentes, Decimal('1000000'))
+    assert len(novo['ranking_por_valor']) == 2
+    assert novo['metricas_gerais']['valor_total_inadimplencia'] == Decimal('63000')
+    assert novo['recomendacoes']
+
+def teste_memoria_tendencias_isolada():
+    """Alterar um resultado de tendências devolvido não afeta a próxima análise memorizada"""
+    fluxo = [{'mes': 'Janeiro', 'ano': 2025, 'saldo_operacional': valor} for valor in (20000, 5000, 40000, 8000)]
+    analyzer = TrendAnalyzer()
+
+    resultado = analyzer.analisar(fluxo, 'fluxo_caixa')
+    recomendacoes = list(resultado['recomendacoes'])
+    assert recomendacoes
+    resultado['recomendacoes'].clear()
+    resultado['pontos_criticos']['mudancas_bruscas'].clear()
+
+    novo = analyzer.analisar(fluxo, 'fluxo_caixa')
+    assert novo['recomendacoes'] == recomendacoes
+    assert novo['pontos_criticos']['mudancas_bruscas']
+
+def teste_fluxo_caixa_fracoes_de_centavo():
+    """Frações de centavo são arredondadas nos modelos, que coincidem com os totais e regras"""
+    fluxo = [
+        {'mes': 'Janeiro', 'ano': 2025, 'credito': '13525190.495', 'debito': '0.005', 'saldo_operacional': '13525190.49'},
+        {'mes': 'Fevereiro', 'ano': 2025, 'credito': 100000, 'debito': 80000, 'saldo_operacional': '-0.004'},
+        {'mes': 'Março', 'ano': 2025, 'credito': 105000, 'debito': 90000, 'saldo_operacional': 15000}
+    ]
+    resultado = CashFlowAnalyzer().analisar(fluxo)
+    movimentacoes = resultado['movimentacoes_analisadas']
+    resumo = resultado['resumo_mensal']
+
+    assert movimentacoes[0].credito == Decimal('13525190.50')
+    assert movimentacoes[0].debito == Decimal('0.00')
+    assert movimentacoes[1].saldo_operacional == Decimal('0.00')
+    assert resumo['total_creditos'] == sum(mov.credito for mov in movimentacoes)
+    assert resumo['total_debitos'] == sum(mov.debito for mov in movimentacoes)
+    assert resumo['meses_negativos'] == 0
+
+def teste_inadimplencia_fracoes_de_centavo():
+    """Frações de centavo são arredondadas nos modelos; modos float e Decimal estrito coincidem"""
+    inadimplentes = [
+        {'nome': 'Teste A', 'valor_divida': '60000.005', 'status': 'em_atraso'},
+        {'nome': 'Teste B', 'valor_divida': '3000.015', 'status': 'acordo'},
+        {'nome': 'Teste C', 'valor_divida': '0.125', 'status': 'negociacao'}
+    ]
+    resultados = [
+        analyzer.analisar(inadimplentes, Decimal('1000000'))
+        for analyzer in (DelinquencyAnalyzer(), DelinquencyAnalyzer(decimal_estrito=True))
+    ]
+
+    for resultado in resultados:
+        valores = [inad.valor_divida for inad in resultado['inadimplentes_analisados']]
+        assert valores == [Decimal('60000.00'), Decimal('3000.02'), Decimal('0.12')]
+        assert resultado['metricas_gerais']['valor_total_inadimplencia'] == sum(valores)
+    recuperacoes = [r['impacto_financeiro']['potencial_recuperacao'] for r in resultados]
+    assert recuperacoes[0] == recuperacoes[1]
+
+def teste_inadimplencia_limites_alterados():
+    """Alterar thresholds_risco após a construção muda a classificação, mesmo com análise memorizada"""
+    inadimplentes = [
+        {'nome': 'Teste A', 'valor_divida': 10000, 'status': 'confissao_divida'},
+        {'nome': 'Teste B', 'valor_divida': 3000, 'status': 'acordo'}
+    ]
+    analyzer = DelinquencyAnalyzer()
+    acao_padrao = analyzer.analisar(inadimplentes)['ranking_por_valor'][0]['recomendacao_acao']
+
+    analyzer.thresholds_risco.update(valor_alto=Decimal('9000'), valor_medio=Decimal('8000'))
+    acao_alterada = analyzer.analisar(inadimplentes)['ranking_por_valor'][0]['recomendacao_acao']
+
+    assert acao_padrao == "Negociação direta com flexibilidade de prazo"
+    assert acao_alterada == "Execução judicial imediata"
+
+def teste_relatorio_reflete_dados_alterados():
+    """Gerar de novo após alterar os dados (ou o relatório) não devolve conteúdo antigo"""
+    report_generator = ReportGenerator()
+    dados_analise = {'analise_kpis': {'score_saude_financeira': 40, 'kpis_analisados': []}}
+
+    relatorio = report_generator.gerar_relatorio_completo(dados_analise, "Shopping Teste")
+    assert relatorio.score_saude_financeira == Decimal('40.0')
+
+    dados_analise['analise_kpis']['score_saude_financeira'] = 80
+    relatorio = report_generator.gerar_relatorio_completo(dados_analise, "Shopping Teste")
+    assert relatorio.score_saude_financeira == Decimal('80.0')
+
+    assert "Shopping Center: Shopping Teste" in report_generator.gerar_relatorio_texto(relatorio)
+    relatorio.shopping_center = "Shopping Alterado"
+    assert "Shopping Center: Shopping Alterado" in report_generator.gerar_relatorio_texto(relatorio)
+
+def teste_cache_modos(tmp_path, monkeypatch):
+    """--cache-mode enabled grava, replay só lê do disco e disabled sempre recalcula sem gravar"""
+    monkeypatch.setattr(run_shopping_analysis, '_CACHE_DIR', tmp_path)
+    monkeypatch.setattr(run_shopping_analysis, '_cache_memoria', run_shopping_analysis.MemoriaAnalises(8))
+    dados = run_shopping_analysis.obter_dados_shopping_park_botucatu()
+    executar = run_shopping_analysis.executar_analise_com_cache
+
+    try:
+        executar(dados, modo_cache='replay')
+        assert False, "replay sem cache deveria falhar"
+    except RuntimeError:
+        pass
+
+    resultados = executar(dados, modo_cache='enabled')
+    assert len(list(tmp_path.glob('*.pkl'))) == 1
+
+    # Sem a memória do processo, replay recupera o arquivo gravado
+    monkeypatch.setattr(run_shopping_analysis, '_cache_memoria', run_shopping_analysis.MemoriaAnalises(8))
+    recuperados = executar(dados, modo_cache='replay')
+    assert recuperados is not resultados
+    assert recuperados['analise_kpis']['score_saude_financeira'] == resultados['analise_kpis']['score_saude_financeira']
+
+    # disabled recalcula e não grava (opções diferentes gerariam outro arquivo)
+    executar(dados, modo_cache='disabled', minimal=True)
+    assert len(list(tmp_path.glob('*.pkl'))) == 1
+
+    parser = run_shopping_analysis._PARSER
+    assert parser.parse_args([]).cache_mode == 'enabled'
+    assert parser.parse_args(['--cache-mode', 'replay']).cache_mode == 'replay'
+    assert parser.parse_args(['--no-cache']).cache_mode == 'disabled'
+
+def teste_cache_memoria_isolada(tmp_path, monkeypatch):
+    """Alterar resultados devolvidos pelo cache não afeta as próximas execuções no mesmo processo"""
+    monkeypatch.setattr(run_shopping_analysis, '_CACHE_DIR', tmp_path)
+    monkeypatch.setattr(run_shopping_analysis, '_cache_memoria', run_shopping_analysis.MemoriaAnalises(8))
+    dados = run_shopping_analysis.obter_dados_shopping_park_botucatu()
+    executar = run_shopping_analysis.executar_analise_com_cache
+
+    primeiro = executar(dados)
+    n_insights = len(primeiro['insights'])
+    score = primeiro['analise_kpis']['score_saude_financeira']
+    primeiro['insights'].clear()
+    primeiro['analise_kpis']['score_saude_financeira'] = 0
+
+    segundo = executar(dados)
+    assert segundo is not primeiro
+    assert len(segundo['insights']) == n_insights > 0
+    assert segundo['analise_kpis']['score_saude_financeira'] == score
+    assert run_shopping_analysis._cache_memoria.capacidade == 8
+
+def teste_cache_chave_inclui_script():
+    """A impressão do código inclui run_shopping_analysis.py, que define o pipeline"""
+    arquivos = [caminho for caminho, _, _ in run_shopping_analysis._impressao_codigo()]
+    assert 'run_shopping_analysis.py' in arquivos
+    assert os.path.join('shopping_analysis', 'analyzers', 'kpi_analyzer.py') in arquivos
+
+def teste_tendencias_lote_coincide_com_analisar():
+    """analisar_lote devolve, por série, as mesmas estatísticas que analisar calcula individualmente"""
+    series = [
+        [{'mes': 'Janeiro', 'ano': 2025, 'saldo_operacional': valor} for valor in (20000, 25000, 15000, 32000, -5000)],
+        [{'mes': 'Janeiro', 'ano': 2025, 'saldo_operacional': valor} for valor in (1000, 4000, 9000, 16000, 25000)],
+    ]
+    analyzer = TrendAnalyzer()
+    lote = analyzer.analisar_lote(series, 'fluxo_caixa')
+
+    for indice, serie in enumerate(series):
+        resultado = analyzer.analisar(serie, 'fluxo_caixa')
+        tendencia = resultado['tendencia_geral']
+        volatilidade = resultado['volatilidade']
+        assert abs(float(tendencia['inclinacao']) - lote['inclinacao'][indice]) < 0.01
+        assert abs(float(tendencia['intercepto']) - lote['intercepto'][indice]) < 0.01
+        assert abs(float(tendencia['r_squared']) - lote['r_squared'][indice]) < 0.001
+        assert abs(float(volatilidade['desvio_padrao']) - lote['desvio_padrao'][indice]) < 0.01
+        assert abs(float(volatilidade['volatilidade_media']) - lote['volatilidade_media'][indice]) < 0.001
+        assert abs(float(resultado['correlacoes_temporais']['correlacao_lag1']) - lote['correlacao_lag1'][indice]) < 0.003
+
+    assert lote['inclinacao'][0] < 0 < lote['inclinacao'][1]
+
+def teste_fluxo_caixa_lote_coincide_com_analisar():
+    """analisar_lote devolve, por cenário, os mesmos totais que analisar calcula individualmente"""
+    meses = ('Janeiro', 'Fevereiro', 'Março', 'Abril', 'Maio')
+    cenarios = [
+        [{'mes': mes, 'ano': 2025, 'credito': 100000, 'debito': 80000, 'saldo_operacional': saldo}
+         for mes, saldo in zip(meses, (20000, 25000, 15000, 32000, -5000))],
+        [{'mes': mes, 'ano': 2025, 'credito': 100000, 'debito': 80000, 'saldo_operacional': saldo}
+         for mes, saldo in zip(meses, (-1000, -4000, 9000, -16000, 2500.5))],
+    ]
+    analyzer = CashFlowAnalyzer()
+    lote = analyzer.analisar_lote(cenarios)
+
+    for indice, cenario in enumerate(cenarios):
+        resumo = analyzer.analisar(cenario)['resumo_mensal']
+        assert abs(float(resumo['media_saldo_mensal']) - lote['media'][indice]) < 0.01
+        assert abs(float(resumo['volatilidade']) - lote['desvio_padrao'][indice]) < 0.01
+        assert lote['meses_positivos'][indice] == resumo['meses_positivos']
+        assert lote['meses_negativos'][indice] == resumo['meses_negativos']
+        assert resumo['pior_mes']['periodo'] == f"{meses[lote['indice_pior_mes'][indice]]}/2025"
+        assert resumo['melhor_mes']['periodo'] == f"{meses[lote['indice_melhor_mes'][indice]]}/2025"
+
+def teste_janela_media_movel_altera_previsao():
+    """janela_media_movel define quantos períodos entram na previsão por média móvel"""
+    fluxo = [{'mes': 'Janeiro', 'ano': 2025, 'saldo_operacional': valor} for valor in (20000, 25000, 15000, 32000, -5000)]
+    padrao = TrendAnalyzer().analisar(fluxo, 'fluxo_caixa')['previsoes']
+    janela_5 = TrendAnalyzer(ConfiguracaoAnalise(janela_media_movel=5)).analisar(fluxo, 'fluxo_caixa')['previsoes']
+    janela_6 = TrendAnalyzer(ConfiguracaoAnalise(janela_media_movel=6)).analisar(fluxo, 'fluxo_caixa')['previsoes']
+
+    assert padrao['proximo_periodo_media_movel'] == Decimal('14000.00')
+    assert janela_5['proximo_periodo_media_movel'] == Decimal('17400.00')
+    assert janela_5['proximo_periodo_tendencia_linear'] == padrao['proximo_periodo_tendencia_linear']
+    assert janela_6 == {'previsoes_disponiveis': False}
+
+def teste_kpis_categoria_direciona_acoes():
+    """A categoria de cada KPI define recomendação e responsável sugerido"""
+    resultado = KPIAnalyzer().analisar({'receita_total': 1000000, 'saldo_operacional': 150000, 'despesa_total': 99999999})
+    categorias = {kpi.nome: kpi.categoria for kpi in resultado['kpis_analisados']}
+    responsaveis = {acao['kpi']: acao['responsavel_sugerido'] for acao in resultado['prioridades_acao']}
+
+    assert categorias == {
+        'Receita Total': KPICategoria.RECEITA,
+        'Saldo Operacional': KPICategoria.SALDO,
+        'Despesa Total': KPICategoria.DESPESA,
+    }
+    assert responsaveis == {
+        'Despesa Total': "Gerência Administrativa",
+        'Receita Total': "Gerência Comercial + Marketing",
+    }
+    assert resultado['recomendacoes'][0].startswith("📉 Receita Total: Revisar estratégia comercial")
+
+def teste_kpis_resumo_status():
+    """resumo_status conta cada status e coincide com a lista de KPIs críticos"""
+    dados = run_shopping_analysis.obter_dados_shopping_park_botucatu()
+    resultado = KPIAnalyzer().analisar(dados['kpis'])
+
+    assert resultado['resumo_status'] == {'critico': 2, 'atencao': 1, 'bom': 2, 'excelente': 1}
+    assert [kpi.nome for kpi in resultado['kpis_criticos']] == ['Taxa Inadimplencia', 'Recebidos Atraso']
+    assert resultado['sumario'].n_criticos == 2
+    assert sum(resultado['resumo_status'].values()) == resultado['total_kpis'] == 6
+
+def teste_cli_minimal(capsys):
+    """--minimal omite as tendências e as estatísticas finais, mantendo insights e relatório"""
+    dados = run_shopping_analysis.obter_dados_shopping_park_botucatu()
+    completo = run_shopping_analysis.executar_analise_completa(dados)
+    minimo = run_shopping_analysis.executar_analise_completa(dados, minimal=True)
+
+    assert 'analise_tendencias' in completo
+    assert 'analise_tendencias' not in minimo
+    assert [insight.titulo for insight in minimo['insights']] == [insight.titulo for insight in completo['insights']]
+
+    run_shopping_analysis.main(['--minimal', '--no-cache'])
+    saida = capsys.readouterr().out
+    assert "RELATÓRIO EXECUTIVO" in saida
+    assert "ESTATÍSTICAS DA ANÁLISE" not in saida
+    assert "SCORE FINAL" not in saida
+    assert "Análise concluída com sucesso" in saida
+
+    run_shopping_analysis.main(['--no-cache'])
+    assert "ESTATÍSTICAS DA ANÁLISE" in capsys.readouterr().out
+
+def teste_cli_decimal_estrito():
+    """--strict-decimal (Decimal) e o caminho padrão (float64) produzem os mesmos valores de inadimplência"""
+    assert run_shopping_analysis._PARSER.parse_args(['--strict-decimal']).strict_decimal
+    assert not run_shopping_analysis._PARSER.parse_args([]).strict_decimal
+
+    dados = run_shopping_analysis.obter_dados_shopping_park_botucatu()
+    padrao = run_shopping_analysis.executar_analise_completa(dados)['analise_inadimplencia']
+    estrito = run_shopping_analysis.executar_analise_completa(dados, decimal_estrito=True)['analise_inadimplencia']
+
+    assert estrito['metricas_gerais'] == padrao['metricas_gerais']
+    assert estrito['metricas_gerais']['valor_total_inadimplencia'] == Decimal('108079.58')
+    assert estrito['impacto_financeiro'] == padrao['impacto_financeiro']
+    assert [item['valor_divida'] for item in estrito['ranking_por_valor']] == \
+        [item['valor_divida'] for item in padrao['ranking_por_valor']]
+
+def teste_kpis_configuracao_alterada():
+    """Alterar thresholds e metas da configuração no lugar muda a análise seguinte"""
+    analyzer = KPIAnalyzer()
+    kpis = {'receita_total': 1000000}
+    assert analyzer.analisar(kpis)['kpis_analisados'][0].status.name == 'CRITICO'
+
+    analyzer.configuracao.thresholds_kpi['receita_total'] = {'critico': 10, 'atencao': 20, 'bom': 2000000}
+    kpi = analyzer.analisar(kpis)['kpis_analisados'][0]
+    assert kpi.status.name == 'BOM'
+    assert kpi.meta is None
+
+    analyzer.configuracao.thresholds_kpi['receita_total']['bom'] = 30
+    analyzer.configuracao.metas_mensais = {'receita_total': Decimal('2000000')}
+    kpi = analyzer.analisar(kpis)['kpis_analisados'][0]
+    assert kpi.status.name == 'EXCELENTE'
+    assert kpi.meta == Decimal('2000000')
+
+def teste_kpis_thresholds_padrao():
+    """thresholds_padrao expõe os limites padrão para leitura; personalização é feita pela configuração"""
+    analyzer = KPIAnalyzer()
+    assert analyzer.thresholds_padrao['receita_total'] == {'critico': 10000000, 'atencao': 15000000, 'bom': 20000000}
+    assert analyzer.thresholds_padrao['taxa_inadimplencia']['critico'] == 50
+
+    for alteracao in (
+        lambda: analyzer.thresholds_padrao.__setitem__('receita_total', {}),
+        lambda: analyzer.thresholds_padrao['receita_total'].__setitem__('bom', 0),
+        lambda: setattr(analyzer, 'thresholds_padrao', {}),
+    ):
+        try:
+            alteracao()
+            assert False, "thresholds_padrao deveria ser somente leitura"
+        except (TypeError, AttributeError):
+            pass
+
+def teste_inadimplencia_totais_exatos():
+    """Totais somam centavos inteiros: valores altos não perdem centavos como na soma em float"""
+    valores = ['45035996273704.97', '0.01', '0.01', '0.01']
+    inadimplentes = [{'nome': f'Loja {i}', 'valor_divida': valor, 'status': 'em_atraso'} for i, valor in enumerate(valores)]
+
+    for decimal_estrito in (False, True):
+        resultado = DelinquencyAnalyzer(decimal_estrito=decimal_estrito).analisar(inadimplentes)
+        assert resultado['metricas_gerais']['valor_total_inadimplencia'] == Decimal('45035996273705.00')
+        assert resultado['concentracao_dividas']['valor_top_3'] == Decimal('45035996273704.99')
+
+def teste_fluxo_caixa_metricas_precisao():
+    """Eficiência e margem mantêm a precisão da divisão Decimal dos totais (sem quantização)"""
+    fluxo = [
+        {'mes': 'Janeiro', 'ano': 2025, 'credito': 100000, 'debito': 30000, 'saldo_operacional': 70000},
+        {'mes': 'Fevereiro', 'ano': 2025, 'credito': 200000, 'debito': 60000, 'saldo_operacional': 140000}
+    ]
+    metricas = CashFlowAnalyzer().analisar(fluxo)['metricas_gerais']
+
+    assert metricas['eficiencia_operacional'] == Decimal('300000') / Decimal('90000') * 100
+    assert metricas['margem_operacional_media'] == Decimal('210000') / Decimal('300000') * 100
+    assert metricas['eficiencia_operacional'] != Decimal('333.33')
+
+
 def main():
     """Função principal do teste"""
     print("=" * 60)